@@ -7,7 +7,10 @@ from rest_framework import authentication, permissions, routers
 
 from environments.identities.traits.views import SDKTraits
 from environments.identities.views import SDKIdentities
-from environments.sdk.views import SDKEnvironmentAPIView
+from environments.sdk.views import (
+    SDKEnvironmentAPIView,
+    SDKEnvironmentDeltaAPIView,
+)
 from features.views import SDKFeatureStates
 from integrations.github.views import github_webhook
 from organisations.views import chargebee_webhook
@@ -60,6 +63,11 @@ urlpatterns = [
         SDKEnvironmentAPIView.as_view(),
         name="environment-document",
     ),
+    re_path(
+        r"^environment-document/delta/$",
+        SDKEnvironmentDeltaAPIView.as_view(),
+        name="environment-document-delta",
+    ),
     re_path("", include("features.versioning.urls", namespace="versioning")),
     # API documentation
     re_path(
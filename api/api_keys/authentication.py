@@ -1,5 +1,8 @@
 from contextlib import suppress
 
+from core.signing import sign_payload
+from django.conf import settings
+from django.core.cache import caches
 from rest_framework import authentication, exceptions
 from rest_framework_api_key.permissions import KeyParser
 
@@ -8,6 +11,8 @@ from api_keys.user import APIKeyUser
 
 key_parser = KeyParser()
 
+master_api_keys_cache = caches[settings.MASTER_API_KEYS_CACHE_LOCATION]
+
 
 class MasterAPIKeyAuthentication(authentication.BaseAuthentication):
     def authenticate(self, request):
@@ -15,9 +20,29 @@ class MasterAPIKeyAuthentication(authentication.BaseAuthentication):
         if not key:
             return None
 
-        with suppress(MasterAPIKey.DoesNotExist):
-            key = MasterAPIKey.objects.get_from_key(key)
-            if not key.has_expired:
-                return APIKeyUser(key), None
+        master_api_key = self._get_master_api_key(key)
+        if master_api_key and not master_api_key.has_expired:
+            return APIKeyUser(master_api_key), None
 
         raise exceptions.AuthenticationFailed("Valid Master API Key not found.")
+
+    def _get_master_api_key(self, key: str) -> MasterAPIKey | None:
+        # Verifying the key with the password hasher is slow, so we remember
+        # which key a (keyed) digest of the presented key was verified against.
+        # The key itself is always fetched from the usable keys so that any
+        # changes to it (e.g. revoking or deleting it) are seen immediately.
+        digest = sign_payload(key, settings.SECRET_KEY)
+
+        if (master_api_key_id := master_api_keys_cache.get(digest)) is not None:
+            with suppress(MasterAPIKey.DoesNotExist):
+                return MasterAPIKey.objects.get_usable_keys().get(id=master_api_key_id)
+            master_api_keys_cache.delete(digest)
+            return None
+
+        with suppress(MasterAPIKey.DoesNotExist):
+            master_api_key = MasterAPIKey.objects.get_from_key(key)
+            if settings.CACHE_MASTER_API_KEYS_SECONDS:
+                master_api_keys_cache.set(digest, master_api_key.id)
+            return master_api_key
+
+        return None
@@ -5,7 +5,7 @@ from collections import OrderedDict
 from drf_yasg import openapi
 from drf_yasg.inspectors import PaginatorInspector
 from flag_engine.identities.models import IdentityModel
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from rest_framework.response import Response
 
 
@@ -15,6 +15,18 @@ class CustomPagination(PageNumberPagination):
     max_page_size = 999
 
 
+class AuditLogCursorPagination(CursorPagination):
+    """
+    Cursor based pagination for the audit log which, unlike CustomPagination,
+    doesn't need to count all of the matching records.
+    """
+
+    ordering = "-created_date"
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 999
+
+
 class EdgeIdentityPaginationInspector(PaginatorInspector):
     def get_paginator_parameters(self, paginator):
         """
@@ -291,6 +291,36 @@ ADD_NEVER_CACHE_HEADERS = env.bool("ADD_NEVER_CACHE_HEADERS", True)
 if ADD_NEVER_CACHE_HEADERS:
     MIDDLEWARE.append("core.middleware.cache_control.NeverCacheMiddleware")
 
+# Lightweight, in-process profiling of the SDK endpoints. Metrics are exposed
+# (per process) in the Prometheus text format at /metrics, to requests with an
+# `Authorization: Bearer <REQUEST_PROFILING_METRICS_TOKEN>` header. The metrics
+# aren't exposed at all unless the token is set.
+ENABLE_REQUEST_PROFILING = env.bool("ENABLE_REQUEST_PROFILING", default=False)
+REQUEST_PROFILING_METRICS_TOKEN = env.str("REQUEST_PROFILING_METRICS_TOKEN", None)
+REQUEST_PROFILING_VIEWS = env.list(
+    "REQUEST_PROFILING_VIEWS",
+    default=[
+        "SDKIdentities",
+        "SDKIdentitiesDeprecated",
+        "SDKFeatureStates",
+        "SDKEnvironmentAPIView",
+        "SDKEnvironmentDeltaAPIView",
+        "SDKTraits",
+        "SDKTraitsDeprecated",
+        "SDKAnalyticsFlags",
+    ],
+)
+# Log the full profile of (a sample of) the requests which take longer than the
+# given threshold. Set the threshold to 0 to disable.
+REQUEST_PROFILING_SLOW_REQUEST_THRESHOLD_MS = env.int(
+    "REQUEST_PROFILING_SLOW_REQUEST_THRESHOLD_MS", default=0
+)
+REQUEST_PROFILING_SLOW_REQUEST_SAMPLE_RATE = env.float(
+    "REQUEST_PROFILING_SLOW_REQUEST_SAMPLE_RATE", default=0.01
+)
+if ENABLE_REQUEST_PROFILING:
+    MIDDLEWARE.append("core.middleware.request_profiling.RequestProfilingMiddleware")
+
 APPLICATION_INSIGHTS_CONNECTION_STRING = env.str(
     "APPLICATION_INSIGHTS_CONNECTION_STRING", default=None
 )
@@ -625,6 +655,15 @@ ENVIRONMENT_CACHE_NAME = "environment-objects"
 ENVIRONMENT_CACHE_LOCATION = env.str(
     "ENVIRONMENT_CACHE_LOCATION", default=ENVIRONMENT_CACHE_NAME
 )
+# Environments can also be cached in each process, in front of the (shared)
+# environment cache. Changes to an environment can take up to
+# ENVIRONMENT_LOCAL_CACHE_VERSION_CHECK_SECONDS to be seen by every process.
+ENVIRONMENT_LOCAL_CACHE_MAX_SIZE = env.int(
+    "ENVIRONMENT_LOCAL_CACHE_MAX_SIZE", default=0
+)
+ENVIRONMENT_LOCAL_CACHE_VERSION_CHECK_SECONDS = env.float(
+    "ENVIRONMENT_LOCAL_CACHE_VERSION_CHECK_SECONDS", default=1.0
+)
 
 GET_FLAGS_ENDPOINT_CACHE_SECONDS = env.int(
     "GET_FLAGS_ENDPOINT_CACHE_SECONDS", default=0
@@ -639,6 +678,10 @@ GET_FLAGS_ENDPOINT_CACHE_LOCATION = env.str(
     default=GET_FLAGS_ENDPOINT_CACHE_NAME,
 )
 
+# Note that the cached responses are only invalidated by changes to the environment
+# (see environments.cache.get_environment_version_cache_key) and not by changes to
+# the identity's traits, so these can be served for up to this many seconds after
+# the traits have been updated.
 GET_IDENTITIES_ENDPOINT_CACHE_SECONDS = env.int(
     "GET_IDENTITIES_ENDPOINT_CACHE_SECONDS", default=0
 )
@@ -652,6 +695,12 @@ GET_IDENTITIES_ENDPOINT_CACHE_LOCATION = env.str(
     default=GET_IDENTITIES_ENDPOINT_CACHE_NAME,
 )
 
+# Master API keys which have been verified recently, so that the (slow) password
+# hasher doesn't need to run on every request. The state of the key is still
+# read from the database on each request, so revoking it takes effect immediately.
+CACHE_MASTER_API_KEYS_SECONDS = env.int("CACHE_MASTER_API_KEYS_SECONDS", 30)
+MASTER_API_KEYS_CACHE_LOCATION = "master-api-keys"
+
 BAD_ENVIRONMENTS_CACHE_LOCATION = "bad-environments"
 CACHE_BAD_ENVIRONMENTS_SECONDS = env.int("CACHE_BAD_ENVIRONMENTS_SECONDS", 0)
 CACHE_BAD_ENVIRONMENTS_AFTER_FAILURES = env.int(
@@ -661,6 +710,12 @@ CACHE_BAD_ENVIRONMENTS_AFTER_FAILURES = env.int(
 CACHE_PROJECT_SEGMENTS_SECONDS = env.int("CACHE_PROJECT_SEGMENTS_SECONDS", 0)
 PROJECT_SEGMENTS_CACHE_LOCATION = "project-segments"
 
+# The engine models for the rules of each version of a segment are cached in each
+# process, up to (approximately) this many bytes. Set to 0 to disable.
+SEGMENT_RULES_CACHE_MAX_BYTES = env.int(
+    "SEGMENT_RULES_CACHE_MAX_BYTES", default=32 * 1024 * 1024
+)
+
 ENVIRONMENT_SEGMENTS_CACHE_NAME = "environment-segments"
 ENVIRONMENT_SEGMENTS_CACHE_SECONDS = env.int("CACHE_ENVIRONMENT_SEGMENTS_SECONDS", 0)
 ENVIRONMENT_SEGMENTS_CACHE_LOCATION = env(
@@ -671,9 +726,63 @@ ENVIRONMENT_SEGMENTS_CACHE_BACKEND = env(
     "django.core.cache.backends.locmem.LocMemCache",
 )
 
+# Pages of the (edge) identities list. While caching is enabled with a backend that is
+# shared between processes, the next page is also fetched in the background. With a
+# process local backend, it would only be cached by the process that served the current
+# page, which needn't be the one to serve the next.
+EDGE_IDENTITIES_LIST_CACHE_NAME = "edge-identities-list"
+EDGE_IDENTITIES_LIST_CACHE_SECONDS = env.int("CACHE_EDGE_IDENTITIES_LIST_SECONDS", 0)
+EDGE_IDENTITIES_LIST_CACHE_LOCATION = env(
+    "EDGE_IDENTITIES_LIST_CACHE_LOCATION", "edge-identities-list"
+)
+EDGE_IDENTITIES_LIST_CACHE_BACKEND = env(
+    "CACHE_EDGE_IDENTITIES_LIST_BACKEND",
+    "django.core.cache.backends.locmem.LocMemCache",
+)
+EDGE_IDENTITIES_LIST_PREFETCH_NEXT_PAGE = EDGE_IDENTITIES_LIST_CACHE_BACKEND not in (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
 CACHE_ENVIRONMENT_DOCUMENT_SECONDS = env.int("CACHE_ENVIRONMENT_DOCUMENT_SECONDS", 0)
 ENVIRONMENT_DOCUMENT_CACHE_LOCATION = "environment-documents"
 
+# A bounded history of the versions of each environment document, used as the base
+# for the deltas served by the environment-document/delta endpoint. Set to 0 to
+# disable (in which case the delta endpoint always returns the full document).
+ENVIRONMENT_DOCUMENT_HISTORY_SECONDS = env.int(
+    "ENVIRONMENT_DOCUMENT_HISTORY_SECONDS", 0
+)
+ENVIRONMENT_DOCUMENT_HISTORY_MAX_ENTRIES = env.int(
+    "ENVIRONMENT_DOCUMENT_HISTORY_MAX_ENTRIES", 1000
+)
+ENVIRONMENT_DOCUMENT_HISTORY_CACHE_LOCATION = "environment-document-history"
+
+# Flag engine models are cached against the environment's `updated_at` value, so
+# this timeout only bounds how long a scheduled change can take to be reflected.
+CACHE_ENVIRONMENT_ENGINE_MODEL_SECONDS = env.int(
+    "CACHE_ENVIRONMENT_ENGINE_MODEL_SECONDS", 60
+)
+ENVIRONMENT_ENGINE_MODEL_CACHE_LOCATION = "environment-engine-models"
+
+# Usage data from InfluxDB is cached per organisation / environment / feature and
+# range. Once an entry is older than CACHE_USAGE_DATA_SECONDS, only the most recent
+# window(s) are re-queried. Entries are discarded (and hence fully re-queried) daily.
+CACHE_USAGE_DATA_SECONDS = env.int("CACHE_USAGE_DATA_SECONDS", 0)
+USAGE_DATA_CACHE_NAME = "usage-data"
+USAGE_DATA_CACHE_BACKEND = env.str(
+    "USAGE_DATA_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+)
+USAGE_DATA_CACHE_LOCATION = env.str("USAGE_DATA_CACHE_LOCATION", USAGE_DATA_CACHE_NAME)
+
+# Used for the GitHub integration's installation tokens and recent comments. Use
+# a shared backend (e.g. redis) so that comments are coalesced across processes.
+GITHUB_CACHE_NAME = "github"
+GITHUB_CACHE_BACKEND = env.str(
+    "GITHUB_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+)
+GITHUB_CACHE_LOCATION = env.str("GITHUB_CACHE_LOCATION", GITHUB_CACHE_NAME)
+
 USER_THROTTLE_CACHE_NAME = "user-throttle"
 USER_THROTTLE_CACHE_BACKEND = env.str(
     "USER_THROTTLE_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
@@ -717,6 +826,12 @@ CACHES = {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "LOCATION": PROJECT_SEGMENTS_CACHE_LOCATION,
     },
+    MASTER_API_KEYS_CACHE_LOCATION: {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": MASTER_API_KEYS_CACHE_LOCATION,
+        "TIMEOUT": CACHE_MASTER_API_KEYS_SECONDS,
+        "OPTIONS": {"MAX_ENTRIES": 1000},
+    },
     BAD_ENVIRONMENTS_CACHE_LOCATION: {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "LOCATION": BAD_ENVIRONMENTS_CACHE_LOCATION,
@@ -732,6 +847,18 @@ CACHES = {
         "LOCATION": ENVIRONMENT_DOCUMENT_CACHE_LOCATION,
         "timeout": CACHE_ENVIRONMENT_DOCUMENT_SECONDS,
     },
+    ENVIRONMENT_DOCUMENT_HISTORY_CACHE_LOCATION: {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": ENVIRONMENT_DOCUMENT_HISTORY_CACHE_LOCATION,
+        "TIMEOUT": ENVIRONMENT_DOCUMENT_HISTORY_SECONDS,
+        "OPTIONS": {"MAX_ENTRIES": ENVIRONMENT_DOCUMENT_HISTORY_MAX_ENTRIES},
+    },
+    ENVIRONMENT_ENGINE_MODEL_CACHE_LOCATION: {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": ENVIRONMENT_ENGINE_MODEL_CACHE_LOCATION,
+        "TIMEOUT": CACHE_ENVIRONMENT_ENGINE_MODEL_SECONDS,
+        "OPTIONS": {"MAX_ENTRIES": 50},
+    },
     GET_FLAGS_ENDPOINT_CACHE_NAME: {
         "BACKEND": GET_FLAGS_ENDPOINT_CACHE_BACKEND,
         "LOCATION": GET_FLAGS_ENDPOINT_CACHE_LOCATION,
@@ -745,6 +872,20 @@ CACHES = {
         "LOCATION": ENVIRONMENT_SEGMENTS_CACHE_LOCATION,
         "TIMEOUT": ENVIRONMENT_SEGMENTS_CACHE_SECONDS,
     },
+    EDGE_IDENTITIES_LIST_CACHE_NAME: {
+        "BACKEND": EDGE_IDENTITIES_LIST_CACHE_BACKEND,
+        "LOCATION": EDGE_IDENTITIES_LIST_CACHE_LOCATION,
+        "TIMEOUT": EDGE_IDENTITIES_LIST_CACHE_SECONDS,
+    },
+    USAGE_DATA_CACHE_NAME: {
+        "BACKEND": USAGE_DATA_CACHE_BACKEND,
+        "LOCATION": USAGE_DATA_CACHE_LOCATION,
+        "TIMEOUT": 24 * 60 * 60,  # 24 hours
+    },
+    GITHUB_CACHE_NAME: {
+        "BACKEND": GITHUB_CACHE_BACKEND,
+        "LOCATION": GITHUB_CACHE_LOCATION,
+    },
     USER_THROTTLE_CACHE_NAME: {
         "BACKEND": USER_THROTTLE_CACHE_BACKEND,
         "LOCATION": USER_THROTTLE_CACHE_LOCATION,
@@ -857,6 +998,13 @@ ENVIRONMENTS_V2_TABLE_NAME_DYNAMO = env.str("ENVIRONMENTS_V2_TABLE_NAME_DYNAMO",
 
 # DynamoDB table name for storing identities
 IDENTITIES_TABLE_NAME_DYNAMO = env.str("IDENTITIES_TABLE_NAME_DYNAMO", None)
+# Name of a global secondary index of the identities table, partitioned on
+# environment_api_key and sorted on identifier_lowercase. If set, searching for
+# identities by (the start of) their identifier is case insensitive. Identities
+# written before identifier_lowercase was added must be backfilled first.
+IDENTITIES_TABLE_LOWERCASE_IDENTIFIER_INDEX_NAME_DYNAMO = env.str(
+    "IDENTITIES_TABLE_LOWERCASE_IDENTIFIER_INDEX_NAME_DYNAMO", None
+)
 
 # DynamoDB table name for storing environment api keys
 ENVIRONMENTS_API_KEY_TABLE_NAME_DYNAMO = env.str(
@@ -889,6 +1037,14 @@ ENABLE_FLAGSMITH_REALTIME = env.bool("ENABLE_FLAGSMITH_REALTIME", default=False)
 USE_SECURE_COOKIES = env.bool("USE_SECURE_COOKIES", default=True)
 COOKIE_SAME_SITE = env.str("COOKIE_SAME_SITE", default="none")
 
+# Audit log records older than this many days are deleted (in batches of
+# AUDIT_LOG_RETENTION_DELETE_BATCH_SIZE) by a recurring task. They are kept
+# forever by default.
+AUDIT_LOG_RETENTION_DAYS = env.int("AUDIT_LOG_RETENTION_DAYS", default=0)
+AUDIT_LOG_RETENTION_DELETE_BATCH_SIZE = env.int(
+    "AUDIT_LOG_RETENTION_DELETE_BATCH_SIZE", default=10_000
+)
+
 # Set this to enable create organisation for only superusers
 RESTRICT_ORG_CREATE_TO_SUPERUSERS = env.bool("RESTRICT_ORG_CREATE_TO_SUPERUSERS", False)
 # Slack Integration
@@ -898,6 +1054,14 @@ SLACK_CLIENT_SECRET = env.str("SLACK_CLIENT_SECRET", default="")
 GITHUB_PEM = env.str("GITHUB_PEM", default="")
 GITHUB_APP_ID: int = env.int("GITHUB_APP_ID", default=0)
 GITHUB_WEBHOOK_SECRET = env.str("GITHUB_WEBHOOK_SECRET", default="")
+# Installation access tokens are valid for an hour, so are reused until shortly
+# before they expire.
+GITHUB_INSTALLATION_TOKEN_CACHE_SECONDS = env.int(
+    "GITHUB_INSTALLATION_TOKEN_CACHE_SECONDS", default=55 * 60
+)
+# If set, a flag update made within this many seconds of the last one edits the
+# comment left on each linked issue / PR for it, rather than adding another.
+GITHUB_COMMENT_COALESCE_SECONDS = env.int("GITHUB_COMMENT_COALESCE_SECONDS", default=0)
 
 # MailerLite
 MAILERLITE_BASE_URL = env.str(
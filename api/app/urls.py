@@ -46,6 +46,9 @@ if settings.DEBUG:
         re_path(r"^__debug__/", include(debug_toolbar.urls)),
     ] + urlpatterns
 
+if settings.ENABLE_REQUEST_PROFILING and settings.REQUEST_PROFILING_METRICS_TOKEN:
+    urlpatterns.append(path("metrics", views.request_metrics, name="metrics"))
+
 if settings.SAML_INSTALLED:
     urlpatterns.append(path("api/v1/auth/saml/", include("saml.urls")))
 
@@ -1,8 +1,10 @@
+import hmac
 import json
 import logging
 
+from core.request_profiling import render_metrics
 from django.conf import settings
-from django.http import HttpResponse, JsonResponse
+from django.http import HttpResponse, HttpResponseForbidden, JsonResponse
 from django.template import loader
 from django.views.decorators.csrf import csrf_exempt
 from rest_framework.request import Request
@@ -16,6 +18,19 @@ def version_info(request: Request) -> JsonResponse:
     return JsonResponse(utils.get_version_info())
 
 
+def request_metrics(request: Request) -> HttpResponse:
+    token = settings.REQUEST_PROFILING_METRICS_TOKEN
+    authorization = request.META.get("HTTP_AUTHORIZATION", "")
+    if not token or not hmac.compare_digest(
+        authorization.encode(), f"Bearer {token}".encode()
+    ):
+        return HttpResponseForbidden()
+
+    return HttpResponse(
+        render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 @csrf_exempt
 def index(request):
     if request.method != "GET":
@@ -1,8 +1,14 @@
+import bisect
 import logging
+import re
 import typing
 from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 
 from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
 from influxdb_client import InfluxDBClient, Point
 from influxdb_client.client.exceptions import InfluxDBError
 from influxdb_client.client.write_api import SYNCHRONOUS
@@ -25,12 +31,17 @@ range_bucket_mappings = {
     "-7d": settings.INFLUXDB_BUCKET + "_downsampled_15m",
     "-30d": settings.INFLUXDB_BUCKET + "_downsampled_1h",
 }
+usage_data_cache = caches[settings.USAGE_DATA_CACHE_NAME]
+
 retries = Retry(connect=3, read=3, redirect=3)
 # Set a timeout to prevent threads being potentially stuck open due to network weirdness
 influxdb_client = InfluxDBClient(
     url=url, token=token, org=influx_org, retries=retries, timeout=3000
 )
 
+# The maximum number of organisations to query api usage for at once.
+API_USAGE_QUERY_BATCH_SIZE = 500
+
 DEFAULT_DROP_COLUMNS = (
     "organisation",
     "organisation_id",
@@ -107,6 +118,128 @@ class InfluxDBWrapper:
             return []
 
 
+@dataclass
+class InfluxDBSeries:
+    """
+    Columnar representation of the results of a windowed (i.e. `aggregateWindow`)
+    query: the stop time of each window, and the value in each window for each
+    value of the tag that the results are grouped by.
+    """
+
+    times: list[datetime]
+    values: dict[str, list[typing.Any]]
+    refreshed_at: datetime
+
+    @classmethod
+    def from_tables(
+        cls, tables: typing.Iterable, tag: str, refreshed_at: datetime
+    ) -> "InfluxDBSeries":
+        times = []
+        values = {}
+        for table in tables:
+            records = table.records
+            if not records:
+                continue
+            if not times:
+                times = [record.values["_time"] for record in records]
+            values[records[0].values[tag]] = [
+                record.values["_value"] for record in records
+            ][: len(times)]
+        return cls(times=times, values=values, refreshed_at=refreshed_at)
+
+    def merge(
+        self, latest: "InfluxDBSeries", since: datetime, range_start: datetime
+    ) -> "InfluxDBSeries":
+        """
+        Replace the windows that stop after `since` with those in `latest`, and
+        drop the windows that stop before the (moving) start of the range.
+        """
+        start = bisect.bisect_right(self.times, range_start)
+        stop = max(start, bisect.bisect_right(self.times, since))
+        kept, added = stop - start, len(latest.times)
+
+        values = {}
+        for tag in self.values.keys() | latest.values.keys():
+            kept_values = self.values.get(tag, [None] * stop)[start:stop]
+            added_values = latest.values.get(tag, [None] * added)
+            values[tag] = [*kept_values, *[None] * (kept - len(kept_values))]
+            values[tag].extend([*added_values, *[None] * (added - len(added_values))])
+
+        return InfluxDBSeries(
+            times=[*self.times[start:stop], *latest.times],
+            values=values,
+            refreshed_at=latest.refreshed_at,
+        )
+
+    def to_rows(
+        self, time_key: str, tag_key: typing.Callable[[str], str] = str
+    ) -> list[dict]:
+        rows = [{time_key: time.strftime("%Y-%m-%d")} for time in self.times]
+        for tag, column in self.values.items():
+            key = tag_key(tag)
+            for row, value in zip(rows, column):
+                row[key] = value
+        return rows
+
+
+def _parse_duration(duration: str) -> timedelta:
+    """
+    Convert a (simple) flux duration literal, e.g. -30d or 24h, to a timedelta.
+    """
+    if not (match := re.fullmatch(r"(-?)(\d+)([dhm])", duration)):
+        raise ValueError(f"Unsupported duration: {duration}")
+    sign, amount, unit = match.groups()
+    unit = {"d": "days", "h": "hours", "m": "minutes"}[unit]
+    delta = timedelta(**{unit: int(amount)})
+    return -delta if sign else delta
+
+
+def _get_series(
+    cache_key: str,
+    run_query: typing.Callable[[str], typing.Iterable],
+    tag: str,
+    date_start: str,
+    aggregate_every: str = "24h",
+) -> InfluxDBSeries:
+    """
+    Get the series for a windowed query, ending now, from the usage data cache.
+
+    Since the windows are aligned to the epoch, all windows before the one that
+    was open when a cached series was last refreshed are complete. Hence, to
+    refresh a stale series, `run_query` (which is passed the start of the range
+    to query) only needs to re-query from the start of that window onwards.
+    """
+    now = timezone.now()
+    if not settings.CACHE_USAGE_DATA_SECONDS:
+        return InfluxDBSeries.from_tables(run_query(date_start), tag, now)
+
+    try:
+        range_start = now + _parse_duration(date_start)
+        window_seconds = _parse_duration(aggregate_every).total_seconds()
+    except ValueError:
+        return InfluxDBSeries.from_tables(run_query(date_start), tag, now)
+
+    series = usage_data_cache.get(cache_key)
+    if series is None:
+        series = InfluxDBSeries.from_tables(run_query(date_start), tag, now)
+    elif now - series.refreshed_at >= timedelta(
+        seconds=settings.CACHE_USAGE_DATA_SECONDS
+    ):
+        refreshed_at = series.refreshed_at.timestamp()
+        since = datetime.fromtimestamp(
+            refreshed_at - refreshed_at % window_seconds, tz=timezone.utc
+        )
+        latest = InfluxDBSeries.from_tables(
+            run_query(since.strftime("%Y-%m-%dT%H:%M:%SZ")), tag, now
+        )
+        series = series.merge(latest, since=since, range_start=range_start)
+    else:
+        return series
+
+    usage_data_cache.set(cache_key, series)
+    return series
+
+
 def get_events_for_organisation(
     organisation_id: id, date_start: str = "-30d", date_stop: str = "now()"
 ) -> int:
@@ -204,23 +337,27 @@ def get_multiple_event_list_for_organisation(
     if environment_id:
         filters.append(f'r["environment_id"] == "{environment_id}"')
 
-    results = InfluxDBWrapper.influx_query_manager(
-        date_start=date_start,
-        date_stop=date_stop,
-        filters=build_filter_string(filters),
-        extra="|> aggregateWindow(every: 24h, fn: sum)",
-    )
-    if not results:
-        return results
-
-    dataset = [{} for _ in range(len(results[0].records))]
+    def run_query(date_start: str) -> typing.Iterable:
+        return InfluxDBWrapper.influx_query_manager(
+            date_start=date_start,
+            date_stop=date_stop,
+            filters=build_filter_string(filters),
+            extra="|> aggregateWindow(every: 24h, fn: sum)",
+        )
 
-    for result in results:
-        for i, record in enumerate(result.records):
-            dataset[i][record.values["resource"].capitalize()] = record.values["_value"]
-            dataset[i]["name"] = record.values["_time"].strftime("%Y-%m-%d")
+    if date_stop == "now()":
+        series = _get_series(
+            cache_key=f"events:{organisation_id}:{project_id}:{environment_id}:{date_start}",
+            run_query=run_query,
+            tag="resource",
+            date_start=date_start,
+        )
+    else:
+        series = InfluxDBSeries.from_tables(
+            run_query(date_start), "resource", timezone.now()
+        )
 
-    return dataset
+    return series.to_rows(time_key="name", tag_key=str.capitalize)
 
 
 def get_usage_data(
@@ -270,28 +407,26 @@ def get_multiple_event_list_for_feature(
     :return: a list of dicts with feature and request count in a specific environment
     """
 
-    results = InfluxDBWrapper.influx_query_manager(
-        date_start=date_start,
-        filters=f'|> filter(fn:(r) => r._measurement == "feature_evaluation") \
+    filters = f'|> filter(fn:(r) => r._measurement == "feature_evaluation") \
                   |> filter(fn: (r) => r["_field"] == "request_count") \
                   |> filter(fn: (r) => r["environment_id"] == "{environment_id}") \
-                  |> filter(fn: (r) => r["feature_id"] == "{feature_name}")',
-        extra=f'|> aggregateWindow(every: {aggregate_every}, fn: sum, createEmpty: false) \
-                   |> yield(name: "sum")',
-    )
-    if not results:
-        return []
-
-    dataset = [{} for _ in range(len(results[0].records))]
+                  |> filter(fn: (r) => r["feature_id"] == "{feature_name}")'
+    extra = f'|> aggregateWindow(every: {aggregate_every}, fn: sum, createEmpty: false) \
+                   |> yield(name: "sum")'
 
-    # Iterating over Influx data looking for feature_id, and adding proper requests value and datetime to it
-    # todo move it to marshmallow schema
-    for result in results:
-        for i, record in enumerate(result.records):
-            dataset[i][record.values["feature_id"]] = record.values["_value"]
-            dataset[i]["datetime"] = record.values["_time"].strftime("%Y-%m-%d")
+    def run_query(date_start: str) -> typing.Iterable:
+        return InfluxDBWrapper.influx_query_manager(
+            date_start=date_start, filters=filters, extra=extra
+        )
 
-    return dataset
+    series = _get_series(
+        cache_key=f"feature_evaluations:{environment_id}:{feature_name}:{date_start}:{aggregate_every}",
+        run_query=run_query,
+        tag="feature_id",
+        date_start=date_start,
+        aggregate_every=aggregate_every,
+    )
+    return series.to_rows(time_key="datetime")
 
 
 def get_feature_evaluation_data(
@@ -347,41 +482,48 @@ def get_top_organisations(date_start: str, limit: str = ""):
     return dataset
 
 
-def get_current_api_usage(organisation_id: int, date_start: str) -> int:
+def get_current_api_usages(
+    organisation_ids: typing.Iterable[int], date_start: str
+) -> dict[int, int]:
     """
-    Query influx db for api usage
+    Query influx db for the api usage of multiple organisations at once
 
-    :param organisation_id: filtered organisation
-    :param date_range: data range for current api usage window
+    :param organisation_ids: the organisations to get api usage for
+    :param date_start: data range for current api usage window
 
-    :return: number of current api calls
+    :return: number of current api calls, keyed by organisation id
     """
+    organisation_ids = list(organisation_ids)
+    api_usages = dict.fromkeys(organisation_ids, 0)
+
+    # Limit the size of the set that each query filters on.
+    for start in range(0, len(organisation_ids), API_USAGE_QUERY_BATCH_SIZE):
+        end = start + API_USAGE_QUERY_BATCH_SIZE
+        organisation_id_set = str(
+            [str(organisation_id) for organisation_id in organisation_ids[start:end]]
+        ).replace("'", '"')
+
+        results = InfluxDBWrapper.influx_query_manager(
+            date_start=date_start,
+            bucket=read_bucket,
+            filters=build_filter_string(
+                [
+                    'r._measurement == "api_call"',
+                    'r["_field"] == "request_count"',
+                    f'contains(value: r["organisation_id"], set: {organisation_id_set})',
+                ]
+            ),
+            drop_columns=("_start", "_stop", "_time"),
+            extra='|> group(columns: ["organisation_id"]) \
+                   |> sum()',
+        )
 
-    bucket = read_bucket
-    results = InfluxDBWrapper.influx_query_manager(
-        date_start=date_start,
-        bucket=bucket,
-        filters=build_filter_string(
-            [
-                'r._measurement == "api_call"',
-                'r["_field"] == "request_count"',
-                f'r["organisation_id"] == "{organisation_id}"',
-            ]
-        ),
-        drop_columns=("_start", "_stop", "_time"),
-        extra='|> sum() \
-               |> group() \
-               |> sort(columns: ["_value"], desc: true) ',
-    )
-
-    for result in results:
-        # Return zero if there are no API calls recorded.
-        if len(result.records) == 0:
-            return 0
-
-        return sum(r.get_value() for r in result.records)
+        for result in results:
+            for record in result.records:
+                organisation_id = int(record.values["organisation_id"])
+                api_usages[organisation_id] += record.get_value()
 
-    return 0
+    return api_usages
 
 
 def build_filter_string(filter_expressions: typing.List[str]) -> str:
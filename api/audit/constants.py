@@ -9,6 +9,10 @@ FEATURE_SEGMENT_UPDATED_MESSAGE = (
 )
 ENVIRONMENT_CREATED_MESSAGE = "New Environment created: %s"
 ENVIRONMENT_UPDATED_MESSAGE = "Environment updated: %s"
+FEATURES_IMPORTED_MESSAGE = "Flags / Remote Configs imported into environment: %s"
+LAUNCH_DARKLY_IMPORTED_MESSAGE = (
+    "Flags / Segments imported from LaunchDarkly into environment: %s"
+)
 FEATURE_STATE_SCHEDULED_MESSAGE = (
     "Flag state / Remote Config value update scheduled for %s for feature: %s"
 )
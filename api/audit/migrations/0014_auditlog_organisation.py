@@ -0,0 +1,44 @@
+# Generated by Django 3.2.25 on 2026-10-19 09:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def set_organisation(apps, schema_editor):
+    AuditLog = apps.get_model("audit", "AuditLog")
+    Project = apps.get_model("projects", "Project")
+
+    # Update the audit logs of each project (including those which have been
+    # deleted) separately, to avoid a single long running update of the table.
+    projects = Project.objects.values_list("id", "organisation_id")
+    for project_id, organisation_id in projects.iterator():
+        AuditLog.objects.filter(
+            project_id=project_id, organisation_id__isnull=True
+        ).update(organisation_id=organisation_id)
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("organisations", "0055_alter_percent_usage"),
+        ("projects", "0016_soft_delete_projects"),
+        ("audit", "0013_allow_manual_override_of_created_date"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="auditlog",
+            name="organisation",
+            field=models.ForeignKey(
+                db_constraint=False,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="audit_logs",
+                to="organisations.organisation",
+            ),
+        ),
+        migrations.RunPython(set_organisation, reverse_code=migrations.RunPython.noop),
+    ]
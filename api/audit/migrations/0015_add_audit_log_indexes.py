@@ -0,0 +1,68 @@
+# Generated by Django 3.2.25 on 2026-10-19 09:30
+
+from core.migration_helpers import PostgresOnlyRunSQL
+from django.db import migrations
+
+# The audit log is listed by organisation or project, most recent first, and
+# searched with `log__icontains`, which a trigram index can serve. Records older
+# than the retention period are deleted by created_date. The indexes are created
+# concurrently (and hence only on Postgres) since the table is large and written
+# to by most API requests.
+
+_create_created_date_index_sql = (
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS "audit_log_created_idx" '
+    'ON "audit_auditlog" ("created_date");'
+)
+_drop_created_date_index_sql = (
+    'DROP INDEX CONCURRENTLY IF EXISTS "audit_log_created_idx";'
+)
+
+_create_organisation_index_sql = (
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS "audit_log_organisation_created_idx" '
+    'ON "audit_auditlog" ("organisation_id", "created_date" DESC);'
+)
+_drop_organisation_index_sql = (
+    'DROP INDEX CONCURRENTLY IF EXISTS "audit_log_organisation_created_idx";'
+)
+_create_project_index_sql = (
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS "audit_log_project_created_idx" '
+    'ON "audit_auditlog" ("project_id", "created_date" DESC);'
+)
+_drop_project_index_sql = (
+    'DROP INDEX CONCURRENTLY IF EXISTS "audit_log_project_created_idx";'
+)
+_create_trigram_extension_sql = "CREATE EXTENSION IF NOT EXISTS pg_trgm;"
+_create_log_trigram_index_sql = (
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS "audit_log_log_trgm_idx" '
+    'ON "audit_auditlog" USING gin ("log" gin_trgm_ops);'
+)
+_drop_log_trigram_index_sql = (
+    'DROP INDEX CONCURRENTLY IF EXISTS "audit_log_log_trgm_idx";'
+)
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("audit", "0014_auditlog_organisation"),
+    ]
+
+    operations = [
+        PostgresOnlyRunSQL(
+            _create_created_date_index_sql, reverse_sql=_drop_created_date_index_sql
+        ),
+        PostgresOnlyRunSQL(
+            _create_organisation_index_sql, reverse_sql=_drop_organisation_index_sql
+        ),
+        PostgresOnlyRunSQL(
+            _create_project_index_sql, reverse_sql=_drop_project_index_sql
+        ),
+        PostgresOnlyRunSQL(
+            _create_trigram_extension_sql, reverse_sql=migrations.RunSQL.noop
+        ),
+        PostgresOnlyRunSQL(
+            _create_log_trigram_index_sql, reverse_sql=_drop_log_trigram_index_sql
+        ),
+    ]
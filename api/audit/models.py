@@ -23,6 +23,17 @@ RELATED_OBJECT_TYPES = ((tag.name, tag.value) for tag in RelatedObjectType)
 class AuditLog(LifecycleModel):
     created_date = models.DateTimeField("DateCreated")
 
+    # Denormalised from the project so that audit logs can be filtered by
+    # organisation without joining through the project. It is indexed (along
+    # with created_date) in migration 0015.
+    organisation = models.ForeignKey(
+        "organisations.Organisation",
+        related_name="audit_logs",
+        null=True,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+    )
     project = models.ForeignKey(
         Project, related_name="audit_logs", null=True, on_delete=models.DO_NOTHING
     )
@@ -110,11 +121,16 @@ class AuditLog(LifecycleModel):
         module = import_module(module_path)
         return getattr(module, class_name)
 
-    @hook(BEFORE_CREATE)
+    @hook(BEFORE_CREATE, priority=priority.HIGHER_PRIORITY)
     def add_project(self):
         if self.environment and self.project is None:
             self.project = self.environment.project
 
+    @hook(BEFORE_CREATE)
+    def add_organisation(self) -> None:
+        if self.project and self.organisation_id is None:
+            self.organisation_id = self.project.organisation_id
+
     @hook(BEFORE_CREATE)
     def add_created_date(self) -> None:
         if not self.created_date:
@@ -144,4 +160,7 @@ class AuditLog(LifecycleModel):
                 updated_at=self.created_date
             )
 
+        # The cached environments need to reflect the new `updated_at` value.
+        Environment.clear_environment_caches(environment_ids)
+
         process_environment_update.delay(args=(self.id,))
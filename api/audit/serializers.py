@@ -93,3 +93,9 @@ class AuditLogsQueryParamSerializer(serializers.Serializer):
         required=False, allow_null=True, default=None
     )
     search = serializers.CharField(max_length=256, required=False)
+    cursor = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        help_text="Use cursor pagination, rather than page numbers. Pass an empty "
+        "value to get the first page, and then follow the `next` link.",
+    )
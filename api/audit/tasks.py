@@ -1,10 +1,19 @@
 import logging
 import typing
-from datetime import datetime
+from collections import defaultdict
+from datetime import datetime, timedelta
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import router
+from django.db.models import Model, Q
+from django.db.models.signals import post_save
 from django.utils import timezone
-from task_processor.decorators import register_task_handler
+from simple_history.models import HistoricalRecords
+from task_processor.decorators import (
+    register_recurring_task,
+    register_task_handler,
+)
 from task_processor.models import TaskPriority
 
 from audit.constants import (
@@ -70,24 +79,152 @@ def create_audit_log_from_historical_record(
     model_class = AuditLog.get_history_record_model_class(history_record_class_path)
     history_instance = model_class.objects.get(history_id=history_instance_id)
 
+    user_model = get_user_model()
+    history_user = user_model.objects.filter(id=history_user_id).first()
+
+    audit_log_kwargs = _get_audit_log_kwargs(
+        history_instance, history_user, history_record_class_path
+    )
+    if audit_log_kwargs:
+        AuditLog.objects.create(**audit_log_kwargs)
+
+
+@register_task_handler(priority=TaskPriority.HIGHEST)
+def create_audit_logs_from_historical_records(
+    historical_records: typing.List[typing.Dict[str, typing.Any]],
+) -> None:
+    """
+    Create the audit logs for a batch of historical records (i.e. those created
+    in a single transaction, see `core.signals`) with a single insert, and then
+    trigger the side effects of creating them once for the whole batch.
+
+    Each historical record is given as the kwargs that would have been passed
+    to `create_audit_log_from_historical_record`.
+    """
+    user_model = get_user_model()
+    users = user_model.objects.in_bulk(
+        {
+            record["history_user_id"]
+            for record in historical_records
+            if record["history_user_id"]
+        }
+    )
+
+    history_instances = {}
+    history_ids_by_class_path = defaultdict(set)
+    for record in historical_records:
+        history_ids_by_class_path[record["history_record_class_path"]].add(
+            record["history_instance_id"]
+        )
+    for history_record_class_path, history_ids in history_ids_by_class_path.items():
+        model_class = AuditLog.get_history_record_model_class(history_record_class_path)
+        for history_instance in model_class.objects.filter(history_id__in=history_ids):
+            history_instances[
+                history_record_class_path, history_instance.history_id
+            ] = history_instance
+
+    audit_logs = []
+    for record in historical_records:
+        history_record_class_path = record["history_record_class_path"]
+        # The historical record won't exist if it was created in a savepoint
+        # which was subsequently rolled back.
+        history_instance = history_instances.get(
+            (history_record_class_path, record["history_instance_id"])
+        )
+        if history_instance is None:
+            continue
+
+        audit_log_kwargs = _get_audit_log_kwargs(
+            history_instance,
+            users.get(record["history_user_id"]),
+            history_record_class_path,
+        )
+        if audit_log_kwargs:
+            audit_logs.append(AuditLog(**audit_log_kwargs))
+
+    if audit_logs:
+        _bulk_create_audit_logs(audit_logs)
+
+
+def create_audit_logs_for_bulk_created_objects(
+    objs: typing.Sequence[Model],
+    model_class: typing.Type[Model],
+) -> None:
+    """
+    Create the audit logs for objects which were created with simple history's
+    `bulk_create_with_history`. Unlike `save`, that doesn't send the signals
+    which usually trigger them (see `core.signals`), so the audit logs are
+    created here from the historical records it wrote instead.
+
+    The given (in memory) objects are used to build the audit logs, rather than
+    instances rebuilt from the historical records, so that the related objects
+    they already hold (e.g. environment, feature) aren't read again for each one.
+    """
+    if not objs:
+        return
+
+    history_record_class_path = model_class.history_record_class_path
+    history_model_class = AuditLog.get_history_record_model_class(
+        history_record_class_path
+    )
+    history_instances = list(
+        history_model_class.objects.filter(
+            id__in=[obj.pk for obj in objs], history_type="+"
+        ).select_related("history_user")
+    )
+
+    # The equivalent of `core.signals.add_master_api_key`.
+    master_api_key = _get_request_master_api_key()
+    if master_api_key:
+        history_model_class.objects.filter(
+            history_id__in=[h.history_id for h in history_instances]
+        ).update(master_api_key=master_api_key)
+        for history_instance in history_instances:
+            history_instance.master_api_key = master_api_key
+
+    objs_by_pk = {obj.pk: obj for obj in objs}
+    audit_logs = []
+    for history_instance in history_instances:
+        audit_log_kwargs = _get_audit_log_kwargs(
+            history_instance,
+            history_instance.history_user,
+            history_record_class_path,
+            instance=objs_by_pk[history_instance.id],
+        )
+        if audit_log_kwargs:
+            audit_logs.append(AuditLog(**audit_log_kwargs))
+
+    if audit_logs:
+        _bulk_create_audit_logs(audit_logs)
+
+
+def _get_request_master_api_key() -> typing.Optional[Model]:
+    try:
+        return HistoricalRecords.thread.request.user.key
+    except AttributeError:
+        return None
+
+
+def _get_audit_log_kwargs(
+    history_instance: Model,
+    history_user: typing.Optional[Model],
+    history_record_class_path: str,
+    instance: typing.Optional[Model] = None,
+) -> typing.Optional[typing.Dict[str, typing.Any]]:
     if (
         history_instance.history_type == "~"
         and history_instance.prev_record
         and not history_instance.diff_against(history_instance.prev_record).changes
     ):
-        return
+        return None
 
-    user_model = get_user_model()
-
-    instance = history_instance.instance
+    instance = instance or history_instance.instance
     if instance.get_skip_create_audit_log():
-        return
-
-    history_user = user_model.objects.filter(id=history_user_id).first()
+        return None
 
     override_author = instance.get_audit_log_author(history_instance)
     if not (history_user or override_author or history_instance.master_api_key):
-        return
+        return None
 
     environment, project = instance.get_environment_and_project()
 
@@ -95,7 +232,7 @@ def create_audit_log_from_historical_record(
     related_object_type = instance.get_audit_log_related_object_type(history_instance)
 
     if not related_object_id:
-        return
+        return None
 
     log_message = {
         "+": instance.get_create_log_message,
@@ -104,21 +241,94 @@ def create_audit_log_from_historical_record(
     }[history_instance.history_type](history_instance)
 
     if not log_message:
-        return
-
-    AuditLog.objects.create(
-        history_record_id=history_instance.history_id,
-        history_record_class_path=history_record_class_path,
-        environment=environment,
-        project=project,
-        author=override_author or history_user,
-        related_object_id=related_object_id,
-        related_object_type=related_object_type.name,
-        log=log_message,
-        master_api_key=history_instance.master_api_key,
-        created_date=history_instance.history_date,
+        return None
+
+    return {
+        "history_record_id": history_instance.history_id,
+        "history_record_class_path": history_record_class_path,
+        "environment": environment,
+        "project": project,
+        "author": override_author or history_user,
+        "related_object_id": related_object_id,
+        "related_object_type": related_object_type.name,
+        "log": log_message,
+        "master_api_key": history_instance.master_api_key,
+        "created_date": history_instance.history_date,
         **instance.get_extra_audit_log_kwargs(history_instance),
-    )
+    }
+
+
+def _bulk_create_audit_logs(audit_logs: typing.List[AuditLog]) -> None:
+    """
+    Insert the given audit logs in a single query.
+
+    Since `bulk_create` bypasses the model's lifecycle hooks and signals, their
+    side effects are triggered here instead, with the environment updates
+    coalesced so that each environment is only updated (and its document only
+    rebuilt) once per batch.
+    """
+    for audit_log in audit_logs:
+        audit_log.add_project()
+        audit_log.add_organisation()
+        audit_log.add_created_date()
+
+    AuditLog.objects.bulk_create(audit_logs)
+
+    _process_environment_updates(audit_logs)
+
+    for audit_log in audit_logs:
+        post_save.send(
+            sender=AuditLog,
+            instance=audit_log,
+            created=True,
+            update_fields=None,
+            raw=False,
+            using=router.db_for_write(AuditLog),
+        )
+
+
+def _process_environment_updates(audit_logs: typing.List[AuditLog]) -> None:
+    """
+    The equivalent of `AuditLog.process_environment_update` for a batch of
+    audit logs.
+    """
+    from environments.models import Environment
+    from environments.tasks import process_environment_update
+
+    # Keyed on the environment (or, for project level changes, the project)
+    # that needs to be updated, keeping the latest audit log for each.
+    latest_audit_logs = {}
+    for audit_log in sorted(audit_logs, key=lambda a: a.created_date):
+        if audit_log.environment_document_updated:
+            latest_audit_logs[audit_log.project_id, audit_log.environment_id] = (
+                audit_log
+            )
+
+    environments_updated_at = {}
+    for audit_log in latest_audit_logs.values():
+        environments_filter = Q(project_id=audit_log.project_id)
+        if audit_log.environment_id:
+            environments_filter &= Q(id=audit_log.environment_id)
+        for environment_id in Environment.objects.filter(
+            environments_filter
+        ).values_list("id", flat=True):
+            environments_updated_at[environment_id] = max(
+                audit_log.created_date,
+                environments_updated_at.get(environment_id, audit_log.created_date),
+            )
+
+    # Update environment individually to avoid deadlock
+    for environment_id, updated_at in sorted(environments_updated_at.items()):
+        Environment.objects.filter(id=environment_id).update(updated_at=updated_at)
+    Environment.clear_environment_caches(environments_updated_at)
+
+    for audit_log in latest_audit_logs.values():
+        if audit_log.environment_id and (
+            (audit_log.project_id, None) in latest_audit_logs
+        ):
+            # The whole project is being rebuilt anyway.
+            continue
+        process_environment_update.delay(args=(audit_log.id,))
 
 
 @register_task_handler()
@@ -184,3 +394,20 @@ def create_segment_priorities_changed_audit_log(
             else timezone.now()
         ),
     )
+
+
+@register_recurring_task(
+    run_every=timedelta(hours=1),
+)
+def delete_expired_audit_logs() -> None:
+    if not settings.AUDIT_LOG_RETENTION_DAYS:
+        return
+
+    created_before = timezone.now() - timedelta(days=settings.AUDIT_LOG_RETENTION_DAYS)
+    # Delete in batches so that we don't hold locks on the table for long.
+    while audit_log_ids := list(
+        AuditLog.objects.filter(created_date__lt=created_before).values_list(
+            "id", flat=True
+        )[: settings.AUDIT_LOG_RETENTION_DELETE_BATCH_SIZE]
+    ):
+        AuditLog.objects.filter(id__in=audit_log_ids).delete()
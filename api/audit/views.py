@@ -4,7 +4,7 @@ from drf_yasg.utils import swagger_auto_schema
 from rest_framework import mixins, viewsets
 from rest_framework.permissions import IsAuthenticated
 
-from app.pagination import CustomPagination
+from app.pagination import AuditLogCursorPagination, CustomPagination
 from audit.models import AuditLog
 from audit.permissions import (
     OrganisationAuditLogPermissions,
@@ -15,7 +15,7 @@ from audit.serializers import (
     AuditLogRetrieveSerializer,
     AuditLogsQueryParamSerializer,
 )
-from organisations.models import OrganisationRole
+from organisations.models import OrganisationRole, UserOrganisation
 
 
 @method_decorator(
@@ -27,6 +27,19 @@ class _BaseAuditLogViewSet(
 ):
     pagination_class = CustomPagination
 
+    @property
+    def paginator(self):
+        # Clients can opt in to cursor pagination (starting from an empty
+        # cursor) to avoid counting every matching record.
+        if not hasattr(self, "_paginator"):
+            use_cursor = self.request is not None and (
+                AuditLogCursorPagination.cursor_query_param in self.request.query_params
+            )
+            self._paginator = (
+                AuditLogCursorPagination() if use_cursor else self.pagination_class()
+            )
+        return self._paginator
+
     def get_queryset(self) -> QuerySet[AuditLog]:
         q = self._get_base_filters()
 
@@ -60,8 +73,9 @@ class _BaseAuditLogViewSet(
 class AllAuditLogViewSet(_BaseAuditLogViewSet):
     def _get_base_filters(self) -> Q:
         return Q(
-            project__organisation__userorganisation__user=self.request.user,
-            project__organisation__userorganisation__role=OrganisationRole.ADMIN,
+            organisation_id__in=UserOrganisation.objects.filter(
+                user=self.request.user, role=OrganisationRole.ADMIN
+            ).values("organisation_id")
         )
 
 
@@ -69,7 +83,7 @@ class OrganisationAuditLogViewSet(_BaseAuditLogViewSet):
     permission_classes = [IsAuthenticated, OrganisationAuditLogPermissions]
 
     def _get_base_filters(self) -> Q:
-        return Q(project__organisation__id=self.kwargs["organisation_pk"])
+        return Q(organisation_id=self.kwargs["organisation_pk"])
 
 
 class ProjectAuditLogViewSet(_BaseAuditLogViewSet):
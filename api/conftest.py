@@ -974,6 +974,7 @@ def flagsmith_identities_table(dynamodb: DynamoDBServiceResource) -> Table:
             {"AttributeName": "composite_key", "AttributeType": "S"},
             {"AttributeName": "environment_api_key", "AttributeType": "S"},
             {"AttributeName": "identifier", "AttributeType": "S"},
+            {"AttributeName": "identifier_lowercase", "AttributeType": "S"},
             {"AttributeName": "identity_uuid", "AttributeType": "S"},
         ],
         GlobalSecondaryIndexes=[
@@ -985,6 +986,14 @@ def flagsmith_identities_table(dynamodb: DynamoDBServiceResource) -> Table:
                 ],
                 "Projection": {"ProjectionType": "ALL"},
             },
+            {
+                "IndexName": "environment_api_key-identifier_lowercase-index",
+                "KeySchema": [
+                    {"AttributeName": "environment_api_key", "KeyType": "HASH"},
+                    {"AttributeName": "identifier_lowercase", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            },
             {
                 "IndexName": "identity_uuid-index",
                 "KeySchema": [{"AttributeName": "identity_uuid", "KeyType": "HASH"}],
@@ -0,0 +1,305 @@
+import random
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+
+from core.constants import BOOLEAN, FLOAT, INTEGER, STRING
+from django.db.models import F, prefetch_related_objects
+from django.utils import timezone
+from flag_engine.segments import constants
+from simple_history.utils import bulk_create_with_history
+
+from environments.identities.models import Identity
+from environments.identities.traits.models import Trait
+from environments.models import Environment, EnvironmentAPIKey
+from features.feature_types import MULTIVARIATE, STANDARD
+from features.models import (
+    Feature,
+    FeatureSegment,
+    FeatureState,
+    FeatureStateValue,
+)
+from features.multivariate.models import MultivariateFeatureOption
+from organisations.models import Organisation
+from projects.models import Project
+from segments.models import Condition, Segment, SegmentRule
+
+TRAIT_VALUE_TYPES = (STRING, INTEGER, FLOAT, BOOLEAN)
+STRING_TRAIT_VALUES = [f"value-{i}" for i in range(10)]
+
+
+@dataclass
+class DatasetSize:
+    features: int = 2000
+    multivariate_features_percentage: int = 10
+    multivariate_options_per_feature: int = 3
+    segments: int = 200
+    conditions_per_rule: int = 3
+    overrides_per_segment: int = 5
+    identities: int = 100
+    traits_per_identity: int = 50
+    overrides_per_identity: int = 5
+
+    def to_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+@dataclass
+class BenchmarkDataset:
+    project: Project
+    # the same project is served by an environment using each versioning scheme
+    environments: dict[str, Environment]
+    server_api_keys: dict[str, str]
+    identities: dict[str, list[Identity]] = field(default_factory=dict)
+
+
+def seed_dataset(size: DatasetSize, seed: int) -> BenchmarkDataset:
+    """
+    Create a project, with an environment for each of the feature versioning
+    schemes, containing a (deterministic, for a given seed) dataset of the
+    given size.
+
+    The dataset is written in bulk (and hence bypasses the lifecycle hooks),
+    so it should only be used for benchmarking, in a transaction which is
+    rolled back afterwards.
+    """
+    rng = random.Random(seed)
+
+    organisation = Organisation.objects.create(name=f"Benchmark {seed}")
+    project = Project.objects.create(name="Benchmark", organisation=organisation)
+    environments = {
+        "v1": Environment.objects.create(name="Benchmark v1", project=project),
+        "v2": Environment.objects.create(
+            name="Benchmark v2", project=project, use_v2_feature_versioning=True
+        ),
+    }
+    server_api_keys = {
+        versioning: EnvironmentAPIKey.objects.create(
+            environment=environment, name="Benchmark"
+        ).key
+        for versioning, environment in environments.items()
+    }
+
+    features = _create_features(rng, size, project)
+    environment_feature_states = (
+        FeatureState.create_initial_feature_states_for_features(features, project)
+    )
+    segments = _create_segments(rng, size, project)
+    _create_segment_overrides(rng, size, features, segments, environment_feature_states)
+
+    dataset = BenchmarkDataset(
+        project=project,
+        environments=environments,
+        server_api_keys=server_api_keys,
+    )
+    for versioning, environment in environments.items():
+        dataset.identities[versioning] = _create_identities(
+            rng, size, environment, features
+        )
+
+    return dataset
+
+
+def _create_features(
+    rng: random.Random, size: DatasetSize, project: Project
+) -> list[Feature]:
+    features = []
+    multivariate_options = []
+    for i in range(size.features):
+        is_multivariate = rng.randrange(100) < size.multivariate_features_percentage
+        feature = Feature(
+            name=f"feature_{i}",
+            project=project,
+            initial_value=rng.choice(STRING_TRAIT_VALUES),
+            default_enabled=rng.random() < 0.5,
+            type=MULTIVARIATE if is_multivariate else STANDARD,
+        )
+        features.append(feature)
+        if is_multivariate:
+            multivariate_options.extend(
+                MultivariateFeatureOption(
+                    feature=feature,
+                    type=STRING,
+                    string_value=f"option-{j}",
+                    default_percentage_allocation=(
+                        100 / size.multivariate_options_per_feature
+                    ),
+                )
+                for j in range(size.multivariate_options_per_feature)
+            )
+
+    bulk_create_with_history(features, Feature)
+    bulk_create_with_history(multivariate_options, MultivariateFeatureOption)
+    prefetch_related_objects(features, "multivariate_options")
+    return features
+
+
+def _create_segments(
+    rng: random.Random, size: DatasetSize, project: Project
+) -> list[Segment]:
+    segments = Segment.objects.bulk_create(
+        Segment(name=f"segment_{i}", project=project, version=1)
+        for i in range(size.segments)
+    )
+    Segment.all_objects.filter(project=project).update(version_of=F("id"))
+
+    # Each segment is made up of an ALL rule, containing nested ANY and NONE
+    # rules, which is the deepest nesting supported by the dashboard.
+    top_level_rules = SegmentRule.objects.bulk_create(
+        SegmentRule(segment=segment, type=SegmentRule.ALL_RULE) for segment in segments
+    )
+    nested_rules = SegmentRule.objects.bulk_create(
+        SegmentRule(rule=top_level_rule, type=rule_type)
+        for top_level_rule in top_level_rules
+        for rule_type in (SegmentRule.ANY_RULE, SegmentRule.NONE_RULE)
+    )
+    conditions = [
+        Condition(rule=top_level_rule, operator=constants.PERCENTAGE_SPLIT, value="75")
+        for top_level_rule in top_level_rules
+    ]
+    for rule in nested_rules:
+        conditions.extend(
+            _build_condition(rng, size, rule) for _ in range(size.conditions_per_rule)
+        )
+    Condition.objects.bulk_create(conditions)
+
+    return segments
+
+
+def _build_condition(
+    rng: random.Random, size: DatasetSize, rule: SegmentRule
+) -> Condition:
+    trait_index = rng.randrange(size.traits_per_identity)
+    trait_key = f"trait_{trait_index}"
+    value_type = TRAIT_VALUE_TYPES[trait_index % len(TRAIT_VALUE_TYPES)]
+
+    if value_type == STRING:
+        operator, value = rng.choice(
+            [
+                (constants.EQUAL, rng.choice(STRING_TRAIT_VALUES)),
+                (constants.IN, ",".join(rng.sample(STRING_TRAIT_VALUES, 5))),
+                (constants.REGEX, r"value-[0-4]"),
+            ]
+        )
+    elif value_type == BOOLEAN:
+        operator, value = constants.EQUAL, "true"
+    else:
+        operator = rng.choice([constants.GREATER_THAN, constants.LESS_THAN_INCLUSIVE])
+        value = str(rng.randrange(100))
+
+    return Condition(rule=rule, operator=operator, property=trait_key, value=value)
+
+
+def _create_segment_overrides(
+    rng: random.Random,
+    size: DatasetSize,
+    features: list[Feature],
+    segments: list[Segment],
+    environment_feature_states: list[FeatureState],
+) -> None:
+    now = timezone.now()
+    priorities = defaultdict(int)
+    feature_segments = []
+    feature_states = []
+
+    environment_feature_states_by_feature_id = defaultdict(list)
+    for environment_feature_state in environment_feature_states:
+        environment_feature_states_by_feature_id[
+            environment_feature_state.feature_id
+        ].append(environment_feature_state)
+
+    for segment in segments:
+        for feature in rng.sample(features, size.overrides_per_segment):
+            for environment_feature_state in environment_feature_states_by_feature_id[
+                feature.id
+            ]:
+                environment_id = environment_feature_state.environment_id
+                environment_feature_version = (
+                    environment_feature_state.environment_feature_version
+                )
+                feature_segment = FeatureSegment(
+                    feature=feature,
+                    segment=segment,
+                    environment_id=environment_id,
+                    environment_feature_version=environment_feature_version,
+                    priority=priorities[(feature.id, environment_id)],
+                )
+                priorities[(feature.id, environment_id)] += 1
+                feature_segments.append(feature_segment)
+                feature_states.append(
+                    FeatureState(
+                        feature=feature,
+                        environment_id=environment_id,
+                        feature_segment=feature_segment,
+                        environment_feature_version=environment_feature_version,
+                        live_from=None if environment_feature_version else now,
+                        enabled=rng.random() < 0.5,
+                    )
+                )
+
+    FeatureSegment.objects.bulk_create(feature_segments)
+    FeatureState.objects.bulk_create(feature_states)
+    FeatureStateValue.objects.bulk_create(
+        FeatureStateValue(
+            feature_state=feature_state,
+            type=STRING,
+            string_value=rng.choice(STRING_TRAIT_VALUES),
+        )
+        for feature_state in feature_states
+    )
+
+
+def _create_identities(
+    rng: random.Random,
+    size: DatasetSize,
+    environment: Environment,
+    features: list[Feature],
+) -> list[Identity]:
+    now = timezone.now()
+    identities = Identity.objects.bulk_create(
+        Identity(identifier=f"identity_{i}", environment=environment)
+        for i in range(size.identities)
+    )
+
+    traits = []
+    feature_states = []
+    for identity in identities:
+        traits.extend(
+            _build_trait(rng, identity, i) for i in range(size.traits_per_identity)
+        )
+        feature_states.extend(
+            FeatureState(
+                feature=feature,
+                environment=environment,
+                identity=identity,
+                live_from=now,
+                enabled=rng.random() < 0.5,
+            )
+            for feature in rng.sample(features, size.overrides_per_identity)
+        )
+
+    Trait.objects.bulk_create(traits)
+    FeatureState.objects.bulk_create(feature_states)
+    FeatureStateValue.objects.bulk_create(
+        FeatureStateValue(
+            feature_state=feature_state,
+            type=STRING,
+            string_value=rng.choice(STRING_TRAIT_VALUES),
+        )
+        for feature_state in feature_states
+    )
+
+    return identities
+
+
+def _build_trait(rng: random.Random, identity: Identity, index: int) -> Trait:
+    trait = Trait(identity=identity, trait_key=f"trait_{index}")
+    trait.value_type = TRAIT_VALUE_TYPES[index % len(TRAIT_VALUE_TYPES)]
+    if trait.value_type == STRING:
+        trait.string_value = rng.choice(STRING_TRAIT_VALUES)
+    elif trait.value_type == INTEGER:
+        trait.integer_value = rng.randrange(100)
+    elif trait.value_type == FLOAT:
+        trait.float_value = rng.random() * 100
+    else:
+        trait.boolean_value = rng.random() < 0.5
+    return trait
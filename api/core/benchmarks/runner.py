@@ -0,0 +1,210 @@
+import json
+import statistics
+import typing
+from dataclasses import asdict, dataclass
+from itertools import cycle
+from time import perf_counter
+
+from core.benchmarks.dataset import BenchmarkDataset, DatasetSize
+from django.conf import settings
+from django.test import Client
+from django.utils import timezone
+
+from app.utils import get_version_info
+from environments.constants import IDENTITY_INTEGRATIONS_RELATION_NAMES
+from environments.models import Environment
+from features.versioning.versioning_service import get_environment_flags_list
+from util.mappers import map_environment_to_environment_document
+
+# Settings which change what is being measured, and which are hence recorded
+# alongside the results so that runs can be compared like for like.
+RECORDED_SETTINGS = (
+    "CACHE_FLAGS_SECONDS",
+    "CACHE_ENVIRONMENT_DOCUMENT_SECONDS",
+    "GET_FLAGS_ENDPOINT_CACHE_SECONDS",
+)
+
+
+class BenchmarkError(Exception):
+    pass
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    iterations: int
+    min_ms: float
+    median_ms: float
+    p95_ms: float
+    max_ms: float
+
+    @classmethod
+    def from_timings(cls, name: str, timings: list[float]) -> "BenchmarkResult":
+        timings_ms = sorted(timing * 1000 for timing in timings)
+        return cls(
+            name=name,
+            iterations=len(timings_ms),
+            min_ms=timings_ms[0],
+            median_ms=statistics.median(timings_ms),
+            p95_ms=timings_ms[min(len(timings_ms) - 1, int(len(timings_ms) * 0.95))],
+            max_ms=timings_ms[-1],
+        )
+
+
+@dataclass
+class BenchmarkComparison:
+    name: str
+    baseline_median_ms: float
+    median_ms: float
+
+    @property
+    def change(self) -> float:
+        return self.median_ms / self.baseline_median_ms - 1
+
+
+def run_benchmarks(
+    dataset: BenchmarkDataset, iterations: int, clone_iterations: int
+) -> list[BenchmarkResult]:
+    results = []
+    for name, func, benchmark_iterations in _get_benchmarks(
+        dataset, iterations, clone_iterations
+    ):
+        # Run once, untimed, so that the results aren't skewed by any caches
+        # (or connections) being populated on the first call.
+        func()
+        timings = []
+        for _ in range(benchmark_iterations):
+            start = perf_counter()
+            func()
+            timings.append(perf_counter() - start)
+        results.append(BenchmarkResult.from_timings(name, timings))
+    return results
+
+
+def build_report(
+    results: list[BenchmarkResult], dataset_size: DatasetSize, seed: int
+) -> dict[str, typing.Any]:
+    return {
+        "created_at": timezone.now().isoformat(),
+        "version": get_version_info(),
+        "seed": seed,
+        "dataset": dataset_size.to_dict(),
+        "settings": {name: getattr(settings, name) for name in RECORDED_SETTINGS},
+        "results": {result.name: asdict(result) for result in results},
+    }
+
+
+def compare_reports(
+    baseline: dict[str, typing.Any], report: dict[str, typing.Any]
+) -> list[BenchmarkComparison]:
+    return [
+        BenchmarkComparison(
+            name=name,
+            baseline_median_ms=baseline["results"][name]["median_ms"],
+            median_ms=result["median_ms"],
+        )
+        for name, result in report["results"].items()
+        if name in baseline["results"]
+    ]
+
+
+def load_report(path: str) -> dict[str, typing.Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def _get_benchmarks(
+    dataset: BenchmarkDataset, iterations: int, clone_iterations: int
+) -> typing.Generator[tuple[str, typing.Callable[[], typing.Any], int], None, None]:
+    client = Client()
+
+    for versioning, environment in dataset.environments.items():
+        identities = cycle(dataset.identities[versioning])
+        identifiers = cycle(
+            identity.identifier for identity in dataset.identities[versioning]
+        )
+        api_key = environment.api_key
+        server_api_key = dataset.server_api_keys[versioning]
+
+        yield (
+            f"Identity.get_all_feature_states[{versioning}]",
+            lambda identities=identities: next(identities).get_all_feature_states(),
+            iterations,
+        )
+        yield (
+            f"get_environment_flags_list[{versioning}]",
+            lambda environment=environment: get_environment_flags_list(environment),
+            iterations,
+        )
+        yield (
+            f"map_environment_to_sdk_document[{versioning}]",
+            lambda api_key=api_key: Environment.get_environment_document(api_key),
+            iterations,
+        )
+        yield (
+            f"map_environment_to_environment_document[{versioning}]",
+            lambda environment=environment: map_environment_to_environment_document(
+                Environment.objects.filter_for_document_builder(
+                    id=environment.id,
+                    extra_select_related=IDENTITY_INTEGRATIONS_RELATION_NAMES,
+                ).get()
+            ),
+            iterations,
+        )
+
+        yield (
+            f"GET /api/v1/flags/[{versioning}]",
+            lambda api_key=api_key: _request(client.get, "/api/v1/flags/", api_key),
+            iterations,
+        )
+        yield (
+            f"GET /api/v1/identities/[{versioning}]",
+            lambda api_key=api_key, identifiers=identifiers: _request(
+                client.get,
+                "/api/v1/identities/",
+                api_key,
+                data={"identifier": next(identifiers)},
+            ),
+            iterations,
+        )
+        yield (
+            f"POST /api/v1/identities/[{versioning}]",
+            lambda api_key=api_key, identifiers=identifiers: _request(
+                client.post,
+                "/api/v1/identities/",
+                api_key,
+                data={
+                    "identifier": next(identifiers),
+                    "traits": [
+                        {"trait_key": "trait_0", "trait_value": "value-1"},
+                        {"trait_key": "trait_1", "trait_value": 42},
+                    ],
+                },
+                content_type="application/json",
+            ),
+            iterations,
+        )
+        yield (
+            f"GET /api/v1/environment-document/[{versioning}]",
+            lambda server_api_key=server_api_key: _request(
+                client.get, "/api/v1/environment-document/", server_api_key
+            ),
+            iterations,
+        )
+
+    # Cloning adds environments (and their segment overrides) to the project,
+    # which would skew the other benchmarks, so it runs last.
+    for versioning, environment in dataset.environments.items():
+        yield (
+            f"Environment.clone[{versioning}]",
+            lambda environment=environment: environment.clone(name="Benchmark clone"),
+            clone_iterations,
+        )
+
+
+def _request(method: typing.Callable, path: str, api_key: str, **kwargs) -> None:
+    response = method(path, HTTP_X_ENVIRONMENT_KEY=api_key, **kwargs)
+    if response.status_code != 200:
+        raise BenchmarkError(
+            f"Request to {path} failed with status code {response.status_code}"
+        )
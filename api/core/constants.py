@@ -8,3 +8,5 @@ FLOAT = "float"
 FLAGSMITH_SIGNATURE_HEADER = "X-Flagsmith-Signature"
 
 FLAGSMITH_UPDATED_AT_HEADER = "X-Flagsmith-Document-Updated-At"
+
+FLAGSMITH_DOCUMENT_FORMAT_HEADER = "X-Flagsmith-Document-Format"
@@ -0,0 +1,130 @@
+import argparse
+import json
+from dataclasses import fields
+from typing import Any
+
+from core.benchmarks.dataset import DatasetSize, seed_dataset
+from core.benchmarks.runner import (
+    build_report,
+    compare_reports,
+    load_report,
+    run_benchmarks,
+)
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from django.db import transaction
+from django.test import override_settings
+from task_processor.task_run_method import TaskRunMethod
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a (rolled back) dataset of the given size and time the SDK hot paths "
+        "against it. The results can be written to a file, and compared against "
+        "those of a previous run."
+    )
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument(
+            "--clone-iterations",
+            type=int,
+            default=3,
+            help="Number of times to clone each environment (this is slow).",
+        )
+        parser.add_argument(
+            "--output", type=str, default=None, help="File to write the results to."
+        )
+        parser.add_argument(
+            "--compare",
+            type=str,
+            default=None,
+            help="File containing the results of a previous run to compare against.",
+        )
+        parser.add_argument(
+            "--regression-threshold",
+            type=float,
+            default=0.1,
+            help=(
+                "Fail if the median time of any benchmark has increased by more "
+                "than this fraction compared to the results given by --compare."
+            ),
+        )
+        for size_field in fields(DatasetSize):
+            parser.add_argument(
+                f"--{size_field.name.replace('_', '-')}",
+                dest=size_field.name,
+                type=int,
+                default=size_field.default,
+            )
+
+    def handle(
+        self,
+        *args: Any,
+        seed: int,
+        iterations: int,
+        clone_iterations: int,
+        output: str | None,
+        compare: str | None,
+        regression_threshold: float,
+        **options: Any,
+    ) -> None:
+        dataset_size = DatasetSize(
+            **{
+                size_field.name: options[size_field.name]
+                for size_field in fields(DatasetSize)
+            }
+        )
+
+        # Any tasks are only queued (as they would be in production), rather than
+        # run in a separate thread which wouldn't see the uncommitted dataset.
+        with (
+            override_settings(
+                ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"],
+                TASK_RUN_METHOD=TaskRunMethod.TASK_PROCESSOR,
+            ),
+            transaction.atomic(),
+        ):
+            self.stdout.write("Seeding dataset...")
+            dataset = seed_dataset(dataset_size, seed)
+            self.stdout.write("Running benchmarks...")
+            results = run_benchmarks(dataset, iterations, clone_iterations)
+            transaction.set_rollback(True)
+
+        report = build_report(results, dataset_size, seed)
+        for result in results:
+            self.stdout.write(
+                f"{result.name}: median {result.median_ms:.2f}ms, "
+                f"p95 {result.p95_ms:.2f}ms ({result.iterations} iterations)"
+            )
+
+        if output:
+            with open(output, "w") as f:
+                json.dump(report, f, indent=2)
+
+        if compare:
+            self._compare(load_report(compare), report, regression_threshold)
+
+    def _compare(
+        self,
+        baseline: dict[str, Any],
+        report: dict[str, Any],
+        regression_threshold: float,
+    ) -> None:
+        if baseline["dataset"] != report["dataset"]:
+            self.stderr.write(
+                "Warning: the baseline was run against a different dataset size."
+            )
+
+        regressions = []
+        for comparison in compare_reports(baseline, report):
+            self.stdout.write(
+                f"{comparison.name}: {comparison.baseline_median_ms:.2f}ms -> "
+                f"{comparison.median_ms:.2f}ms ({comparison.change:+.1%})"
+            )
+            if comparison.change > regression_threshold:
+                regressions.append(comparison.name)
+
+        if regressions:
+            raise CommandError(f"Regressions found in: {', '.join(regressions)}")
@@ -0,0 +1,101 @@
+import json
+import logging
+import random
+from time import perf_counter
+
+from core.request_profiling import (
+    SECTION_RENDER,
+    QueryTimer,
+    RequestProfile,
+    current_profile,
+    observe_request,
+)
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+class RequestProfilingMiddleware:
+    """
+    Profile requests to the views listed in `REQUEST_PROFILING_VIEWS`, recording
+    the number of queries, DB time, cache lookups and time spent in named
+    sections of the request against the view's metrics.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.profiled_views = frozenset(settings.REQUEST_PROFILING_VIEWS)
+
+    def __call__(self, request):
+        profile = RequestProfile()
+        token = current_profile.set(profile)
+        start = perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            current_profile.reset(token)
+            if profile.endpoint is not None:
+                _remove_query_timer(profile)
+
+        if profile.endpoint is not None:
+            duration = perf_counter() - start
+            observe_request(profile, duration)
+            self._log_slow_request(profile, duration)
+
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, "cls", None) or getattr(
+            view_func, "view_class", None
+        )
+        if view_class is None or view_class.__name__ not in self.profiled_views:
+            return
+
+        profile = current_profile.get()
+        profile.endpoint = view_class.__name__
+
+        # Only time the queries of the profiled views, so that other requests
+        # don't go through the execute wrapper.
+        query_timer = QueryTimer(profile)
+        for connection in connections.all():
+            connection.execute_wrappers.append(query_timer)
+
+    def process_template_response(self, request, response):
+        profile = current_profile.get()
+        if profile is None or profile.endpoint is None:
+            return response
+
+        start = perf_counter()
+
+        def _record_render_duration(rendered_response):
+            profile.section_durations[SECTION_RENDER] += perf_counter() - start
+
+        response.add_post_render_callback(_record_render_duration)
+        return response
+
+    def _log_slow_request(self, profile: RequestProfile, duration: float) -> None:
+        threshold_ms = settings.REQUEST_PROFILING_SLOW_REQUEST_THRESHOLD_MS
+        duration_ms = duration * 1000
+        if (
+            not threshold_ms
+            or duration_ms < threshold_ms
+            or random.random() >= settings.REQUEST_PROFILING_SLOW_REQUEST_SAMPLE_RATE
+        ):
+            return
+
+        logger.warning(
+            "Slow request to %s took %.2fms: %s",
+            profile.endpoint,
+            duration_ms,
+            json.dumps(profile.to_dict()),
+        )
+
+
+def _remove_query_timer(profile: RequestProfile) -> None:
+    for connection in connections.all():
+        connection.execute_wrappers[:] = [
+            wrapper
+            for wrapper in connection.execute_wrappers
+            if not (isinstance(wrapper, QueryTimer) and wrapper.profile is profile)
+        ]
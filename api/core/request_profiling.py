@@ -0,0 +1,254 @@
+"""
+Lightweight, in-process profiling for the SDK endpoints.
+
+When `ENABLE_REQUEST_PROFILING` is set, `RequestProfilingMiddleware` attaches a
+`RequestProfile` to each profiled request, and the code on the hot paths records
+into it (e.g. with `profile_section` and `record_cache_lookup`). Once the request
+completes, the profile is aggregated into per-endpoint histograms which are
+exposed, in the Prometheus text format, by the `/metrics` endpoint (which
+requires the `REQUEST_PROFILING_METRICS_TOKEN` as a bearer token).
+
+When profiling is disabled (or the current request isn't profiled) recording is
+a single context variable lookup, so the hooks are safe to leave on hot paths.
+
+Note that metrics are held in memory, per process.
+"""
+
+import threading
+import typing
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+
+DURATION_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+
+SECTION_SERIALIZATION = "serialization"
+SECTION_SEGMENT_EVALUATION = "segment_evaluation"
+SECTION_RENDER = "render"
+
+
+@dataclass
+class RequestProfile:
+    endpoint: str | None = None
+    db_query_count: int = 0
+    db_duration: float = 0.0
+    section_durations: dict[str, float] = field(
+        default_factory=lambda: defaultdict(float)
+    )
+    cache_lookups: dict[tuple[str, bool], int] = field(
+        default_factory=lambda: defaultdict(int)
+    )
+
+    def to_dict(self) -> dict[str, typing.Any]:
+        return {
+            "endpoint": self.endpoint,
+            "db_query_count": self.db_query_count,
+            "db_duration": self.db_duration,
+            "section_durations": dict(self.section_durations),
+            "cache_lookups": {
+                f"{cache_name}:{'hit' if hit else 'miss'}": count
+                for (cache_name, hit), count in self.cache_lookups.items()
+            },
+        }
+
+
+current_profile: ContextVar[RequestProfile | None] = ContextVar(
+    "current_profile", default=None
+)
+
+
+@contextmanager
+def profile_section(name: str) -> typing.Generator[None, None, None]:
+    """
+    Record the time spent in the wrapped block against the given section of the
+    current request's profile.
+    """
+    if (profile := current_profile.get()) is None:
+        yield
+        return
+
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        profile.section_durations[name] += perf_counter() - start
+
+
+def record_cache_lookup(cache_name: str, hit: bool) -> None:
+    if (profile := current_profile.get()) is not None:
+        profile.cache_lookups[(cache_name, hit)] += 1
+
+
+class QueryTimer:
+    """
+    Database execute wrapper which records the number of queries, and the time
+    spent executing them, against the given profile.
+    """
+
+    def __init__(self, profile: RequestProfile):
+        self.profile = profile
+
+    def __call__(self, execute, sql, params, many, context):
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.profile.db_query_count += 1
+            self.profile.db_duration += perf_counter() - start
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...],
+        buckets: tuple[float, ...],
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = buckets
+        # label values -> (bucket counts, sum, count)
+        self._series: dict[tuple[str, ...], list] = {}
+
+    def observe(self, label_values: tuple[str, ...], value: float) -> None:
+        series = self._series.setdefault(label_values, [[0] * len(self.buckets), 0, 0])
+        for i, upper_bound in enumerate(self.buckets):
+            if value <= upper_bound:
+                series[0][i] += 1
+        series[1] += value
+        series[2] += 1
+
+    def render(self) -> typing.Generator[str, None, None]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        for label_values, (bucket_counts, total, count) in self._series.items():
+            labels = _format_labels(self.label_names, label_values)
+            for upper_bound, bucket_count in zip(self.buckets, bucket_counts):
+                bucket_labels = _format_labels(
+                    (*self.label_names, "le"), (*label_values, str(upper_bound))
+                )
+                yield f"{self.name}_bucket{bucket_labels} {bucket_count}"
+            inf_labels = _format_labels(
+                (*self.label_names, "le"), (*label_values, "+Inf")
+            )
+            yield f"{self.name}_bucket{inf_labels} {count}"
+            yield f"{self.name}_sum{labels} {total}"
+            yield f"{self.name}_count{labels} {count}"
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...]):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._series: dict[tuple[str, ...], int] = defaultdict(int)
+
+    def inc(self, label_values: tuple[str, ...], amount: int = 1) -> None:
+        self._series[label_values] += amount
+
+    def render(self) -> typing.Generator[str, None, None]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} counter"
+        for label_values, value in self._series.items():
+            labels = _format_labels(self.label_names, label_values)
+            yield f"{self.name}{labels} {value}"
+
+
+_lock = threading.Lock()
+
+request_duration = Histogram(
+    "flagsmith_request_duration_seconds",
+    "Total time spent handling the request.",
+    ("endpoint",),
+    DURATION_BUCKETS,
+)
+request_db_queries = Histogram(
+    "flagsmith_request_db_queries",
+    "Number of database queries executed by the request.",
+    ("endpoint",),
+    QUERY_COUNT_BUCKETS,
+)
+request_db_duration = Histogram(
+    "flagsmith_request_db_duration_seconds",
+    "Time spent executing database queries for the request.",
+    ("endpoint",),
+    DURATION_BUCKETS,
+)
+request_section_duration = Histogram(
+    "flagsmith_request_section_duration_seconds",
+    "Time spent in a given section (e.g. serialization) of the request.",
+    ("endpoint", "section"),
+    DURATION_BUCKETS,
+)
+request_cache_lookups = Counter(
+    "flagsmith_request_cache_lookups_total",
+    "Number of lookups made against a named cache.",
+    ("endpoint", "cache", "result"),
+)
+
+METRICS = (
+    request_duration,
+    request_db_queries,
+    request_db_duration,
+    request_section_duration,
+    request_cache_lookups,
+)
+
+
+def observe_request(profile: RequestProfile, duration: float) -> None:
+    endpoint = profile.endpoint
+    with _lock:
+        request_duration.observe((endpoint,), duration)
+        request_db_queries.observe((endpoint,), profile.db_query_count)
+        request_db_duration.observe((endpoint,), profile.db_duration)
+        for section, section_duration in profile.section_durations.items():
+            request_section_duration.observe((endpoint, section), section_duration)
+        for (cache_name, hit), count in profile.cache_lookups.items():
+            request_cache_lookups.inc(
+                (endpoint, cache_name, "hit" if hit else "miss"), count
+            )
+
+
+def render_metrics() -> str:
+    with _lock:
+        return "\n".join(line for metric in METRICS for line in metric.render()) + "\n"
+
+
+def reset_metrics() -> None:
+    with _lock:
+        for metric in METRICS:
+            metric._series.clear()
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    return (
+        "{"
+        + ",".join(
+            f'{name}="{_escape_label_value(value)}"'
+            for name, value in zip(names, values)
+        )
+        + "}"
+    )
+
+
+def _escape_label_value(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
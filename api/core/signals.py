@@ -1,8 +1,13 @@
 import logging
+import threading
+import typing
+import weakref
+from datetime import datetime
 
 from core.models import AbstractBaseAuditableModel
 from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
 from django.utils import timezone
 from simple_history.models import HistoricalRecords
 from task_processor.task_run_method import TaskRunMethod
@@ -12,6 +17,14 @@ from users.models import FFAdminUser
 
 logger = logging.getLogger(__name__)
 
+# The batch of historical records created in the current transaction, which
+# are yet to have their audit logs created. Only a weak reference is kept here:
+# django holds the batch (as an on commit callback) until the transaction is
+# committed, and drops it if the transaction, or the savepoint in which it was
+# registered, is rolled back. A dead reference hence means that a new batch is
+# needed.
+_pending_historical_records = threading.local()
+
 
 def create_audit_log_from_historical_record(
     instance: AbstractBaseAuditableModel,
@@ -54,14 +67,48 @@ def create_audit_log_from_historical_record(
         # don't trigger audit log records in deleted projects
         return
 
-    tasks.create_audit_log_from_historical_record.delay(
-        kwargs={
-            "history_instance_id": history_instance.history_id,
-            "history_user_id": getattr(history_user, "id", None),
-            "history_record_class_path": instance.history_record_class_path,
-        },
-        delay_until=delay_until,
-    )
+    historical_record = {
+        "history_instance_id": history_instance.history_id,
+        "history_user_id": getattr(history_user, "id", None),
+        "history_record_class_path": instance.history_record_class_path,
+    }
+
+    connection = transaction.get_connection()
+    if (
+        settings.TASK_RUN_METHOD != TaskRunMethod.TASK_PROCESSOR
+        or not connection.in_atomic_block
+    ):
+        tasks.create_audit_log_from_historical_record.delay(
+            kwargs=historical_record, delay_until=delay_until
+        )
+        return
+
+    # Since the task processor won't see the historical records until the
+    # transaction is committed anyway, we queue a single task for all of the
+    # records created in the transaction so that their audit logs can be
+    # created (and their side effects triggered) in bulk.
+    batch_ref = getattr(_pending_historical_records, "batch_ref", None)
+    batch = batch_ref and batch_ref()
+    if batch is None:
+        batch = _HistoricalRecordBatch(delay_until=delay_until)
+        _pending_historical_records.batch_ref = weakref.ref(batch)
+        transaction.on_commit(batch)
+    batch.historical_records.append(historical_record)
+
+
+class _HistoricalRecordBatch:
+    def __init__(self, delay_until: datetime | None) -> None:
+        self.delay_until = delay_until
+        self.historical_records: list[dict[str, typing.Any]] = []
+
+    def __call__(self) -> None:
+        # Any records created from here on belong to a new transaction.
+        _pending_historical_records.batch_ref = None
+
+        tasks.create_audit_logs_from_historical_records.delay(
+            kwargs={"historical_records": self.historical_records},
+            delay_until=self.delay_until,
+        )
 
 
 def add_master_api_key(sender, **kwargs):
@@ -1,10 +1,43 @@
+import hashlib
+import json
+import threading
 import typing
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import caches
 
 from environments.dynamodb import DynamoEnvironmentV2Wrapper
 from environments.dynamodb.types import IdentityOverrideV2
 
 ddb_environment_v2_wrapper = DynamoEnvironmentV2Wrapper()
 
+edge_identities_list_cache = caches[settings.EDGE_IDENTITIES_LIST_CACHE_NAME]
+
+# When counting the identity overrides of more features than this, count the
+# identity overrides of the whole environment with a single query, rather than
+# making a query for each feature.
+EDGE_IDENTITY_OVERRIDE_COUNT_MAX_QUERIES = 20
+# Number of identity override count queries that are made concurrently.
+EDGE_IDENTITY_OVERRIDE_COUNT_MAX_WORKERS = 5
+
+# Used to fetch the next page of identities while the current one is returned.
+_prefetch_executor = ThreadPoolExecutor(max_workers=2)
+# The cache keys of the pages which are queued to be (or being) prefetched. No
+# more prefetches are queued while there are this many pending.
+_pending_prefetch_cache_keys: set[str] = set()
+_pending_prefetch_cache_keys_lock = threading.Lock()
+EDGE_IDENTITIES_LIST_MAX_PENDING_PREFETCHES = 10
+
+# The (only) attributes of identity documents needed to list them.
+EDGE_IDENTITIES_LIST_PROJECTION_EXPRESSION = (
+    "environment_api_key, identifier, identity_uuid"
+)
+
+EdgeIdentitiesPage = dict[str, typing.Any]
+
 
 def get_edge_identity_overrides(
     environment_id: int,
@@ -21,3 +54,137 @@ def get_edge_identity_overrides(
         )
         for item in override_items
     ]
+
+
+def get_edge_identity_override_counts(
+    environment_id: int,
+    feature_ids: typing.Iterable[int],
+) -> dict[int, int]:
+    feature_ids = list(feature_ids)
+
+    if len(feature_ids) > EDGE_IDENTITY_OVERRIDE_COUNT_MAX_QUERIES:
+        counts = ddb_environment_v2_wrapper.count_identity_overrides_by_feature_id(
+            environment_id=environment_id
+        )
+        return {feature_id: counts.get(feature_id, 0) for feature_id in feature_ids}
+
+    with ThreadPoolExecutor(
+        max_workers=EDGE_IDENTITY_OVERRIDE_COUNT_MAX_WORKERS
+    ) as executor:
+        counts = executor.map(
+            partial(
+                ddb_environment_v2_wrapper.count_identity_overrides_by_environment_id,
+                environment_id,
+            ),
+            feature_ids,
+        )
+        return dict(zip(feature_ids, counts))
+
+
+def get_edge_identities_page(
+    environment_api_key: str,
+    query: typing.Callable[[dict | None], EdgeIdentitiesPage],
+    query_key: str,
+    start_key: dict | None = None,
+) -> EdgeIdentitiesPage:
+    """
+    Get the page of identities returned by `query` for the given start key.
+
+    If EDGE_IDENTITIES_LIST_CACHE_SECONDS is set, pages are cached (against the
+    given key, which must identify the query). If the cache is shared between
+    processes (see EDGE_IDENTITIES_LIST_PREFETCH_NEXT_PAGE), the next page is
+    also fetched in the background, ready for when it is requested.
+    """
+    if not settings.EDGE_IDENTITIES_LIST_CACHE_SECONDS:
+        return query(start_key)
+
+    cache_key_prefix = _get_edge_identities_list_cache_key_prefix(
+        environment_api_key, query_key
+    )
+    page = _get_cached_edge_identities_page(query, cache_key_prefix, start_key)
+    if settings.EDGE_IDENTITIES_LIST_PREFETCH_NEXT_PAGE and (
+        next_start_key := page.get("LastEvaluatedKey")
+    ):
+        _prefetch_edge_identities_page(query, cache_key_prefix, next_start_key)
+    return page
+
+
+def clear_edge_identities_list_cache(environment_api_key: str) -> None:
+    edge_identities_list_cache.set(
+        _get_edge_identities_list_version_cache_key(environment_api_key),
+        uuid.uuid4().hex,
+        None,
+    )
+
+
+def _prefetch_edge_identities_page(
+    query: typing.Callable[[dict | None], EdgeIdentitiesPage],
+    cache_key_prefix: str,
+    start_key: dict,
+) -> None:
+    """
+    Fetch (and cache) the given page in the background, unless it is already
+    queued to be, or too many other pages are.
+    """
+    cache_key = _get_edge_identities_page_cache_key(cache_key_prefix, start_key)
+    with _pending_prefetch_cache_keys_lock:
+        if (
+            cache_key in _pending_prefetch_cache_keys
+            or len(_pending_prefetch_cache_keys)
+            >= EDGE_IDENTITIES_LIST_MAX_PENDING_PREFETCHES
+        ):
+            return
+        _pending_prefetch_cache_keys.add(cache_key)
+
+    def prefetch() -> None:
+        try:
+            _get_cached_edge_identities_page(query, cache_key_prefix, start_key)
+        finally:
+            with _pending_prefetch_cache_keys_lock:
+                _pending_prefetch_cache_keys.discard(cache_key)
+
+    _prefetch_executor.submit(prefetch)
+
+
+def _get_cached_edge_identities_page(
+    query: typing.Callable[[dict | None], EdgeIdentitiesPage],
+    cache_key_prefix: str,
+    start_key: dict | None,
+) -> EdgeIdentitiesPage:
+    cache_key = _get_edge_identities_page_cache_key(cache_key_prefix, start_key)
+    if (page := edge_identities_list_cache.get(cache_key)) is None:
+        response = query(start_key)
+        page = {
+            "Items": response["Items"],
+            "LastEvaluatedKey": response.get("LastEvaluatedKey"),
+        }
+        edge_identities_list_cache.set(cache_key, page)
+    return page
+
+
+def _get_edge_identities_page_cache_key(
+    cache_key_prefix: str,
+    start_key: dict | None,
+) -> str:
+    return _hash_cache_key(
+        f"{cache_key_prefix}:{json.dumps(start_key, sort_keys=True)}"
+    )
+
+
+def _get_edge_identities_list_cache_key_prefix(
+    environment_api_key: str,
+    query_key: str,
+) -> str:
+    version = edge_identities_list_cache.get(
+        _get_edge_identities_list_version_cache_key(environment_api_key)
+    )
+    return f"{environment_api_key}:{version}:{query_key}"
+
+
+def _get_edge_identities_list_version_cache_key(environment_api_key: str) -> str:
+    return f"{environment_api_key}:version"
+
+
+def _hash_cache_key(key: str) -> str:
+    # Search queries can contain anything, and be (too) long for some backends.
+    return hashlib.sha256(key.encode()).hexdigest()
@@ -1,10 +1,10 @@
-import copy
 import typing
 from contextlib import suppress
 
-from django.db.models import Prefetch, Q
 from flag_engine.features.models import FeatureStateModel
 from flag_engine.identities.models import IdentityFeaturesList, IdentityModel
+from flag_engine.segments.evaluator import get_identity_segments
+from flag_engine.segments.models import SegmentModel
 
 from api_keys.models import MasterAPIKey
 from edge_api.identities.tasks import (
@@ -16,9 +16,6 @@ from edge_api.identities.types import IdentityChangeset
 from edge_api.identities.utils import generate_change_dict
 from environments.dynamodb import DynamoIdentityWrapper
 from environments.models import Environment
-from features.models import FeatureState
-from features.multivariate.models import MultivariateFeatureStateValue
-from features.versioning.versioning_service import get_environment_flags_dict
 from users.models import FFAdminUser
 from util.mappers import map_engine_identity_to_identity_document
 
@@ -66,66 +63,47 @@ class EdgeIdentity:
     def get_all_feature_states(
         self,
     ) -> typing.Tuple[
-        typing.List[typing.Union[FeatureState, FeatureStateModel]], typing.Set[str]
+        typing.List[FeatureStateModel], typing.Set[str], typing.Dict[str, SegmentModel]
     ]:
         """
-        Get all feature states for a flag engine identity model. The list returned by
-        this function contains two distinct types: features.models.FeatureState &
-        flag_engine.features.models.FeatureStateModel.
+        Get all feature states for a flag engine identity model, evaluated against
+        the (cached) flag engine representation of the identity's environment.
 
         :return: tuple of (list of feature states, set of feature names that were overridden
-            for the identity specifically)
+            for the identity specifically, dictionary of the segments whose overrides are
+            used, keyed by feature name)
         """
-        segment_ids = self.dynamo_wrapper.get_segment_ids(
-            identity_model=self._engine_identity_model
-        )
-        django_environment = Environment.objects.get(api_key=self.environment_api_key)
-
-        # since identity overrides are included in the document retrieved from dynamo,
-        # we only want to retrieve the environment default and (relevant) segment overrides
-        # from the ORM.
-        additional_filters = Q(identity__isnull=True) & (
-            Q(feature_segment__segment__id__in=segment_ids)
-            | Q(feature_segment__isnull=True)
-        )
+        environment = Environment.get_environment_engine_model(self.environment_api_key)
 
-        feature_states: dict[str, FeatureState | FeatureStateModel] = (
-            get_environment_flags_dict(
-                environment=django_environment,
-                additional_filters=additional_filters,
-                additional_select_related_args=[
-                    "feature",
-                    "feature_segment",
-                    "feature_segment__segment",
-                    "feature_state_value",
-                ],
-                additional_prefetch_related_args=[
-                    Prefetch(
-                        "multivariate_feature_state_values",
-                        queryset=MultivariateFeatureStateValue.objects.select_related(
-                            "multivariate_feature_option"
-                        ),
-                    )
-                ],
-                # since we only want to retrieve the highest priority feature state,
-                # we key off the feature name instead of the default
-                # (feature_id, segment_id, identity_id). This will give us only e.g.
-                # the highest priority matching segment override for a given feature.
-                key_function=lambda fs: fs.feature.name,
-            )
-        )
+        feature_states: dict[str, FeatureStateModel] = {
+            feature_state.feature.name: feature_state
+            for feature_state in environment.feature_states
+        }
+
+        # Override with the highest priority segment override from any segments
+        # that the identity matches.
+        segment_overrides: dict[str, SegmentModel] = {}
+        for segment in get_identity_segments(environment, self._engine_identity_model):
+            for feature_state in segment.feature_states:
+                feature_name = feature_state.feature.name
+                if feature_name in segment_overrides and feature_states[
+                    feature_name
+                ].is_higher_segment_priority(feature_state):
+                    continue
+                feature_states[feature_name] = feature_state
+                segment_overrides[feature_name] = segment
 
         # Since the identity overrides are the highest priority, we can now iterate
         # over the dictionary and replace any feature states with those that have
         # an identity override, stored against the identity in dynamo.
-        identity_feature_states = self.feature_overrides
         identity_feature_names = set()
-        for identity_feature_state in identity_feature_states:
+        for identity_feature_state in self.feature_overrides:
             feature_name = identity_feature_state.feature.name
             feature_states[feature_name] = identity_feature_state
+            segment_overrides.pop(feature_name, None)
             identity_feature_names.add(feature_name)
 
-        return list(feature_states.values()), identity_feature_names
+        return list(feature_states.values()), identity_feature_names, segment_overrides
 
     def get_feature_state_by_feature_name_or_id(
         self, feature: typing.Union[str, int]
@@ -202,12 +180,9 @@ class EdgeIdentity:
         return map_engine_identity_to_identity_document(self._engine_identity_model)
 
     def _get_changes(self) -> IdentityChangeset:
-        previous_instance = self._initial_state
         changes = {}
         feature_changes = changes.setdefault("feature_overrides", {})
-        previous_feature_overrides = {
-            fs.featurestate_uuid: fs for fs in previous_instance.feature_overrides
-        }
+        previous_feature_overrides = self._initial_feature_overrides
         current_feature_overrides = {
             fs.featurestate_uuid: fs for fs in self.feature_overrides
         }
@@ -220,11 +195,7 @@ class EdgeIdentity:
                     identity_id=self.id,
                     old=previous_fs,
                 )
-            elif (
-                current_matching_fs.enabled != previous_fs.enabled
-                or current_matching_fs.get_value(self.id)
-                != previous_fs.get_value(self.id)
-            ):
+            elif self._is_feature_override_changed(previous_fs, current_matching_fs):
                 feature_changes[previous_fs.feature.name] = generate_change_dict(
                     change_type="~",
                     identity_id=self.id,
@@ -242,8 +213,31 @@ class EdgeIdentity:
 
         return changes
 
+    def _is_feature_override_changed(
+        self, previous_fs: FeatureStateModel, current_fs: FeatureStateModel
+    ) -> bool:
+        if (
+            current_fs.enabled == previous_fs.enabled
+            and current_fs.feature_state_value == previous_fs.feature_state_value
+            and current_fs.multivariate_feature_state_values
+            is previous_fs.multivariate_feature_state_values
+        ):
+            # None of the attributes that determine the value have been re-assigned,
+            # so we can skip evaluating the value for the identity.
+            return False
+
+        return current_fs.enabled != previous_fs.enabled or current_fs.get_value(
+            self.id
+        ) != previous_fs.get_value(self.id)
+
     def _reset_initial_state(self):
-        self._initial_state = copy.deepcopy(self)
+        # Feature overrides are only ever modified by re-assigning their attributes
+        # (or by adding / removing them from the identity) so a shallow copy of each
+        # override is enough to track the changes, without needing to copy the
+        # entire identity (including its traits).
+        self._initial_feature_overrides = {
+            fs.featurestate_uuid: fs.model_copy() for fs in self.feature_overrides
+        }
 
     def clone_flag_states_from(self, source_identity: "EdgeIdentity") -> None:
         """
@@ -31,6 +31,7 @@ from util.mappers import (
 )
 from webhooks.constants import WEBHOOK_DATETIME_FORMAT
 
+from .edge_identity_service import clear_edge_identities_list_cache
 from .models import EdgeIdentity
 from .tasks import call_environment_webhook_for_feature_state_change
 
@@ -52,6 +53,7 @@ class EdgeIdentitySerializer(serializers.Serializer):
         EdgeIdentity.dynamo_wrapper.put_item(
             map_engine_identity_to_identity_document(self.instance)
         )
+        clear_edge_identities_list_cache(environment_api_key)
         return self.instance
 
 
@@ -121,6 +121,7 @@ def generate_audit_log_records(
         log = f"Feature override {action} for feature '{feature_name}' and identity '{identifier}'"
         audit_records.append(
             AuditLog(
+                organisation=environment.project.organisation,
                 project=environment.project,
                 environment=environment,
                 log=log,
@@ -1,9 +1,11 @@
 import base64
 import json
 import typing
+from functools import partial
 
 import pydantic
 from boto3.dynamodb.conditions import Key
+from django.conf import settings
 from django.shortcuts import get_object_or_404
 from django.utils.decorators import method_decorator
 from drf_yasg.utils import swagger_auto_schema
@@ -60,6 +62,7 @@ from projects.exceptions import DynamoNotEnabledError
 from util.mappers import map_engine_identity_to_identity_document
 
 from . import edge_identity_service
+from .edge_identity_service import EDGE_IDENTITIES_LIST_PROJECTION_EXPRESSION
 from .exceptions import TraitPersistenceError
 from .models import EdgeIdentity
 from .permissions import (
@@ -113,6 +116,7 @@ class EdgeIdentityViewSet(
         )
 
     def get_queryset(self):
+        environment_api_key = self.kwargs["environment_api_key"]
         page_size = self.pagination_class().get_page_size(self.request)
         previous_last_evaluated_key = self.request.GET.get("last_evaluated_key")
         search_query = self.request.query_params.get("q")
@@ -120,21 +124,50 @@ class EdgeIdentityViewSet(
         if previous_last_evaluated_key:
             start_key = json.loads(base64.b64decode(previous_last_evaluated_key))
 
+        # Only the attributes needed for the list are read.
+        query_kwargs = {
+            "projection_expression": EDGE_IDENTITIES_LIST_PROJECTION_EXPRESSION
+        }
         if not search_query:
-            return EdgeIdentity.dynamo_wrapper.get_all_items(
-                self.kwargs["environment_api_key"], page_size, start_key
+            query = partial(
+                EdgeIdentity.dynamo_wrapper.get_all_items,
+                environment_api_key,
+                page_size,
+                **query_kwargs,
             )
-        search_func, search_identifier = self._get_search_function_and_value(
-            search_query
-        )
-        identity_documents = EdgeIdentity.dynamo_wrapper.search_items_with_identifier(
-            self.kwargs["environment_api_key"],
-            search_identifier,
-            search_func,
-            page_size,
-            start_key,
+        elif self._is_case_insensitive_search(search_query):
+            query = partial(
+                EdgeIdentity.dynamo_wrapper.search_items_with_identifier_prefix_case_insensitive,
+                environment_api_key,
+                search_query,
+                page_size,
+                **query_kwargs,
+            )
+        else:
+            search_func, search_identifier = self._get_search_function_and_value(
+                search_query
+            )
+            query = partial(
+                EdgeIdentity.dynamo_wrapper.search_items_with_identifier,
+                environment_api_key,
+                search_identifier,
+                search_func,
+                page_size,
+                **query_kwargs,
+            )
+
+        return edge_identity_service.get_edge_identities_page(
+            environment_api_key,
+            query,
+            query_key=f"{page_size}:{search_query or ''}",
+            start_key=start_key,
         )
-        return identity_documents
+
+    def _is_case_insensitive_search(self, search_query: str) -> bool:
+        # Exact matches (i.e. quoted search queries) are always case sensitive.
+        return bool(
+            settings.IDENTITIES_TABLE_LOWERCASE_IDENTIFIER_INDEX_NAME_DYNAMO
+        ) and not (search_query.startswith('"') and search_query.endswith('"'))
 
     def get_permissions(self):
         return [
@@ -161,6 +194,9 @@ class EdgeIdentityViewSet(
 
     def perform_destroy(self, instance):
         EdgeIdentity.dynamo_wrapper.delete_item(instance["composite_key"])
+        edge_identity_service.clear_edge_identities_list_cache(
+            self.kwargs["environment_api_key"]
+        )
 
     @swagger_auto_schema(
         responses={200: EdgeIdentityTraitsSerializer(many=True)},
@@ -291,6 +327,7 @@ class EdgeIdentityFeatureStateViewSet(viewsets.ModelViewSet):
         (
             feature_states,
             identity_feature_names,
+            segment_overrides,
         ) = self.identity.get_all_feature_states()
 
         serializer = IdentityAllFeatureStatesSerializer(
@@ -301,6 +338,7 @@ class EdgeIdentityFeatureStateViewSet(viewsets.ModelViewSet):
                 "identity": self.identity,
                 "environment_api_key": self.identity.environment_api_key,
                 "identity_feature_names": identity_feature_names,
+                "segment_overrides": segment_overrides,
             },
         )
 
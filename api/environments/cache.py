@@ -0,0 +1,165 @@
+import copy
+import threading
+import time
+import typing
+import uuid
+from collections import OrderedDict
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.views.decorators.cache import cache_page
+from rest_framework.request import Request
+
+if typing.TYPE_CHECKING:
+    from environments.models import Environment
+
+environment_cache = caches[settings.ENVIRONMENT_CACHE_NAME]
+
+# Changed every time that an environment is removed from the (shared)
+# environment cache, so that every process knows to clear its local cache.
+ENVIRONMENT_CACHE_VERSION_KEY = "environment-cache-version"
+
+
+def update_environment_cache_version() -> None:
+    """
+    Invalidate the local environment cache of every process. This should be
+    called after the environment(s) have been removed from the shared cache.
+    """
+    environment_cache.set(ENVIRONMENT_CACHE_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def get_environment_version_cache_key(request: Request) -> str:
+    """
+    Get a key which identifies the current version of the flags that can be
+    seen by the (authenticated) SDK request.
+
+    Any change to an environment or its flags changes its `updated_at` value
+    (and removes it from the environment cache), so anything cached against
+    this key doesn't need to be invalidated explicitly when they change.
+
+    Note that identities and their traits are not part of the environment
+    version, so responses which include them (e.g. from the identities
+    endpoint) will still be stale until they expire.
+    """
+    environment = request.environment
+    return (
+        f"{environment.api_key}:{request.originated_from.name}:"
+        f"{environment.updated_at.timestamp()}"
+    )
+
+
+def cache_sdk_response(timeout: int, cache: str) -> typing.Callable:
+    """
+    Like django's `cache_page`, but for views which are authenticated with an
+    environment key, with the responses cached per environment version (see
+    `get_environment_version_cache_key`) rather than just per URL.
+    """
+
+    def decorator(view_func: typing.Callable) -> typing.Callable:
+        if not timeout:
+            return view_func
+
+        @wraps(view_func)
+        def _wrapped_view(request: Request, *args, **kwargs):
+            return cache_page(
+                timeout,
+                cache=cache,
+                key_prefix=get_environment_version_cache_key(request),
+            )(view_func)(request, *args, **kwargs)
+
+        return _wrapped_view
+
+    return decorator
+
+
+class LocalEnvironmentCache:
+    """
+    A per-process LRU cache of environments in front of the shared environment
+    cache, so that authenticating an SDK request doesn't require a round trip
+    to (and unpickling a whole environment from) the shared cache.
+
+    Since it can't be invalidated directly from other processes, it is cleared
+    whenever the version stamp in the shared cache changes. The version is
+    checked at most every ENVIRONMENT_LOCAL_CACHE_VERSION_CHECK_SECONDS, which
+    is how long a change to an environment can take to be seen.
+    """
+
+    def __init__(self) -> None:
+        self._environments: OrderedDict[str, tuple["Environment", float]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._version: str | None = None
+        self._version_checked_at: float | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return settings.ENVIRONMENT_LOCAL_CACHE_MAX_SIZE > 0
+
+    def get(self, api_key: str) -> typing.Optional["Environment"]:
+        if not self.enabled:
+            return None
+
+        self._check_version()
+
+        with self._lock:
+            environment, expires_at = self._environments.get(api_key, (None, 0))
+            if environment is None:
+                return None
+            if expires_at <= time.monotonic():
+                del self._environments[api_key]
+                return None
+            self._environments.move_to_end(api_key)
+
+        # Each request gets its own copy, so that anything set on it (e.g.
+        # cached relations) isn't shared between requests.
+        return copy.copy(environment)
+
+    @property
+    def version(self) -> str | None:
+        return self._version
+
+    def set(
+        self, api_key: str, environment: "Environment", version: str | None
+    ) -> None:
+        """
+        Add the given environment, which was retrieved when the cache was at
+        the given version, to the cache.
+        """
+        if not self.enabled:
+            return
+
+        expires_at = time.monotonic() + settings.ENVIRONMENT_CACHE_SECONDS
+        with self._lock:
+            if version != self._version:
+                # The environment may have been changed since it was retrieved.
+                return
+            self._environments[api_key] = (environment, expires_at)
+            self._environments.move_to_end(api_key)
+            while len(self._environments) > settings.ENVIRONMENT_LOCAL_CACHE_MAX_SIZE:
+                self._environments.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._environments.clear()
+            self._version_checked_at = None
+
+    def _check_version(self) -> None:
+        now = time.monotonic()
+        if (
+            self._version_checked_at is not None
+            and now - self._version_checked_at
+            < settings.ENVIRONMENT_LOCAL_CACHE_VERSION_CHECK_SECONDS
+        ):
+            return
+
+        version = environment_cache.get(ENVIRONMENT_CACHE_VERSION_KEY)
+        with self._lock:
+            if version != self._version:
+                self._environments.clear()
+                self._version = version
+            self._version_checked_at = now
+
+
+local_environment_cache = LocalEnvironmentCache()
@@ -1,4 +1,5 @@
 import typing
+from collections import defaultdict
 from typing import Any, Iterable
 
 from boto3.dynamodb.conditions import Key
@@ -83,6 +84,55 @@ class DynamoEnvironmentV2Wrapper(BaseDynamoEnvironmentWrapper):
         except KeyError as e:
             raise ObjectDoesNotExist() from e
 
+    def count_identity_overrides_by_environment_id(
+        self,
+        environment_id: int,
+        feature_id: int,
+    ) -> int:
+        query_kwargs: "QueryInputRequestTypeDef" = {
+            "KeyConditionExpression": Key(ENVIRONMENTS_V2_PARTITION_KEY).eq(
+                str(environment_id),
+            )
+            & Key(ENVIRONMENTS_V2_SORT_KEY).begins_with(
+                get_environments_v2_identity_override_document_key(
+                    feature_id=feature_id,
+                ),
+            ),
+            "Select": "COUNT",
+        }
+        count = 0
+        while True:
+            query_response = self.table.query(**query_kwargs)
+            count += query_response["Count"]
+
+            if not (last_evaluated_key := query_response.get("LastEvaluatedKey")):
+                return count
+
+            query_kwargs["ExclusiveStartKey"] = last_evaluated_key
+
+    def count_identity_overrides_by_feature_id(
+        self,
+        environment_id: int,
+    ) -> dict[int, int]:
+        """
+        Count the identity overrides of every feature in the given environment,
+        with a single (paginated) query which only reads the document keys.
+        """
+        counts = defaultdict(int)
+        for item in self.query_get_all_items(
+            KeyConditionExpression=Key(ENVIRONMENTS_V2_PARTITION_KEY).eq(
+                str(environment_id),
+            )
+            & Key(ENVIRONMENTS_V2_SORT_KEY).begins_with(
+                get_environments_v2_identity_override_document_key(),
+            ),
+            ProjectionExpression=ENVIRONMENTS_V2_SORT_KEY,
+        ):
+            # The document key is "identity_override:<feature_id>:<identity_uuid>".
+            _, feature_id, _ = item[ENVIRONMENTS_V2_SORT_KEY].split(":", 2)
+            counts[int(feature_id)] += 1
+        return dict(counts)
+
     def update_identity_overrides(
         self,
         changeset: IdentityOverridesV2Changeset,
@@ -154,6 +154,7 @@ class DynamoIdentityWrapper(BaseDynamoWrapper):
         search_function: typing.Callable,
         limit: int,
         start_key: dict = None,
+        projection_expression: str | None = None,
     ):
         filter_expression = Key("environment_api_key").eq(
             environment_api_key
@@ -165,6 +166,33 @@ class DynamoIdentityWrapper(BaseDynamoWrapper):
         }
         if start_key:
             query_kwargs.update(ExclusiveStartKey=start_key)
+        if projection_expression:
+            query_kwargs.update(ProjectionExpression=projection_expression)
+        return self.query_items(**query_kwargs)
+
+    def search_items_with_identifier_prefix_case_insensitive(
+        self,
+        environment_api_key: str,
+        identifier_prefix: str,
+        limit: int,
+        start_key: dict = None,
+        projection_expression: str | None = None,
+    ) -> "QueryOutputTableTypeDef":
+        """
+        Query the identities whose identifier starts with the given prefix,
+        ignoring case. Requires
+        IDENTITIES_TABLE_LOWERCASE_IDENTIFIER_INDEX_NAME_DYNAMO to be set.
+        """
+        query_kwargs = {
+            "IndexName": settings.IDENTITIES_TABLE_LOWERCASE_IDENTIFIER_INDEX_NAME_DYNAMO,
+            "Limit": limit,
+            "KeyConditionExpression": Key("environment_api_key").eq(environment_api_key)
+            & Key("identifier_lowercase").begins_with(identifier_prefix.lower()),
+        }
+        if start_key:
+            query_kwargs.update(ExclusiveStartKey=start_key)
+        if projection_expression:
+            query_kwargs.update(ProjectionExpression=projection_expression)
         return self.query_items(**query_kwargs)
 
     def get_segment_ids(
@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, Iterable
 
+from django.db import router
 from django.db.models import Manager
 
 if TYPE_CHECKING:
@@ -30,3 +31,43 @@ class IdentityManager(Manager["Identity"]):
             .prefetch_related("identity_traits")
             .get_or_create(identifier=identifier, environment=environment)
         )
+
+    def get_or_create_in_bulk(
+        self,
+        identifiers: Iterable[str],
+        environment: "Environment",
+    ) -> dict[str, "Identity"]:
+        """
+        Return a dictionary of identifier -> identity for all the given identifiers,
+        creating any identities that don't exist yet.
+        """
+        # Query the database we write to, so that we don't miss any identities
+        # that have only just been created.
+        queryset = self.using(router.db_for_write(self.model))
+
+        identifiers = set(identifiers)
+        identities = {
+            identity.identifier: identity
+            for identity in queryset.filter(
+                environment=environment, identifier__in=identifiers
+            )
+        }
+
+        if missing_identifiers := identifiers.difference(identities):
+            # use ignore_conflicts to handle race conditions where another request
+            # has created the same identity since we queried for them above.
+            queryset.bulk_create(
+                [
+                    self.model(identifier=identifier, environment=environment)
+                    for identifier in missing_identifiers
+                ],
+                ignore_conflicts=True,
+            )
+            identities.update(
+                (identity.identifier, identity)
+                for identity in queryset.filter(
+                    environment=environment, identifier__in=missing_identifiers
+                )
+            )
+
+        return identities
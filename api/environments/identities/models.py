@@ -1,6 +1,7 @@
 import typing
 from itertools import chain
 
+from core.request_profiling import SECTION_SEGMENT_EVALUATION, profile_section
 from django.db import models
 from django.db.models import Prefetch, Q
 from django.utils import timezone
@@ -177,15 +178,16 @@ class Identity(models.Model):
         )
         engine_traits = map_traits_to_engine(traits)
 
-        for segment in all_segments:
-            engine_segment = map_segment_to_engine(segment)
+        with profile_section(SECTION_SEGMENT_EVALUATION):
+            for segment in all_segments:
+                engine_segment = map_segment_to_engine(segment)
 
-            if evaluate_identity_in_segment(
-                identity=engine_identity,
-                segment=engine_segment,
-                override_traits=engine_traits,
-            ):
-                matching_segments.append(segment)
+                if evaluate_identity_in_segment(
+                    identity=engine_identity,
+                    segment=engine_segment,
+                    override_traits=engine_traits,
+                ):
+                    matching_segments.append(segment)
 
         return matching_segments
 
@@ -2,6 +2,7 @@ import typing
 
 from drf_yasg.utils import swagger_serializer_method
 from flag_engine.features.models import FeatureStateModel
+from flag_engine.segments.models import SegmentModel
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
@@ -14,6 +15,9 @@ from features.serializers import (
     SDKFeatureStateSerializer,
 )
 
+if typing.TYPE_CHECKING:
+    from segments.models import Segment
+
 
 class IdentifierOnlyIdentitySerializer(serializers.ModelSerializer):
     class Meta:
@@ -124,7 +128,7 @@ class IdentityAllFeatureStatesSerializer(serializers.Serializer):
         return instance.get_value(hash_key)
 
     def get_overridden_by(self, instance) -> typing.Optional[str]:
-        if getattr(instance, "feature_segment_id", None) is not None:
+        if self._get_segment(instance) is not None:
             return "SEGMENT"
         elif getattr(
             instance, "identity_id", None
@@ -136,12 +140,20 @@ class IdentityAllFeatureStatesSerializer(serializers.Serializer):
         serializer_or_field=IdentityAllFeatureStatesSegmentSerializer
     )
     def get_segment(self, instance) -> typing.Optional[typing.Dict[str, typing.Any]]:
-        if getattr(instance, "feature_segment_id", None) is not None:
-            return IdentityAllFeatureStatesSegmentSerializer(
-                instance=instance.feature_segment.segment
-            ).data
+        if (segment := self._get_segment(instance)) is not None:
+            return IdentityAllFeatureStatesSegmentSerializer(instance=segment).data
         return None
 
+    def _get_segment(
+        self, instance: typing.Union[FeatureState, FeatureStateModel]
+    ) -> typing.Union["Segment", SegmentModel, None]:
+        if getattr(instance, "feature_segment_id", None) is not None:
+            return instance.feature_segment.segment
+
+        # Flag engine feature states do not reference their segment, so it needs
+        # to be provided in the context instead.
+        return self.context.get("segment_overrides", {}).get(instance.feature.name)
+
 
 class IdentitySourceIdentityRequestSerializer(serializers.Serializer):
     source_identity_id = serializers.IntegerField(
@@ -0,0 +1,114 @@
+from typing import TYPE_CHECKING, Iterable
+
+from django.db import connections, router
+from django.db.models import Manager, Q
+from django.utils import timezone
+
+if TYPE_CHECKING:
+    from environments.identities.traits.models import Trait
+
+
+# Limit the number of rows in each upsert statement so that we don't exceed
+# the maximum number of query parameters for very large payloads.
+UPSERT_BATCH_SIZE = 1000
+
+
+class TraitManager(Manager["Trait"]):
+    def bulk_upsert(self, traits: Iterable["Trait"]) -> None:
+        """
+        Create the given traits, or update the value of any that already exist
+        for the same identity and trait key.
+
+        On postgres, this is done with `INSERT ... ON CONFLICT DO UPDATE` so that
+        concurrent requests writing the same traits don't race (or deadlock) with
+        each other. Other databases fall back to a bulk update / bulk create.
+        """
+        # De-duplicate the traits (keeping the last one) since postgres cannot
+        # update the same row twice in a single statement. They are also sorted
+        # so that concurrent upserts acquire the row locks in the same order.
+        traits_by_key = {(t.identity_id, t.trait_key): t for t in traits}
+        traits = [traits_by_key[key] for key in sorted(traits_by_key)]
+        if not traits:
+            return
+
+        db = router.db_for_write(self.model)
+        if connections[db].vendor != "postgresql":
+            self._bulk_update_or_create(traits, db)
+            return
+
+        for i in range(0, len(traits), UPSERT_BATCH_SIZE):
+            end = i + UPSERT_BATCH_SIZE
+            self._upsert(traits[i:end], db)
+
+    def _upsert(self, traits: list["Trait"], db: str) -> None:
+        connection = connections[db]
+        qn = connection.ops.quote_name
+
+        fields = [
+            self.model._meta.get_field(field_name)
+            for field_name in ("identity", "trait_key", *self.model.BULK_UPDATE_FIELDS)
+        ]
+        created_date_field = self.model._meta.get_field("created_date")
+        value_columns = [
+            qn(self.model._meta.get_field(field_name).column)
+            for field_name in self.model.BULK_UPDATE_FIELDS
+        ]
+        conflict_columns = [
+            qn(self.model._meta.get_field(field_name).column)
+            for field_name in ("identity", "trait_key")
+        ]
+
+        now = timezone.now()
+        params = []
+        for trait in traits:
+            params.extend(
+                field.get_db_prep_save(getattr(trait, field.attname), connection)
+                for field in fields
+            )
+            params.append(created_date_field.get_db_prep_save(now, connection))
+
+        row_placeholder = f"({', '.join(['%s'] * (len(fields) + 1))})"
+        table = qn(self.model._meta.db_table)
+        sql = (
+            f"INSERT INTO {table} "
+            f"({', '.join(qn(f.column) for f in [*fields, created_date_field])}) "
+            f"VALUES {', '.join([row_placeholder] * len(traits))} "
+            f"ON CONFLICT ({', '.join(conflict_columns)}) DO UPDATE SET "
+            f"{', '.join(f'{column} = EXCLUDED.{column}' for column in value_columns)} "
+            # Avoid rewriting rows whose value has not changed.
+            f"WHERE ({', '.join(f'{table}.{column}' for column in value_columns)}) "
+            f"IS DISTINCT FROM "
+            f"({', '.join(f'EXCLUDED.{column}' for column in value_columns)})"
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+
+    def _bulk_update_or_create(self, traits: list["Trait"], db: str) -> None:
+        queryset = self.using(db)
+
+        existing_traits_query = Q()
+        for trait in traits:
+            existing_traits_query |= Q(
+                identity_id=trait.identity_id, trait_key=trait.trait_key
+            )
+        existing_trait_ids = {
+            (identity_id, trait_key): trait_id
+            for trait_id, identity_id, trait_key in queryset.filter(
+                existing_traits_query
+            ).values_list("id", "identity_id", "trait_key")
+        }
+
+        traits_to_update = []
+        traits_to_create = []
+        for trait in traits:
+            if trait_id := existing_trait_ids.get((trait.identity_id, trait.trait_key)):
+                trait.id = trait_id
+                traits_to_update.append(trait)
+            else:
+                traits_to_create.append(trait)
+
+        queryset.bulk_update(traits_to_update, fields=self.model.BULK_UPDATE_FIELDS)
+        # use ignore_conflicts to handle race conditions which result in IntegrityError
+        # if another request has added a particular trait_key for the identity.
+        queryset.bulk_create(traits_to_create, ignore_conflicts=True)
@@ -5,6 +5,7 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
 
 from environments.identities.traits.exceptions import TraitPersistenceError
+from environments.identities.traits.managers import TraitManager
 
 
 class Trait(models.Model):
@@ -38,6 +39,8 @@ class Trait(models.Model):
 
     created_date = models.DateTimeField("DateCreated", auto_now_add=True)
 
+    objects = TraitManager()
+
     class Meta:
         verbose_name_plural = "User Traits"
         unique_together = ("trait_key", "identity")
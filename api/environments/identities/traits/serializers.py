@@ -1,4 +1,5 @@
 from core.constants import INTEGER
+from django.db.models import F
 from rest_framework import exceptions, serializers
 
 from environments.identities.models import Identity
@@ -49,11 +50,14 @@ class IncrementTraitValueSerializer(serializers.Serializer):
             defaults=self._build_default_data(),
         )
 
-        if trait.value_type != INTEGER:
+        # Increment the value in the database so that concurrent requests to
+        # increment the same trait don't overwrite each other.
+        if trait.value_type != INTEGER or not Trait.objects.filter(
+            id=trait.id, value_type=INTEGER
+        ).update(integer_value=F("integer_value") + validated_data.get("increment_by")):
             raise exceptions.ValidationError("Trait is not an integer.")
 
-        trait.integer_value += validated_data.get("increment_by")
-        trait.save()
+        trait.refresh_from_db(fields=["integer_value"])
         return trait
 
     def _build_query_data(self, validated_data):
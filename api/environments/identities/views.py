@@ -3,11 +3,11 @@ from collections import namedtuple
 
 from core.constants import FLAGSMITH_UPDATED_AT_HEADER
 from core.request_origin import RequestOrigin
+from core.request_profiling import SECTION_SERIALIZATION, profile_section
 from django.conf import settings
 from django.db.models import Q
 from django.utils import timezone
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status, viewsets
 from rest_framework.permissions import IsAuthenticated
@@ -15,6 +15,7 @@ from rest_framework.response import Response
 
 from app.pagination import CustomPagination
 from edge_api.identities.edge_request_forwarder import forward_identity_request
+from environments.cache import cache_sdk_response
 from environments.identities.models import Identity
 from environments.identities.serializers import (
     IdentitySerializer,
@@ -162,7 +163,7 @@ class SDKIdentities(SDKAPIView):
         operation_id="identify_user",
     )
     @method_decorator(
-        cache_page(
+        cache_sdk_response(
             timeout=settings.GET_IDENTITIES_ENDPOINT_CACHE_SECONDS,
             cache=settings.GET_IDENTITIES_ENDPOINT_CACHE_NAME,
         )
@@ -256,8 +257,10 @@ class SDKIdentities(SDKAPIView):
             instance=instance,
             context=self.get_serializer_context(),
         )
+        with profile_section(SECTION_SERIALIZATION):
+            data = response_serializer.data
         return Response(
-            response_serializer.data,
+            data,
             headers={
                 FLAGSMITH_UPDATED_AT_HEADER: request.environment.updated_at.timestamp()
             },
@@ -314,8 +317,9 @@ class SDKIdentities(SDKAPIView):
             context=self.get_serializer_context(),
         )
 
+        with profile_section(SECTION_SERIALIZATION):
+            data = serializer.data
+
         identify_integrations(identity, all_feature_states)
 
-        return Response(
-            data=serializer.data, status=status.HTTP_200_OK, headers=headers
-        )
+        return Response(data=data, status=status.HTTP_200_OK, headers=headers)
@@ -4,6 +4,7 @@ from copy import deepcopy
 
 from core.models import abstract_base_auditable_model_factory
 from core.request_origin import RequestOrigin
+from core.request_profiling import record_cache_lookup
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericRelation
 from django.core.cache import caches
@@ -18,6 +19,7 @@ from django_lifecycle import (
     LifecycleModel,
     hook,
 )
+from flag_engine.environments.models import EnvironmentModel
 from rest_framework.request import Request
 from softdelete.models import SoftDeleteObject
 
@@ -31,6 +33,10 @@ from environments.api_keys import (
     generate_client_api_key,
     generate_server_api_key,
 )
+from environments.cache import (
+    local_environment_cache,
+    update_environment_cache_version,
+)
 from environments.constants import IDENTITY_INTEGRATIONS_RELATION_NAMES
 from environments.dynamodb import (
     DynamoEnvironmentAPIKeyWrapper,
@@ -45,7 +51,12 @@ from features.versioning.models import EnvironmentFeatureVersion
 from metadata.models import Metadata
 from projects.models import Project
 from segments.models import Segment
-from util.mappers import map_environment_to_sdk_document
+from util.mappers import (
+    map_environment_to_engine,
+    map_environment_to_sdk_document,
+    map_sdk_document_to_compact_sdk_document,
+)
+from util.mappers.sdk import COMPACT_SDK_DOCUMENT_FORMAT
 from webhooks.models import AbstractBaseExportableWebhookModel
 
 logger = logging.getLogger(__name__)
@@ -53,6 +64,9 @@ logger = logging.getLogger(__name__)
 environment_cache = caches[settings.ENVIRONMENT_CACHE_NAME]
 environment_document_cache = caches[settings.ENVIRONMENT_DOCUMENT_CACHE_LOCATION]
 environment_segments_cache = caches[settings.ENVIRONMENT_SEGMENTS_CACHE_NAME]
+environment_engine_model_cache = caches[
+    settings.ENVIRONMENT_ENGINE_MODEL_CACHE_LOCATION
+]
 bad_environments_cache = caches[settings.BAD_ENVIRONMENTS_CACHE_LOCATION]
 
 # Intialize the dynamo environment wrapper(s) globaly
@@ -146,6 +160,30 @@ class Environment(
     def clear_environment_cache(self):
         # TODO: this could rebuild the cache itself (using an async task)
         environment_cache.delete(self.initial_value("api_key"))
+        update_environment_cache_version()
+
+    @classmethod
+    def clear_environment_caches(cls, environment_ids: typing.Iterable[int]) -> None:
+        """
+        Remove the given environments (under any of their keys) from the
+        environment cache, e.g. after their `updated_at` value has been changed
+        by a queryset update, which doesn't trigger `clear_environment_cache`.
+        """
+        environment_ids = list(environment_ids)
+        if not environment_ids:
+            return
+
+        environment_cache.delete_many(
+            [
+                *cls.objects.filter(id__in=environment_ids).values_list(
+                    "api_key", flat=True
+                ),
+                *EnvironmentAPIKey.objects.filter(
+                    environment_id__in=environment_ids
+                ).values_list("key", flat=True),
+            ]
+        )
+        update_environment_cache_version()
 
     @hook(AFTER_DELETE)
     def delete_from_dynamo(self):
@@ -221,10 +259,15 @@ class Environment(
                 logger.warning("Requested environment with null api_key.")
                 return None
 
+            if environment := local_environment_cache.get(api_key):
+                return environment
+
             if cls.is_bad_key(api_key):
                 return None
 
+            local_cache_version = local_environment_cache.version
             environment = environment_cache.get(api_key)
+            record_cache_lookup(settings.ENVIRONMENT_CACHE_NAME, bool(environment))
             if not environment:
                 select_related_args = (
                     "project",
@@ -235,12 +278,18 @@ class Environment(
                     "description"
                 )
                 qs_for_embedded_api_key = base_qs.filter(api_key=api_key)
-                qs_for_fk_api_key = base_qs.filter(api_keys__key=api_key)
+                qs_for_fk_api_key = base_qs.filter(
+                    Q(api_keys__expires_at__isnull=True)
+                    | Q(api_keys__expires_at__gt=timezone.now()),
+                    api_keys__key=api_key,
+                    api_keys__active=True,
+                )
 
                 environment = qs_for_embedded_api_key.union(qs_for_fk_api_key).get()
                 environment_cache.set(
                     api_key, environment, timeout=settings.ENVIRONMENT_CACHE_SECONDS
                 )
+            local_environment_cache.set(api_key, environment, local_cache_version)
             return environment
         except cls.DoesNotExist:
             cls.set_bad_key(api_key)
@@ -262,7 +311,9 @@ class Environment(
                     Prefetch(
                         "feature_states",
                         queryset=FeatureState.objects.select_related(
-                            "feature", "feature_state_value"
+                            "feature",
+                            "feature_state_value",
+                            "environment_feature_version",
                         ),
                     ),
                     Prefetch(
@@ -342,6 +393,7 @@ class Environment(
         Get any segments that have been overridden in this environment.
         """
         segments = environment_segments_cache.get(self.id)
+        record_cache_lookup(settings.ENVIRONMENT_SEGMENTS_CACHE_NAME, bool(segments))
         if not segments:
             segments = list(
                 Segment.objects.filter(
@@ -361,10 +413,66 @@ class Environment(
     def get_environment_document(
         cls,
         api_key: str,
+        compact: bool = False,
     ) -> dict[str, typing.Any]:
+        """
+        Get the document used by SDKs in local evaluation mode. If `compact` is
+        set, the compact representation of the document is returned (see
+        `util.mappers.sdk.map_sdk_document_to_compact_sdk_document`).
+        """
         if settings.CACHE_ENVIRONMENT_DOCUMENT_SECONDS > 0:
-            return cls._get_environment_document_from_cache(api_key)
-        return cls._get_environment_document_from_db(api_key)
+            return cls._get_environment_document_from_cache(api_key, compact)
+        return cls._get_environment_document_from_db(api_key, compact)
+
+    @classmethod
+    def get_environment_engine_model(cls, api_key: str) -> EnvironmentModel:
+        """
+        Get the flag engine representation of the environment (without integrations).
+
+        The engine model is cached against the environment's `updated_at` value,
+        which is bumped whenever the environment or any of its related entities
+        (e.g. feature states, segments) change. Scheduled changes don't bump it
+        when they go live, so the cache timeout (CACHE_ENVIRONMENT_ENGINE_MODEL_SECONDS)
+        bounds how long they can take to be reflected.
+        """
+        updated_at = (
+            cls.objects.filter(api_key=api_key)
+            .values_list("updated_at", flat=True)
+            .get()
+        )
+        cache_key = f"{api_key}:{updated_at.timestamp()}"
+
+        environment_model = environment_engine_model_cache.get(cache_key)
+        record_cache_lookup(
+            settings.ENVIRONMENT_ENGINE_MODEL_CACHE_LOCATION,
+            environment_model is not None,
+        )
+        if environment_model is None:
+            environment = cls.objects.filter_for_document_builder(
+                api_key=api_key,
+                extra_prefetch_related=[
+                    Prefetch(
+                        "feature_states",
+                        queryset=FeatureState.objects.select_related(
+                            "feature",
+                            "feature_state_value",
+                            "environment_feature_version",
+                        ),
+                    ),
+                    Prefetch(
+                        "feature_states__multivariate_feature_state_values",
+                        queryset=MultivariateFeatureStateValue.objects.select_related(
+                            "multivariate_feature_option"
+                        ),
+                    ),
+                ],
+            ).get()
+            environment_model = map_environment_to_engine(
+                environment, with_integrations=False
+            )
+            environment_engine_model_cache.set(cache_key, environment_model)
+
+        return environment_model
 
     def get_create_log_message(self, history_instance) -> typing.Optional[str]:
         return ENVIRONMENT_CREATED_MESSAGE % self.name
@@ -382,17 +490,25 @@ class Environment(
     def _get_environment_document_from_cache(
         cls,
         api_key: str,
+        compact: bool = False,
     ) -> dict[str, typing.Any]:
-        environment_document = environment_document_cache.get(api_key)
+        cache_key = f"{api_key}:{COMPACT_SDK_DOCUMENT_FORMAT}" if compact else api_key
+        environment_document = environment_document_cache.get(cache_key)
+        record_cache_lookup(
+            settings.ENVIRONMENT_DOCUMENT_CACHE_LOCATION, bool(environment_document)
+        )
         if not environment_document:
-            environment_document = cls._get_environment_document_from_db(api_key)
-            environment_document_cache.set(api_key, environment_document)
+            environment_document = cls._get_environment_document_from_db(
+                api_key, compact
+            )
+            environment_document_cache.set(cache_key, environment_document)
         return environment_document
 
     @classmethod
     def _get_environment_document_from_db(
         cls,
         api_key: str,
+        compact: bool = False,
     ) -> dict[str, typing.Any]:
         environment = cls.objects.filter_for_document_builder(
             api_key=api_key,
@@ -427,7 +543,10 @@ class Environment(
                 ),
             ],
         ).get()
-        return map_environment_to_sdk_document(environment)
+        environment_document = map_environment_to_sdk_document(environment)
+        if compact:
+            return map_sdk_document_to_compact_sdk_document(environment_document)
+        return environment_document
 
     def _get_environment(self):
         return self
@@ -520,6 +639,15 @@ class EnvironmentAPIKey(LifecycleModel):
     def is_valid(self) -> bool:
         return self.active and (not self.expires_at or self.expires_at > timezone.now())
 
+    @hook(AFTER_SAVE)
+    @hook(AFTER_DELETE)
+    def clear_environment_cache(self):
+        # Make sure that any changes to the validity of the key (e.g. it being
+        # deactivated, deleted or reactivated) take effect immediately.
+        environment_cache.delete(self.key)
+        bad_environments_cache.delete(self.key)
+        update_environment_cache_version()
+
     @hook(AFTER_SAVE, when="_should_update_dynamo", is_now=True)
     def send_to_dynamo(self):
         environment_api_key_wrapper.write_api_key(self)
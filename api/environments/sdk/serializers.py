@@ -2,6 +2,8 @@ import typing
 from collections import defaultdict
 
 from core.constants import BOOLEAN, FLOAT, INTEGER, STRING
+from django.db import router
+from django.db.models import Q
 from django.utils import timezone
 from rest_framework import serializers
 
@@ -82,14 +84,44 @@ class SDKBulkCreateUpdateTraitSerializer(SDKCreateUpdateTraitSerializer):
 
             def save(self, **kwargs):
                 identity_trait_items = self._build_identifier_trait_items_dictionary()
-                modified_traits = []
+                identities = Identity.objects.get_or_create_in_bulk(
+                    identifiers=identity_trait_items,
+                    environment=self.context["request"].environment,
+                )
+
+                traits_to_upsert = []
+                delete_filter_query = Q()
                 for identifier, trait_data_items in identity_trait_items.items():
-                    identity, _ = Identity.objects.get_or_create(
-                        identifier=identifier,
-                        environment=self.context["request"].environment,
-                    )
-                    modified_traits.extend(identity.update_traits(trait_data_items))
-                return modified_traits
+                    identity = identities[identifier]
+                    for trait_data_item in trait_data_items:
+                        trait_key = trait_data_item["trait_key"]
+                        trait_value = trait_data_item["trait_value"]
+
+                        if trait_value is None:
+                            delete_filter_query |= Q(
+                                identity=identity, trait_key=trait_key
+                            )
+                            continue
+
+                        traits_to_upsert.append(
+                            Trait(
+                                **Trait.generate_trait_value_data(trait_value),
+                                trait_key=trait_key,
+                                identity=identity,
+                            )
+                        )
+
+                if delete_filter_query:
+                    Trait.objects.filter(delete_filter_query).delete()
+
+                Trait.objects.bulk_upsert(traits_to_upsert)
+
+                # return the full list of traits for the modified identities
+                return list(
+                    Trait.objects.using(router.db_for_write(Trait))
+                    .filter(identity__in=identities.values())
+                    .select_related("identity")
+                )
 
             def _build_identifier_trait_items_dictionary(
                 self,
@@ -185,3 +217,10 @@ class IdentifyWithTraitsSerializer(
                 "Setting traits not allowed with client key."
             )
         return traits
+
+
+class SDKEnvironmentDocumentDeltaQuerySerializer(serializers.Serializer):
+    since = serializers.FloatField(
+        required=False,
+        help_text="The `updated_at` timestamp of the document held by the SDK.",
+    )
@@ -0,0 +1,167 @@
+import typing
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+
+from environments.models import Environment
+
+environment_document_history_cache = caches[
+    settings.ENVIRONMENT_DOCUMENT_HISTORY_CACHE_LOCATION
+]
+
+DOCUMENT_TYPE_FULL = "full"
+DOCUMENT_TYPE_DELTA = "delta"
+
+# Keys of the documents that this process has already written to the history,
+# so that we don't write the same version of a document on every request.
+_RECORDED_VERSIONS_MAX_SIZE = 1000
+_recorded_versions: OrderedDict[str, None] = OrderedDict()
+
+# Fields of an identity override which are regenerated every time the document
+# is built, and hence shouldn't be compared.
+_IDENTITY_OVERRIDE_VOLATILE_FIELDS = ("identity_uuid",)
+
+# Fields of the document which are diffed separately.
+_ENVIRONMENT_COLLECTION_FIELDS = ("project", "feature_states", "identity_overrides")
+_PROJECT_COLLECTION_FIELDS = ("segments",)
+
+
+def get_document_version(environment_document: dict[str, typing.Any]) -> float:
+    return environment_document["updated_at"].timestamp()
+
+
+def record_environment_document(
+    api_key: str, environment_document: dict[str, typing.Any]
+) -> None:
+    """
+    Add the given document to the (bounded) history of documents for the
+    environment, so that it can be used as the base of a delta later.
+    """
+    if not settings.ENVIRONMENT_DOCUMENT_HISTORY_SECONDS:
+        return
+
+    key = _get_history_key(api_key, get_document_version(environment_document))
+    if key in _recorded_versions:
+        return
+
+    environment_document_history_cache.add(
+        key,
+        environment_document,
+        timeout=settings.ENVIRONMENT_DOCUMENT_HISTORY_SECONDS,
+    )
+
+    _recorded_versions[key] = None
+    if len(_recorded_versions) > _RECORDED_VERSIONS_MAX_SIZE:
+        _recorded_versions.popitem(last=False)
+
+
+def get_environment_document_delta(
+    api_key: str, since: float | None
+) -> dict[str, typing.Any]:
+    """
+    Get the changes made to the environment document since the given version
+    (i.e. the `updated_at` timestamp of the document held by the SDK).
+
+    If the given version is no longer in the history (or none is given), the
+    full document is returned instead.
+    """
+    environment_document = Environment.get_environment_document(api_key)
+    record_environment_document(api_key, environment_document)
+    version = get_document_version(environment_document)
+
+    base_document = None
+    if since == version:
+        base_document = environment_document
+    elif since is not None and settings.ENVIRONMENT_DOCUMENT_HISTORY_SECONDS:
+        base_document = environment_document_history_cache.get(
+            _get_history_key(api_key, since)
+        )
+
+    if base_document is None:
+        return {
+            "type": DOCUMENT_TYPE_FULL,
+            "updated_at": version,
+            "document": environment_document,
+        }
+
+    return {
+        "type": DOCUMENT_TYPE_DELTA,
+        "base_updated_at": since,
+        "updated_at": version,
+        **diff_environment_documents(base_document, environment_document),
+    }
+
+
+def diff_environment_documents(
+    base_document: dict[str, typing.Any],
+    environment_document: dict[str, typing.Any],
+) -> dict[str, typing.Any]:
+    return {
+        "environment": _diff_fields(
+            base_document, environment_document, _ENVIRONMENT_COLLECTION_FIELDS
+        ),
+        "project": _diff_fields(
+            base_document["project"],
+            environment_document["project"],
+            _PROJECT_COLLECTION_FIELDS,
+        ),
+        "feature_states": _diff_collection(
+            base_document["feature_states"],
+            environment_document["feature_states"],
+            key=lambda feature_state: feature_state["feature"]["id"],
+        ),
+        "segments": _diff_collection(
+            base_document["project"]["segments"],
+            environment_document["project"]["segments"],
+            key=lambda segment: segment["id"],
+        ),
+        "identity_overrides": _diff_collection(
+            base_document["identity_overrides"],
+            environment_document["identity_overrides"],
+            key=lambda identity: identity["identifier"],
+            exclude=_IDENTITY_OVERRIDE_VOLATILE_FIELDS,
+        ),
+    }
+
+
+def _diff_fields(
+    base: dict[str, typing.Any],
+    current: dict[str, typing.Any],
+    exclude: typing.Iterable[str],
+) -> dict[str, typing.Any]:
+    return {
+        field_name: value
+        for field_name, value in current.items()
+        if field_name not in exclude and base.get(field_name) != value
+    }
+
+
+def _diff_collection(
+    base: list[dict[str, typing.Any]],
+    current: list[dict[str, typing.Any]],
+    key: typing.Callable[[dict[str, typing.Any]], typing.Hashable],
+    exclude: typing.Iterable[str] = (),
+) -> dict[str, list]:
+    def _comparable(item: dict[str, typing.Any]) -> dict[str, typing.Any]:
+        return {k: v for k, v in item.items() if k not in exclude}
+
+    base_items = {key(item): _comparable(item) for item in base}
+    current_keys = set()
+    updated = []
+    for item in current:
+        item_key = key(item)
+        current_keys.add(item_key)
+        if base_items.get(item_key) != _comparable(item):
+            updated.append(item)
+
+    return {
+        "updated": updated,
+        "removed": [
+            item_key for item_key in base_items if item_key not in current_keys
+        ],
+    }
+
+
+def _get_history_key(api_key: str, version: float) -> str:
+    return f"{api_key}:{version}"
@@ -1,6 +1,10 @@
-from core.constants import FLAGSMITH_UPDATED_AT_HEADER
+from core.constants import (
+    FLAGSMITH_DOCUMENT_FORMAT_HEADER,
+    FLAGSMITH_UPDATED_AT_HEADER,
+)
 from django.http import HttpRequest
 from drf_yasg.utils import swagger_auto_schema
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
@@ -8,10 +12,20 @@ from environments.authentication import EnvironmentKeyAuthentication
 from environments.models import Environment
 from environments.permissions.permissions import EnvironmentKeyPermissions
 from environments.sdk.schemas import SDKEnvironmentDocumentModel
+from environments.sdk.serializers import (
+    SDKEnvironmentDocumentDeltaQuerySerializer,
+)
+from environments.sdk.services import (
+    get_environment_document_delta,
+    record_environment_document,
+)
+from util.mappers.sdk import COMPACT_SDK_DOCUMENT_FORMAT
+from util.renderers import SDKJSONRenderer
 
 
 class SDKEnvironmentAPIView(APIView):
     permission_classes = (EnvironmentKeyPermissions,)
+    renderer_classes = (SDKJSONRenderer, BrowsableAPIRenderer)
     throttle_classes = []
 
     def get_authenticators(self):
@@ -19,11 +33,50 @@ class SDKEnvironmentAPIView(APIView):
 
     @swagger_auto_schema(responses={200: SDKEnvironmentDocumentModel})
     def get(self, request: HttpRequest) -> Response:
+        # The classic document format is served unless the SDK asks for the
+        # compact one.
+        compact = (
+            request.headers.get(FLAGSMITH_DOCUMENT_FORMAT_HEADER, "").lower()
+            == COMPACT_SDK_DOCUMENT_FORMAT
+        )
         environment_document = Environment.get_environment_document(
-            request.environment.api_key
+            request.environment.api_key, compact=compact
         )
+        if not compact:
+            record_environment_document(
+                request.environment.api_key, environment_document
+            )
         updated_at = self.request.environment.updated_at
+        headers = {FLAGSMITH_UPDATED_AT_HEADER: updated_at.timestamp()}
+        if compact:
+            headers[FLAGSMITH_DOCUMENT_FORMAT_HEADER] = COMPACT_SDK_DOCUMENT_FORMAT
+        return Response(environment_document, headers=headers)
+
+
+class SDKEnvironmentDeltaAPIView(APIView):
+    permission_classes = (EnvironmentKeyPermissions,)
+    renderer_classes = (SDKJSONRenderer, BrowsableAPIRenderer)
+    throttle_classes = []
+
+    def get_authenticators(self):
+        return [EnvironmentKeyAuthentication(required_key_prefix="ser.")]
+
+    @swagger_auto_schema(query_serializer=SDKEnvironmentDocumentDeltaQuerySerializer())
+    def get(self, request: HttpRequest) -> Response:
+        """
+        Get the changes made to the environment document since the version given
+        by `since`. If that version is no longer available, the full document is
+        returned instead (as indicated by the `type` of the response).
+        """
+        query_serializer = SDKEnvironmentDocumentDeltaQuerySerializer(
+            data=request.query_params
+        )
+        query_serializer.is_valid(raise_exception=True)
+
+        delta = get_environment_document_delta(
+            request.environment.api_key,
+            since=query_serializer.validated_data.get("since"),
+        )
         return Response(
-            environment_document,
-            headers={FLAGSMITH_UPDATED_AT_HEADER: updated_at.timestamp()},
+            delta, headers={FLAGSMITH_UPDATED_AT_HEADER: delta["updated_at"]}
         )
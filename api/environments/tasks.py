@@ -1,3 +1,4 @@
+from django.utils import timezone
 from task_processor.decorators import register_task_handler
 from task_processor.models import TaskPriority
 
@@ -19,6 +20,11 @@ def rebuild_environment_document(environment_id: int) -> None:
     Environment.write_environments_to_dynamodb(environment_id=environment_id)
 
 
+@register_task_handler(priority=TaskPriority.HIGH)
+def rebuild_project_environment_documents(project_id: int) -> None:
+    Environment.write_environments_to_dynamodb(project_id=project_id)
+
+
 @register_task_handler(priority=TaskPriority.HIGHEST)
 def process_environment_update(audit_log_id: int):
     audit_log = AuditLog.objects.get(id=audit_log_id)
@@ -35,6 +41,30 @@ def process_environment_update(audit_log_id: int):
         send_environment_update_message_for_project(audit_log.project)
 
 
+@register_task_handler(priority=TaskPriority.HIGHEST)
+def process_scheduled_environment_update(environment_id: int) -> None:
+    """
+    Run at the point that a scheduled change (e.g. a feature version with a
+    `live_from` in the future) goes live, so that anything keyed on the
+    environment's `updated_at` is refreshed, and connected clients are
+    notified, at the moment the change becomes visible.
+    """
+    environment = Environment.objects.filter(id=environment_id).first()
+    if environment is None:
+        # The environment was deleted before the change went live.
+        return
+
+    environment.updated_at = timezone.now()
+    Environment.objects.filter(id=environment_id).update(
+        updated_at=environment.updated_at
+    )
+    Environment.clear_environment_caches([environment_id])
+
+    Environment.write_environments_to_dynamodb(environment_id=environment_id)
+
+    send_environment_update_message_for_environment(environment)
+
+
 @register_task_handler()
 def delete_environment_from_dynamo(api_key: str, environment_id: str):
     # Delete environment
@@ -1,7 +1,10 @@
 import typing
 from concurrent.futures import ThreadPoolExecutor
 
+from django.db.models import Q
+
 from edge_api.identities.edge_identity_service import (
+    get_edge_identity_override_counts,
     get_edge_identity_overrides,
 )
 from features.dataclasses import EnvironmentFeatureOverridesData
@@ -16,11 +19,13 @@ OverridesData = dict[int, EnvironmentFeatureOverridesData]
 
 def get_overrides_data(
     environment: "Environment",
+    feature_ids: typing.Iterable[int] | None = None,
 ) -> OverridesData:
     """
     Get correct overrides counts for a given environment.
 
     :param project: project to get overrides data for
+    :param feature_ids: if given, only count the overrides for these features
     :return: overrides data getter
     """
     project = environment.project
@@ -29,21 +34,23 @@ def get_overrides_data(
         if project.edge_v2_identity_overrides_migrated:
             # If v2 migration is complete, count segment overrides from Core
             # and identity overrides from DynamoDB.
-            return get_edge_overrides_data(environment)
+            return get_edge_overrides_data(environment, feature_ids=feature_ids)
         # If v2 migration is not started, in progress, or incomplete,
         # only count segment overrides from Core.
         # v1 Edge identity overrides are uncountable.
         return get_core_overrides_data(
             environment,
+            feature_ids=feature_ids,
             skip_identity_overrides=True,
         )
     # For projects still fully on Core, count all overrides from Core.
-    return get_core_overrides_data(environment)
+    return get_core_overrides_data(environment, feature_ids=feature_ids)
 
 
 def get_core_overrides_data(
     environment: "Environment",
     *,
+    feature_ids: typing.Iterable[int] | None = None,
     skip_identity_overrides: bool = False,
 ) -> OverridesData:
     """
@@ -51,9 +58,13 @@ def get_core_overrides_data(
     project.
 
     :param environment: the environment to get the overrides data for
+    :param feature_ids: if given, only count the overrides for these features
     :return OverridesData: dictionary of {feature_id: EnvironmentFeatureOverridesData}
     """
-    environment_feature_states_list = get_environment_flags_list(environment)
+    environment_feature_states_list = get_environment_flags_list(
+        environment,
+        additional_filters=_get_feature_ids_filter(feature_ids),
+    )
     all_overrides_data: OverridesData = {}
 
     for feature_state in environment_feature_states_list:
@@ -72,24 +83,40 @@ def get_core_overrides_data(
 
 def get_edge_overrides_data(
     environment: "Environment",
+    feature_ids: typing.Iterable[int] | None = None,
 ) -> OverridesData:
     """
     Get the number of identity / segment overrides in a given environment for each feature in the
     project.
     Retrieve identity override data from DynamoDB.
 
+    When feature_ids are given, the identity overrides for each of those features are
+    counted by DynamoDB, rather than reading every identity override in the environment.
+
     :param environment: the environment to get the overrides data for
+    :param feature_ids: if given, only count the overrides for these features
     :return OverridesData: dictionary of {feature_id: EnvironmentFeatureOverridesData}
     """
+    if feature_ids is not None:
+        feature_ids = list(feature_ids)
+
     with ThreadPoolExecutor() as executor:
         get_environment_flags_list_future = executor.submit(
             get_environment_flags_list,
             environment,
+            additional_filters=_get_feature_ids_filter(feature_ids),
         )
-        get_overrides_data_future = executor.submit(
-            get_edge_identity_overrides,
-            environment_id=environment.id,
-        )
+        if feature_ids is not None:
+            get_override_counts_future = executor.submit(
+                get_edge_identity_override_counts,
+                environment_id=environment.id,
+                feature_ids=feature_ids,
+            )
+        else:
+            get_overrides_data_future = executor.submit(
+                get_edge_identity_overrides,
+                environment_id=environment.id,
+            )
     all_overrides_data: OverridesData = {}
 
     for feature_state in get_environment_flags_list_future.result():
@@ -98,6 +125,14 @@ def get_edge_overrides_data(
         )
         if feature_state.feature_segment_id:
             env_feature_overrides_data.num_segment_overrides += 1
+
+    if feature_ids is not None:
+        for feature_id, count in get_override_counts_future.result().items():
+            # Only override features that exists in core
+            if count and feature_id in all_overrides_data:
+                all_overrides_data[feature_id].num_identity_overrides = count
+        return all_overrides_data
+
     for identity_override in get_overrides_data_future.result():
         # Only override features that exists in core
         if identity_override.feature_state.feature.id in all_overrides_data:
@@ -106,3 +141,9 @@ def get_edge_overrides_data(
             ].add_identity_override()
 
     return all_overrides_data
+
+
+def _get_feature_ids_filter(feature_ids: typing.Iterable[int] | None) -> Q | None:
+    if feature_ids is None:
+        return None
+    return Q(feature_id__in=feature_ids)
@@ -1,18 +1,30 @@
 import json
 from datetime import timedelta
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 from django.conf import settings
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import Prefetch, Q, prefetch_related_objects
 from django.utils import timezone
+from simple_history.utils import (
+    bulk_create_with_history,
+    bulk_update_with_history,
+)
 from task_processor.decorators import (
     register_recurring_task,
     register_task_handler,
 )
 
+from audit.constants import FEATURES_IMPORTED_MESSAGE
+from audit.models import AuditLog
+from audit.related_object_type import RelatedObjectType
 from environments.models import Environment
-from features.models import Feature, FeatureStateValue
-from features.multivariate.models import MultivariateFeatureOption
+from features.feature_types import MULTIVARIATE, STANDARD
+from features.models import Feature, FeatureState, FeatureStateValue
+from features.multivariate.models import (
+    MultivariateFeatureOption,
+    MultivariateFeatureStateValue,
+)
 from features.value_types import BOOLEAN, INTEGER, STRING
 from features.versioning.versioning_service import get_environment_flags_list
 from projects.models import Project
@@ -79,6 +91,14 @@ def _export_features_for_environment(
     feature_states = get_environment_flags_list(
         environment=environment,
         additional_filters=additional_filters,
+        additional_prefetch_related_args=[
+            Prefetch(
+                "multivariate_feature_state_values",
+                queryset=MultivariateFeatureStateValue.objects.select_related(
+                    "multivariate_feature_option"
+                ),
+            )
+        ],
     )
 
     payload = []
@@ -90,9 +110,7 @@ def _export_features_for_environment(
                 "value": mv_fsv.multivariate_feature_option.value,
                 "type": mv_fsv.multivariate_feature_option.type,
             }
-            for mv_fsv in feature_state.multivariate_feature_state_values.select_related(
-                "multivariate_feature_option"
-            ).all()
+            for mv_fsv in feature_state.multivariate_feature_state_values.all()
         ]
 
         payload.append(
@@ -144,28 +162,46 @@ def _import_features_for_environment(feature_import: FeatureImport) -> None:
     input_data = json.loads(feature_import.data)
     project = environment.project
 
+    # If a feature appears more than once in the data, the skip strategy keeps
+    # the first occurrence and overwriting keeps the last, as if each row had
+    # been imported in turn.
+    features_data = {}
     for feature_data in input_data:
-        existing_feature = Feature.objects.filter(
-            name=feature_data["name"],
-            project=project,
-        ).first()
+        if feature_import.strategy == SKIP:
+            features_data.setdefault(feature_data["name"], feature_data)
+        else:
+            features_data[feature_data["name"]] = feature_data
 
-        if existing_feature:
-            # Leave existing features completely alone.
-            if feature_import.strategy == SKIP:
-                continue
-
-            # First destroy existing features that overlap.
-            if feature_import.strategy == OVERWRITE_DESTRUCTIVE:
-                existing_feature.delete()
-
-        _create_new_feature(feature_data, project, environment)
+    for existing_feature in Feature.objects.filter(
+        project=project, name__in=features_data
+    ):
+        # Leave existing features completely alone.
+        if feature_import.strategy == SKIP:
+            features_data.pop(existing_feature.name, None)
+
+        # First destroy existing features that overlap.
+        elif feature_import.strategy == OVERWRITE_DESTRUCTIVE:
+            existing_feature.delete()
+
+    if features_data:
+        _create_new_features(features_data, project, environment)
+        # Since the features were created in bulk, none of their audit logs
+        # were created. A single (project level) one is created instead, so that
+        # every environment in the project is updated (e.g. their `updated_at`
+        # values, caches and documents) in one go.
+        AuditLog.objects.create(
+            project=project,
+            related_object_id=feature_import.id,
+            related_object_type=RelatedObjectType.IMPORT_REQUEST.name,
+            log=FEATURES_IMPORTED_MESSAGE % environment.name,
+            is_system_event=True,
+        )
 
     feature_import.status = SUCCESS
     feature_import.save()
 
 
-def _save_feature_state_value_with_type(
+def _set_feature_state_value_with_type(
     value: Optional[Union[int, bool, str]],
     type: str,
     feature_state_value: FeatureStateValue,
@@ -179,10 +215,8 @@ def _save_feature_state_value_with_type(
         assert feature_state_value.type == STRING
         feature_state_value.string_value = value
 
-    feature_state_value.save()
-
 
-def _create_multivariate_feature_option(
+def _build_multivariate_feature_option(
     value: Optional[Union[int, bool, str]],
     type: str,
     feature: Feature,
@@ -201,47 +235,104 @@ def _create_multivariate_feature_option(
         assert mvfo.type == STRING
         mvfo.string_value = value
 
-    mvfo.save()
     return mvfo
 
 
-def _create_new_feature(
-    feature_data: dict[str, Optional[Union[bool, str, int]]],
+def _create_new_features(
+    features_data: dict[str, dict[str, Any]],
     project: Project,
     environment: Environment,
 ) -> None:
-    feature = Feature.objects.create(
-        name=feature_data["name"],
-        project=project,
-        initial_value=feature_data["initial_value"],
-        is_server_key_only=feature_data["is_server_key_only"],
-        default_enabled=feature_data["default_enabled"],
-    )
-    feature_state = feature.feature_states.get(
-        environment=environment,
-    )
+    """
+    Create the given features (along with their multivariate options and the
+    default feature states in every environment in the project) in bulk, and
+    then apply the imported values to the feature states in the environment
+    being imported into.
 
-    for mv_data in feature_data["multivariate"]:
-        mv_feature_option = _create_multivariate_feature_option(
-            value=mv_data["value"],
-            type=mv_data["type"],
-            feature=feature,
-            default_percentage_allocation=mv_data["default_percentage_allocation"],
+    Note that, since the lifecycle hooks are bypassed, it is the caller's
+    responsibility to update the project's environments afterwards.
+    """
+    features = []
+    multivariate_options = []
+    for feature_data in features_data.values():
+        feature = Feature(
+            name=feature_data["name"],
+            project=project,
+            initial_value=feature_data["initial_value"],
+            is_server_key_only=feature_data["is_server_key_only"],
+            default_enabled=feature_data["default_enabled"],
+            type=MULTIVARIATE if feature_data["multivariate"] else STANDARD,
+        )
+        features.append(feature)
+
+        for mv_data in feature_data["multivariate"]:
+            mv_feature_option = _build_multivariate_feature_option(
+                value=mv_data["value"],
+                type=mv_data["type"],
+                feature=feature,
+                default_percentage_allocation=mv_data["default_percentage_allocation"],
+            )
+            multivariate_options.append(
+                (mv_feature_option, mv_data["percentage_allocation"])
+            )
+
+    with transaction.atomic():
+        bulk_create_with_history(features, Feature)
+        bulk_create_with_history(
+            [mv_feature_option for mv_feature_option, _ in multivariate_options],
+            MultivariateFeatureOption,
+        )
+        prefetch_related_objects(features, "multivariate_options")
+
+        feature_states = {
+            feature_state.id: feature_state
+            for feature_state in FeatureState.create_initial_feature_states_for_features(
+                features, project
+            )
+            if feature_state.environment_id == environment.id
+        }
+        for feature_state in feature_states.values():
+            feature_state.enabled = features_data[feature_state.feature.name]["enabled"]
+        bulk_update_with_history(
+            list(feature_states.values()), FeatureState, ["enabled"]
+        )
+
+        feature_state_values = list(
+            FeatureStateValue.objects.filter(feature_state_id__in=feature_states)
+        )
+        for feature_state_value in feature_state_values:
+            feature_data = features_data[
+                feature_states[feature_state_value.feature_state_id].feature.name
+            ]
+            _set_feature_state_value_with_type(
+                value=feature_data["value"],
+                type=feature_data["type"],
+                feature_state_value=feature_state_value,
+            )
+        bulk_update_with_history(
+            feature_state_values,
+            FeatureStateValue,
+            ["type", "integer_value", "boolean_value", "string_value"],
+        )
+
+        percentage_allocations = {
+            mv_feature_option.id: percentage_allocation
+            for mv_feature_option, percentage_allocation in multivariate_options
+        }
+        mv_feature_state_values = list(
+            MultivariateFeatureStateValue.objects.filter(
+                feature_state_id__in=feature_states
+            )
+        )
+        for mv_feature_state_value in mv_feature_state_values:
+            mv_feature_state_value.percentage_allocation = percentage_allocations[
+                mv_feature_state_value.multivariate_feature_option_id
+            ]
+        bulk_update_with_history(
+            mv_feature_state_values,
+            MultivariateFeatureStateValue,
+            ["percentage_allocation"],
         )
-        mv_feature_state_value = feature_state.multivariate_feature_state_values.filter(
-            multivariate_feature_option=mv_feature_option
-        ).first()
-        mv_feature_state_value.percentage_allocation = mv_data["percentage_allocation"]
-        mv_feature_state_value.save()
-
-    feature_state_value = feature_state.feature_state_value
-    _save_feature_state_value_with_type(
-        value=feature_data["value"],
-        type=feature_data["type"],
-        feature_state_value=feature_state_value,
-    )
-    feature_state.enabled = feature_data["enabled"]
-    feature_state.save()
 
 
 # Should only run on official flagsmith instance.
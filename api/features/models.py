@@ -17,7 +17,7 @@ from django.core.exceptions import (
     ObjectDoesNotExist,
     ValidationError,
 )
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Max, Q, QuerySet
 from django.utils import timezone
 from django_lifecycle import (
@@ -31,6 +31,7 @@ from django_lifecycle import (
 )
 from ordered_model.models import OrderedModelBase
 from simple_history.models import HistoricalRecords
+from simple_history.utils import bulk_create_with_history
 
 from audit.constants import (
     FEATURE_CREATED_MESSAGE,
@@ -46,7 +47,10 @@ from audit.constants import (
     SEGMENT_FEATURE_STATE_VALUE_UPDATED_MESSAGE,
 )
 from audit.related_object_type import RelatedObjectType
-from audit.tasks import create_segment_priorities_changed_audit_log
+from audit.tasks import (
+    create_audit_logs_for_bulk_created_objects,
+    create_segment_priorities_changed_audit_log,
+)
 from environments.identities.helpers import (
     get_hashed_percentage_for_object_ids,
 )
@@ -832,35 +836,139 @@ class FeatureState(
     def create_initial_feature_states_for_environment(
         cls, environment: "Environment"
     ) -> None:
-        for feature in environment.project.features.all():
-            cls._create_initial_feature_state(feature=feature, environment=environment)
+        features = environment.project.features.select_related(
+            "project"
+        ).prefetch_related("multivariate_options")
+        cls._bulk_create_initial_feature_states(
+            features=list(features), environments=[environment]
+        )
 
     @classmethod
     def create_initial_feature_states_for_feature(cls, feature: "Feature") -> None:
-        for environment in feature.project.environments.all():
-            cls._create_initial_feature_state(feature=feature, environment=environment)
+        environments = feature.project.environments.select_related("project")
+        cls._bulk_create_initial_feature_states(
+            features=[feature], environments=list(environments)
+        )
 
     @classmethod
-    def _create_initial_feature_state(
-        cls, feature: "Feature", environment: "Environment"
-    ) -> None:
-        kwargs = {
-            "feature": feature,
-            "environment": environment,
-            "enabled": (
-                False
-                if environment.project.prevent_flag_defaults
-                else feature.default_enabled
-            ),
-        }
-        if environment.use_v2_feature_versioning:
-            kwargs.update(
-                environment_feature_version=EnvironmentFeatureVersion.create_initial_version(
-                    environment=environment, feature=feature
+    def create_initial_feature_states_for_features(
+        cls, features: typing.List["Feature"], project: "Project"
+    ) -> typing.List["FeatureState"]:
+        """
+        Create the environment default feature states for features which were
+        created in bulk (and hence never ran the `create_feature_states` hook).
+
+        Note that the environment documents are not rebuilt here, so that the
+        caller can do so once, after it has finished with the feature states.
+        """
+        environments = project.environments.select_related("project")
+        return cls._bulk_create_initial_feature_states(
+            features=features,
+            environments=list(environments),
+            rebuild_environment_documents=False,
+        )
+
+    @classmethod
+    def _bulk_create_initial_feature_states(
+        cls,
+        features: typing.List["Feature"],
+        environments: typing.List["Environment"],
+        rebuild_environment_documents: bool = True,
+    ) -> typing.List["FeatureState"]:
+        """
+        Create the environment default feature states (and their related values
+        and versions) for every feature / environment combination provided.
+
+        This is only used when a feature or an environment has just been created,
+        so the duplicate checks performed by the lifecycle hooks are not required,
+        and the related objects are written in bulk instead of row by row. Since
+        this bypasses the per-row save hooks, the environment document(s) are
+        rebuilt once all the feature states exist (unless the caller opts out).
+        """
+        if not (features and environments):
+            return []
+
+        now = timezone.now()
+
+        environment_feature_versions = []
+        feature_states = []
+        multivariate_feature_state_values = []
+
+        for environment in environments:
+            prevent_flag_defaults = environment.project.prevent_flag_defaults
+            for feature in features:
+                feature_state = cls(
+                    feature=feature,
+                    environment=environment,
+                    enabled=False if prevent_flag_defaults else feature.default_enabled,
                 )
+                if environment.use_v2_feature_versioning:
+                    environment_feature_version = EnvironmentFeatureVersion(
+                        environment=environment,
+                        feature=feature,
+                        published_at=now,
+                        live_from=now,
+                    )
+                    environment_feature_versions.append(environment_feature_version)
+                    feature_state.environment_feature_version = (
+                        environment_feature_version
+                    )
+                else:
+                    feature_state.live_from = now
+
+                feature_states.append(feature_state)
+                multivariate_feature_state_values.extend(
+                    MultivariateFeatureStateValue(
+                        feature_state=feature_state,
+                        multivariate_feature_option=mv_option,
+                        percentage_allocation=mv_option.default_percentage_allocation,
+                    )
+                    for mv_option in feature.multivariate_options.all()
+                )
+
+        with transaction.atomic():
+            if environment_feature_versions:
+                bulk_create_with_history(
+                    environment_feature_versions, EnvironmentFeatureVersion
+                )
+            bulk_create_with_history(feature_states, cls)
+            bulk_create_with_history(
+                [
+                    FeatureStateValue(
+                        feature_state=feature_state,
+                        **feature_state.get_feature_state_value_defaults(),
+                    )
+                    for feature_state in feature_states
+                ],
+                FeatureStateValue,
+            )
+            MultivariateFeatureStateValue.objects.bulk_create(
+                multivariate_feature_state_values
             )
+            create_audit_logs_for_bulk_created_objects(feature_states, cls)
 
-        cls.objects.create(**kwargs)
+        if rebuild_environment_documents:
+            cls._rebuild_environment_documents(environments)
+
+        return feature_states
+
+    @staticmethod
+    def _rebuild_environment_documents(
+        environments: typing.List["Environment"],
+    ) -> None:
+        from environments.tasks import (
+            rebuild_environment_document,
+            rebuild_project_environment_documents,
+        )
+
+        if len(environments) == 1:
+            rebuild_environment_document.delay(
+                kwargs={"environment_id": environments[0].id}
+            )
+        else:
+            rebuild_project_environment_documents.delay(
+                kwargs={"project_id": environments[0].project_id}
+            )
 
     @classmethod
     def get_next_version_number(
@@ -445,6 +445,44 @@ class SDKFeatureStateSerializer(
         "feature_segment",
     )
 
+    _created_date_field = serializers.DateTimeField()
+
+    def to_representation(self, instance: FeatureState) -> dict[str, typing.Any]:
+        # This is serialized for every flag in every SDK request, so the data
+        # is built directly (in the same order, and with the same values, as
+        # the declared fields would give) rather than field by field.
+        feature = instance.feature
+        feature_data = {
+            "id": feature.id,
+            "name": feature.name,
+            "created_date": (
+                self._created_date_field.to_representation(feature.created_date)
+                if feature.created_date
+                else None
+            ),
+            "description": feature.description,
+            "initial_value": feature.initial_value,
+            "default_enabled": feature.default_enabled,
+            "type": feature.type,
+        }
+        data = {
+            "id": instance.id,
+            "feature": feature_data,
+            "feature_state_value": self.get_feature_state_value(instance),
+            "environment": instance.environment_id,
+            "identity": instance.identity_id,
+            "feature_segment": instance.feature_segment_id,
+            "enabled": instance.enabled,
+        }
+
+        if self.context["request"].environment.hide_sensitive_data:
+            for field in SDKFeatureSerializer.sensitive_fields:
+                feature_data[field] = None
+            for field in self.sensitive_fields:
+                data[field] = None
+
+        return data
+
 
 class FeatureStateSerializerBasic(WritableNestedModelSerializer):
     feature_state_value = serializers.SerializerMethodField()
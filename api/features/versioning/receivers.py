@@ -2,7 +2,10 @@ from django.db.models.signals import post_init, post_save, pre_save
 from django.dispatch import receiver
 from django.utils import timezone
 
-from environments.tasks import rebuild_environment_document
+from environments.tasks import (
+    process_scheduled_environment_update,
+    rebuild_environment_document,
+)
 from features.versioning.models import EnvironmentFeatureVersion
 from features.versioning.signals import environment_feature_version_published
 from features.versioning.tasks import (
@@ -41,6 +44,15 @@ def cache_fields(instance: EnvironmentFeatureVersion, **kwargs):
 
 @receiver(environment_feature_version_published, sender=EnvironmentFeatureVersion)
 def update_environment_document(instance: EnvironmentFeatureVersion, **kwargs):
+    if instance.live_from and instance.live_from > timezone.now():
+        # The version is scheduled, so we need to make sure that the environment
+        # is marked as updated (and clients notified) once it actually goes live.
+        process_scheduled_environment_update.delay(
+            kwargs={"environment_id": instance.environment_id},
+            delay_until=instance.live_from,
+        )
+        return
+
     rebuild_environment_document.delay(
         kwargs={"environment_id": instance.environment_id},
         delay_until=instance.live_from,
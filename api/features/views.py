@@ -6,11 +6,15 @@ from app_analytics.analytics_db_service import get_feature_evaluation_data
 from app_analytics.influxdb_wrapper import get_multiple_event_list_for_feature
 from core.constants import FLAGSMITH_UPDATED_AT_HEADER
 from core.request_origin import RequestOrigin
+from core.request_profiling import (
+    SECTION_SERIALIZATION,
+    profile_section,
+    record_cache_lookup,
+)
 from django.conf import settings
 from django.core.cache import caches
 from django.db.models import Max, Q, QuerySet
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import mixins, serializers, status, viewsets
@@ -18,12 +22,15 @@ from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.generics import GenericAPIView, get_object_or_404
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
 
 from app.pagination import CustomPagination
 from environments.authentication import EnvironmentKeyAuthentication
+from environments.cache import (
+    cache_sdk_response,
+    get_environment_version_cache_key,
+)
 from environments.identities.models import Identity
 from environments.identities.serializers import (
     IdentityAllFeatureStatesSerializer,
@@ -38,6 +45,7 @@ from features.value_types import BOOLEAN, INTEGER, STRING
 from projects.models import Project
 from projects.permissions import VIEW_PROJECT
 from users.models import FFAdminUser, UserPermissionGroup
+from util.renderers import SDKJSONRenderer
 from webhooks.webhooks import WebhookEventType
 
 from .constants import INTERSECTION, UNION
@@ -214,7 +222,14 @@ class FeatureViewSet(viewsets.ModelViewSet):
             environment = get_object_or_404(
                 Environment, id=self.request.query_params["environment"]
             )
-            context["overrides_data"] = get_overrides_data(environment)
+            # Only count the overrides for the features on the current page.
+            page = getattr(self, "_page", None)
+            context["overrides_data"] = get_overrides_data(
+                environment,
+                feature_ids=(
+                    [feature.id for feature in page] if page is not None else None
+                ),
+            )
 
         return context
 
@@ -760,7 +775,7 @@ class SDKFeatureStates(GenericAPIView):
     serializer_class = SDKFeatureStateSerializer
     permission_classes = (EnvironmentKeyPermissions,)
     authentication_classes = (EnvironmentKeyAuthentication,)
-    renderer_classes = [JSONRenderer]
+    renderer_classes = [SDKJSONRenderer]
     pagination_class = None
     throttle_classes = []
 
@@ -769,7 +784,7 @@ class SDKFeatureStates(GenericAPIView):
         responses={200: FeatureStateSerializerFull(many=True)},
     )
     @method_decorator(
-        cache_page(
+        cache_sdk_response(
             timeout=settings.GET_FLAGS_ENDPOINT_CACHE_SECONDS,
             cache=settings.GET_FLAGS_ENDPOINT_CACHE_NAME,
         )
@@ -799,18 +814,14 @@ class SDKFeatureStates(GenericAPIView):
                     status=status.HTTP_404_NOT_FOUND,
                 )
 
-            return Response(self.get_serializer(feature_states[0]).data)
+            with profile_section(SECTION_SERIALIZATION):
+                data = self.get_serializer(feature_states[0]).data
+            return Response(data)
 
         if settings.CACHE_FLAGS_SECONDS > 0:
-            data = self._get_flags_from_cache(request.environment)
+            data = self._get_flags_from_cache(request)
         else:
-            data = self.get_serializer(
-                get_environment_flags_list(
-                    environment=request.environment,
-                    additional_filters=self._additional_filters,
-                ),
-                many=True,
-            ).data
+            data = self._serialize_flags(request.environment)
 
         updated_at = self.request.environment.updated_at
         return Response(
@@ -830,20 +841,26 @@ class SDKFeatureStates(GenericAPIView):
 
         return filters
 
-    def _get_flags_from_cache(self, environment):
-        data = flags_cache.get(environment.api_key)
+    def _get_flags_from_cache(self, request):
+        # The flags depend on the type of key used (see `_additional_filters`)
+        # and the key changes whenever the environment is updated.
+        cache_key = get_environment_version_cache_key(request)
+        data = flags_cache.get(cache_key)
+        record_cache_lookup(settings.FLAGS_CACHE_LOCATION, bool(data))
         if not data:
-            data = self.get_serializer(
-                get_environment_flags_list(
-                    environment=environment,
-                    additional_filters=self._additional_filters,
-                ),
-                many=True,
-            ).data
-            flags_cache.set(environment.api_key, data, settings.CACHE_FLAGS_SECONDS)
+            data = self._serialize_flags(request.environment)
+            flags_cache.set(cache_key, data, settings.CACHE_FLAGS_SECONDS)
 
         return data
 
+    def _serialize_flags(self, environment):
+        feature_states = get_environment_flags_list(
+            environment=environment,
+            additional_filters=self._additional_filters,
+        )
+        with profile_section(SECTION_SERIALIZATION):
+            return self.get_serializer(feature_states, many=True).data
+
     def _get_flags_response_with_identifier(self, request, identifier):
         identity, _ = Identity.objects.get_or_create(
             identifier=identifier, environment=request.environment
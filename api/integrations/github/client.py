@@ -4,6 +4,7 @@ from typing import Any
 
 import requests
 from django.conf import settings
+from django.core.cache import caches
 from github import Auth, Github
 
 from integrations.github.constants import (
@@ -20,6 +21,12 @@ from integrations.github.models import GithubConfiguration
 
 logger = logging.getLogger(__name__)
 
+github_cache = caches[settings.GITHUB_CACHE_NAME]
+
+# Comments are posted through a single session so that the connection to the
+# GitHub API is reused when a change is commented on many issues / PRs.
+github_session = requests.Session()
+
 
 class ResourceType(Enum):
     ISSUES = "issue"
@@ -32,10 +39,7 @@ def build_request_headers(
     token = (
         generate_jwt_token(settings.GITHUB_APP_ID)
         if use_jwt
-        else generate_token(
-            installation_id,
-            settings.GITHUB_APP_ID,
-        )
+        else get_installation_token(installation_id)
     )
 
     return {
@@ -45,6 +49,23 @@ def build_request_headers(
     }
 
 
+def get_installation_token(installation_id: str) -> str:
+    cache_key = _get_installation_token_cache_key(installation_id)
+    if token := github_cache.get(cache_key):
+        return token
+
+    token = generate_token(installation_id, settings.GITHUB_APP_ID)
+    if settings.GITHUB_INSTALLATION_TOKEN_CACHE_SECONDS:
+        github_cache.set(
+            cache_key, token, timeout=settings.GITHUB_INSTALLATION_TOKEN_CACHE_SECONDS
+        )
+    return token
+
+
+def clear_installation_token(installation_id: str) -> None:
+    github_cache.delete(_get_installation_token_cache_key(installation_id))
+
+
 # TODO: Add test coverage for this function
 def generate_token(installation_id: str, app_id: int) -> str:  # pragma: no cover
     auth: Auth.AppInstallationAuth = Auth.AppAuth(
@@ -100,7 +121,21 @@ def post_comment_to_github(
     url = f"{GITHUB_API_URL}repos/{owner}/{repo}/issues/{issue}/comments"
     headers = build_request_headers(installation_id)
     payload = {"body": body}
-    response = requests.post(
+    response = github_session.post(
+        url, json=payload, headers=headers, timeout=GITHUB_API_CALLS_TIMEOUT
+    )
+    response.raise_for_status()
+
+    return response.json()
+
+
+def update_comment_on_github(
+    installation_id: str, owner: str, repo: str, comment_id: int, body: str
+) -> dict[str, Any]:
+    url = f"{GITHUB_API_URL}repos/{owner}/{repo}/issues/comments/{comment_id}"
+    headers = build_request_headers(installation_id)
+    payload = {"body": body}
+    response = github_session.patch(
         url, json=payload, headers=headers, timeout=GITHUB_API_CALLS_TIMEOUT
     )
     response.raise_for_status()
@@ -113,6 +148,7 @@ def delete_github_installation(installation_id: str) -> requests.Response:
     headers = build_request_headers(installation_id, use_jwt=True)
     response = requests.delete(url, headers=headers, timeout=GITHUB_API_CALLS_TIMEOUT)
     response.raise_for_status()
+    clear_installation_token(installation_id)
     return response
 
 
@@ -244,3 +280,7 @@ def fetch_github_repo_contributors(
     ]
 
     return build_paginated_response(results, response)
+
+
+def _get_installation_token_cache_key(installation_id: str) -> str:
+    return f"installation_token:{installation_id}"
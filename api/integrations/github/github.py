@@ -7,6 +7,7 @@ from core.helpers import get_current_site_url
 from django.utils.formats import get_format
 
 from features.models import Feature, FeatureState, FeatureStateValue
+from integrations.github.client import clear_installation_token
 from integrations.github.constants import (
     DELETED_FEATURE_TEXT,
     DELETED_SEGMENT_OVERRIDE_TEXT,
@@ -31,6 +32,7 @@ def handle_installation_deleted(payload: dict[str, Any]) -> None:
     if installation_id is not None:
         try:
             GithubConfiguration.objects.get(installation_id=installation_id).delete()
+            clear_installation_token(installation_id)
         except GithubConfiguration.DoesNotExist:
             logger.error(
                 f"GitHub Configuration with installation_id {installation_id} does not exist"
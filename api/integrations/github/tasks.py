@@ -2,10 +2,16 @@ import logging
 from typing import Any, List
 from urllib.parse import urlparse
 
+import requests
+from django.conf import settings
 from task_processor.decorators import register_task_handler
 
 from features.models import Feature
-from integrations.github.client import post_comment_to_github
+from integrations.github.client import (
+    github_cache,
+    post_comment_to_github,
+    update_comment_on_github,
+)
 from integrations.github.dataclasses import CallGithubData
 from webhooks.webhooks import WebhookEventType
 
@@ -32,30 +38,72 @@ def send_post_request(data: CallGithubData) -> None:
         event_type == WebhookEventType.FLAG_UPDATED.value
         or event_type == WebhookEventType.FLAG_DELETED.value
     ):
-        for resource in data.feature_external_resources:
-            url = resource.get("url")
-            pathname = urlparse(url).path
-            split_url = pathname.split("/")
-            post_comment_to_github(
-                installation_id, split_url[1], split_url[2], split_url[4], body
-            )
+        # Only comment once on each issue / PR, even if it is linked more than once.
+        urls = dict.fromkeys(
+            resource.get("url") for resource in data.feature_external_resources
+        )
+        coalesce_key = (
+            _get_feature_states_coalesce_key(feature_id, feature_states or [])
+            if event_type == WebhookEventType.FLAG_UPDATED.value
+            else None
+        )
+        for url in urls:
+            _post_comment(installation_id, url, body, coalesce_key=coalesce_key)
 
     elif event_type == WebhookEventType.FEATURE_EXTERNAL_RESOURCE_REMOVED.value:
-        url = data.github_data.url
-        pathname = urlparse(url).path
-        split_url = pathname.split("/")
-        post_comment_to_github(
-            installation_id, split_url[1], split_url[2], split_url[4], body
-        )
+        _post_comment(installation_id, data.github_data.url, body)
     else:
         url = data.feature_external_resources[
             len(data.feature_external_resources) - 1
         ].get("url")
-        pathname = urlparse(url).path
-        split_url = pathname.split("/")
-        post_comment_to_github(
-            installation_id, split_url[1], split_url[2], split_url[4], body
-        )
+        _post_comment(installation_id, url, body)
+
+
+def _post_comment(
+    installation_id: str,
+    url: str,
+    body: str,
+    coalesce_key: str | None = None,
+) -> None:
+    """
+    Post the given comment to the issue / PR at the given url.
+
+    If a coalesce key is given, and a comment with the same key was posted to the
+    issue / PR within the last `GITHUB_COMMENT_COALESCE_SECONDS`, that comment is
+    edited instead.
+    """
+    pathname = urlparse(url).path
+    split_url = pathname.split("/")
+    owner, repo, issue = split_url[1], split_url[2], split_url[4]
+
+    if coalesce_key is None or not settings.GITHUB_COMMENT_COALESCE_SECONDS:
+        post_comment_to_github(installation_id, owner, repo, issue, body)
+        return
+
+    cache_key = f"comment:{installation_id}:{owner}/{repo}/{issue}:{coalesce_key}"
+    if comment_id := github_cache.get(cache_key):
+        try:
+            update_comment_on_github(installation_id, owner, repo, comment_id, body)
+            return
+        except requests.HTTPError:
+            # e.g. the comment has since been deleted
+            logger.info("Unable to update GitHub comment %s", comment_id)
+
+    comment = post_comment_to_github(installation_id, owner, repo, issue, body)
+    github_cache.set(
+        cache_key, comment["id"], timeout=settings.GITHUB_COMMENT_COALESCE_SECONDS
+    )
+
+
+def _get_feature_states_coalesce_key(
+    feature_id: int, feature_states: list[dict[str, Any]]
+) -> str:
+    # Updates are only coalesced when they are to the same feature states, so
+    # that editing the comment doesn't lose the update to another environment.
+    return f"{feature_id}:" + ",".join(
+        f"{fs.get('environment_api_key')}/{fs.get('segment_name') or ''}"
+        for fs in feature_states
+    )
 
 
 @register_task_handler()
@@ -1,11 +1,15 @@
+import time
+from contextlib import suppress
 from typing import Any, Iterator, Optional, TypeVar
 
-from requests import Session
+from requests import Response, Session
 
 from integrations.launch_darkly import types as ld_types
 from integrations.launch_darkly.constants import (
     LAUNCH_DARKLY_API_BASE_URL,
     LAUNCH_DARKLY_API_ITEM_COUNT_LIMIT_PER_PAGE,
+    LAUNCH_DARKLY_API_RATE_LIMIT_BACKOFF_SECONDS,
+    LAUNCH_DARKLY_API_RATE_LIMIT_MAX_RETRIES,
     LAUNCH_DARKLY_API_VERSION,
 )
 
@@ -29,10 +33,36 @@ class LaunchDarklyClient:
         params: Optional[dict[str, Any]] = None,
     ) -> T:
         full_url = f"{LAUNCH_DARKLY_API_BASE_URL}{endpoint}"
-        response = self.client_session.get(full_url, params=params)
+        for attempt in range(LAUNCH_DARKLY_API_RATE_LIMIT_MAX_RETRIES + 1):
+            response = self.client_session.get(full_url, params=params)
+            if (
+                response.status_code != 429
+                or attempt == LAUNCH_DARKLY_API_RATE_LIMIT_MAX_RETRIES
+            ):
+                break
+            time.sleep(self._get_rate_limit_wait_seconds(response, attempt))
         response.raise_for_status()
         return response.json()
 
+    @staticmethod
+    def _get_rate_limit_wait_seconds(response: Response, attempt: int) -> float:
+        """
+        Determine how long to wait before retrying a rate limited request.
+
+        Launch Darkly sends the time at which the rate limit resets (in epoch
+        milliseconds) in the `X-Ratelimit-Reset` header, and may also send a
+        `Retry-After` header. If neither are present (or valid), back off
+        exponentially.
+        """
+        if ratelimit_reset := response.headers.get("X-Ratelimit-Reset"):
+            with suppress(ValueError):
+                return max(int(ratelimit_reset) / 1000 - time.time(), 0)
+        if retry_after := response.headers.get("Retry-After"):
+            # Retry-After may also be a HTTP date, which we don't bother parsing.
+            with suppress(ValueError):
+                return float(retry_after)
+        return LAUNCH_DARKLY_API_RATE_LIMIT_BACKOFF_SECONDS * 2**attempt
+
     def _iter_paginated_items(
         self,
         collection_endpoint: str,
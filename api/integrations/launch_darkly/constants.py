@@ -3,6 +3,12 @@ LAUNCH_DARKLY_API_VERSION = "20220603"
 # Maximum limit for /api/v2/projects/
 # /api/v2/flags/ seemingly not limited, but let's not get too greedy
 LAUNCH_DARKLY_API_ITEM_COUNT_LIMIT_PER_PAGE = 1000
+# Retry requests which are rate limited by Launch Darkly, backing off
+# exponentially if the response doesn't tell us when to retry.
+LAUNCH_DARKLY_API_RATE_LIMIT_MAX_RETRIES = 5
+LAUNCH_DARKLY_API_RATE_LIMIT_BACKOFF_SECONDS = 1
+# Number of requests to Launch Darkly that we make concurrently.
+LAUNCH_DARKLY_API_MAX_CONCURRENT_REQUESTS = 4
 
 LAUNCH_DARKLY_IMPORTED_TAG_COLOR = "#3d4db6"
 LAUNCH_DARKLY_IMPORTED_DEFAULT_TAG_LABEL = "Imported"
@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class LaunchDarklyImportStatus(TypedDict):
     requested_environment_count: int
     requested_flag_count: int
+    imported_segment_count: NotRequired[int]
+    imported_flag_count: NotRequired[int]
     result: NotRequired[Literal["success", "failure"]]
     error_messages: list[str]
 
@@ -6,6 +6,8 @@ from integrations.launch_darkly.models import LaunchDarklyImportRequest
 class LaunchDarklyImportRequestStatusSerializer(serializers.Serializer):
     requested_environment_count = serializers.IntegerField(read_only=True)
     requested_flag_count = serializers.IntegerField(read_only=True)
+    imported_segment_count = serializers.IntegerField(read_only=True)
+    imported_flag_count = serializers.IntegerField(read_only=True)
     result = serializers.ChoiceField(
         ["success", "failure"],
         read_only=True,
@@ -1,14 +1,20 @@
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Callable, Optional, Tuple
+from typing import Callable, Iterable, Optional, Tuple
 
 from django.core import signing
 from django.utils import timezone
 from flag_engine.segments import constants
 from requests.exceptions import RequestException
+from simple_history.utils import bulk_create_with_history
 
+from audit.constants import LAUNCH_DARKLY_IMPORTED_MESSAGE
+from audit.models import AuditLog
+from audit.related_object_type import RelatedObjectType
 from environments.identities.models import Identity
+from environments.identities.traits.models import Trait
 from environments.models import Environment
 from features.feature_types import MULTIVARIATE, STANDARD, FeatureType
 from features.models import (
@@ -25,6 +31,7 @@ from features.value_types import STRING
 from integrations.launch_darkly import types as ld_types
 from integrations.launch_darkly.client import LaunchDarklyClient
 from integrations.launch_darkly.constants import (
+    LAUNCH_DARKLY_API_MAX_CONCURRENT_REQUESTS,
     LAUNCH_DARKLY_IMPORTED_DEFAULT_TAG_LABEL,
     LAUNCH_DARKLY_IMPORTED_TAG_COLOR,
 )
@@ -59,6 +66,151 @@ def _log_error(
     import_request.status["error_messages"] += [error_message]
 
 
+def _report_progress(
+    import_request: LaunchDarklyImportRequest,
+    **progress: int,
+) -> None:
+    """
+    Persist the import progress so that it can be seen while the import is running.
+
+    Only the status is written (rather than saving the instance) to avoid
+    generating a history record for each progress update.
+    """
+    import_request.status.update(progress)
+    LaunchDarklyImportRequest.objects.filter(id=import_request.id).update(
+        status=import_request.status,
+        updated_at=timezone.now(),
+    )
+
+
+def _create_identities_with_key_trait(
+    identifiers: list[str],
+    environment: Environment,
+) -> dict[str, Identity]:
+    """
+    Create (or get) identities for all the given identifiers, and set their "key"
+    trait, which is used to target them, in bulk.
+
+    :return: a mapping from identifier to Identity.
+    """
+    identities_by_identifier = Identity.objects.get_or_create_in_bulk(
+        identifiers=identifiers,
+        environment=environment,
+    )
+    Trait.objects.bulk_upsert(
+        Trait(
+            identity=identity,
+            trait_key="key",
+            **Trait.generate_trait_value_data(identifier),
+        )
+        for identifier, identity in identities_by_identifier.items()
+    )
+    return identities_by_identifier
+
+
+def _update_or_create_identity_overrides(
+    feature: Feature,
+    environment: Environment,
+    identities: list[Identity],
+    enabled: bool,
+    mv_feature_option: Optional[MultivariateFeatureOption],
+) -> None:
+    """
+    Set identity overrides for the given feature and identities in bulk.
+
+    :param mv_feature_option: if given, the multivariate option to serve to the identities.
+    """
+    existing_feature_states_by_identity_id = {
+        feature_state.identity_id: feature_state
+        for feature_state in FeatureState.objects.filter(
+            feature=feature,
+            feature_segment=None,
+            environment=environment,
+            identity__in=identities,
+        )
+    }
+
+    feature_states_to_update = []
+    feature_states_to_create = []
+    for identity in identities:
+        if feature_state := existing_feature_states_by_identity_id.get(identity.id):
+            if feature_state.enabled != enabled:
+                feature_state.enabled = enabled
+                feature_states_to_update.append(feature_state)
+        else:
+            feature_states_to_create.append(
+                FeatureState(
+                    feature=feature,
+                    environment=environment,
+                    identity=identity,
+                    enabled=enabled,
+                    live_from=timezone.now(),
+                )
+            )
+
+    FeatureState.objects.bulk_update(feature_states_to_update, fields=["enabled"])
+    bulk_create_with_history(feature_states_to_create, FeatureState)
+    bulk_create_with_history(
+        [
+            FeatureStateValue(
+                feature_state=feature_state,
+                **feature_state.get_feature_state_value_defaults(),
+            )
+            for feature_state in feature_states_to_create
+        ],
+        FeatureStateValue,
+    )
+
+    if mv_feature_option is None:
+        return
+
+    # Serve the targeted variation to all identities.
+    existing_mv_feature_state_values = MultivariateFeatureStateValue.objects.filter(
+        feature_state__in=existing_feature_states_by_identity_id.values(),
+        multivariate_feature_option=mv_feature_option,
+    )
+    existing_mv_feature_state_ids = set(
+        existing_mv_feature_state_values.values_list("feature_state_id", flat=True)
+    )
+    existing_mv_feature_state_values.update(percentage_allocation=100)
+    MultivariateFeatureStateValue.objects.bulk_create(
+        [
+            MultivariateFeatureStateValue(
+                feature_state=feature_state,
+                multivariate_feature_option=mv_feature_option,
+                percentage_allocation=100,
+            )
+            for feature_state in (
+                *existing_feature_states_by_identity_id.values(),
+                *feature_states_to_create,
+            )
+            if feature_state.id not in existing_mv_feature_state_ids
+        ]
+    )
+
+
+def _create_import_audit_logs(
+    import_request: LaunchDarklyImportRequest,
+    environments: Iterable[Environment],
+) -> None:
+    """
+    Create an audit log for each of the imported environments.
+
+    The identity overrides are bulk created, so they don't create audit logs of
+    their own. These make sure that the environments (e.g. their documents and
+    caches) are updated with everything that was imported.
+    """
+    for environment in environments:
+        AuditLog.objects.create(
+            project_id=import_request.project_id,
+            environment=environment,
+            related_object_id=import_request.id,
+            related_object_type=RelatedObjectType.IMPORT_REQUEST.name,
+            log=LAUNCH_DARKLY_IMPORTED_MESSAGE % environment.name,
+            is_system_event=True,
+        )
+
+
 @contextmanager
 def _complete_import_request(
     import_request: LaunchDarklyImportRequest,
@@ -263,6 +415,15 @@ def _create_feature_segments_for_segment_match_clauses(
     return feature_states
 
 
+def _bump_segment_updated_at(segment: Segment) -> None:
+    """
+    Bump the segment's `updated_at` once its rules and conditions have been imported. Rules and
+    conditions are created after the segment itself, and the engine representation of a segment's
+    rules is cached against its `updated_at`.
+    """
+    Segment.objects.filter(id=segment.id).update(updated_at=timezone.now())
+
+
 def _create_segment_rule_for_segment(
     import_request: LaunchDarklyImportRequest,
     segment: Segment,
@@ -284,6 +445,7 @@ def _create_segment_rule_for_segment(
     # TODO: Delete existing rules if parent_rule already exists.
 
     negated_child = None
+    created_condition_keys: set[tuple[int, str, str, str]] = set()
 
     for clause in clauses:
         _property = clause["attribute"]
@@ -312,14 +474,24 @@ def _create_segment_rule_for_segment(
                 target_rule = child_rule
 
             # Create a condition for each value. Each condition is "OR"ed together.
+            # Since the child rules are always newly created, we only need to make
+            # sure that we don't create the same condition twice in this import.
+            conditions = []
             for value in values:
-                condition, _ = Condition.objects.update_or_create(
-                    rule=target_rule,
-                    property=_property,
-                    value=value,
-                    operator=operator,
-                    created_with_segment=True,
+                condition_key = (target_rule.id, _property, value, operator)
+                if condition_key in created_condition_keys:
+                    continue
+                created_condition_keys.add(condition_key)
+                conditions.append(
+                    Condition(
+                        rule=target_rule,
+                        property=_property,
+                        value=value,
+                        operator=operator,
+                        created_with_segment=True,
+                    )
                 )
+            bulk_create_with_history(conditions, Condition)
         else:
             _log_error(
                 import_request=import_request,
@@ -378,6 +550,7 @@ def _create_feature_segment_from_clauses(
         segment=segment,
         clauses=clauses,
     )
+    _bump_segment_updated_at(segment)
 
     # Tie the feature and segment together.
     feature_segment, _ = FeatureSegment.objects.update_or_create(
@@ -445,48 +618,30 @@ def _import_targets(
             )
 
             # Create individual identity targets.
-            for identifier in target["values"]:
-                identity, _ = Identity.objects.get_or_create(
-                    identifier=identifier,
+            identities_by_identifier = _create_identities_with_key_trait(
+                identifiers=target["values"],
+                environment=environment,
+            )
+
+            # Set identity overrides.
+            if len(mv_feature_options_by_variation) == 0:
+                _update_or_create_identity_overrides(
+                    feature=feature,
                     environment=environment,
+                    identities=list(identities_by_identifier.values()),
+                    enabled=target["variation"] == 0,
+                    mv_feature_option=None,
                 )
-                identity.update_traits(
-                    [
-                        {
-                            "trait_key": "key",
-                            "trait_value": identifier,
-                        }
-                    ]
-                )
-
-                # Set identity overrides.
-                if len(mv_feature_options_by_variation) == 0:
-                    FeatureState.objects.update_or_create(
-                        feature=feature,
-                        feature_segment=None,
-                        environment=environment,
-                        identity=identity,
-                        defaults={"enabled": target["variation"] == 0},
-                    )
-                else:
-                    feature_state, _ = FeatureState.objects.update_or_create(
-                        feature=feature,
-                        feature_segment=None,
-                        environment=environment,
-                        identity=identity,
-                        defaults={"enabled": True},
-                    )
-
-                    mv_feature_option = mv_feature_options_by_variation[
+            else:
+                _update_or_create_identity_overrides(
+                    feature=feature,
+                    environment=environment,
+                    identities=list(identities_by_identifier.values()),
+                    enabled=True,
+                    mv_feature_option=mv_feature_options_by_variation[
                         str(target["variation"])
-                    ]
-                    MultivariateFeatureStateValue.objects.update_or_create(
-                        feature_state=feature_state,
-                        multivariate_feature_option=mv_feature_option,
-                        defaults={
-                            "percentage_allocation": 100,
-                        },
-                    )
+                    ],
+                )
 
     if "contextTargets" in ld_flag_config and len(ld_flag_config["contextTargets"]) > 0:
         if (
@@ -901,17 +1056,21 @@ def _create_features_from_ld(
     segments_by_ld_key: dict[str, Segment],
     project_id: int,
 ) -> list[Feature]:
-    return [
-        _create_feature_from_ld(
-            import_request=import_request,
-            ld_flag=ld_flag,
-            environments_by_ld_environment_key=environments_by_ld_environment_key,
-            tags_by_ld_tag=tags_by_ld_tag,
-            segments_by_ld_key=segments_by_ld_key,
-            project_id=project_id,
+    features = []
+    for ld_flag in ld_flags:
+        features.append(
+            _create_feature_from_ld(
+                import_request=import_request,
+                ld_flag=ld_flag,
+                environments_by_ld_environment_key=environments_by_ld_environment_key,
+                tags_by_ld_tag=tags_by_ld_tag,
+                segments_by_ld_key=segments_by_ld_key,
+                project_id=project_id,
+            )
         )
-        for ld_flag in ld_flags
-    ]
+        _report_progress(import_request, imported_flag_count=len(features))
+
+    return features
 
 
 def _include_users_to_segment(
@@ -956,6 +1115,7 @@ def _create_segments_from_ld(
     :return A mapping from ld segment key to Segment itself.
     """
     segments_by_ld_key = {}
+    imported_segment_count = 0
     for ld_segment, env in ld_segments:
         if ld_segment["deleted"]:
             continue
@@ -980,19 +1140,10 @@ def _create_segments_from_ld(
             )
 
         # Create or update identities that are mentioned in the segment.
-        for identifier in ld_segment["included"] + ld_segment["excluded"]:
-            identity, _ = Identity.objects.get_or_create(
-                identifier=identifier,
-                environment=environments_by_ld_environment_key[env],
-            )
-            identity.update_traits(
-                [
-                    {
-                        "trait_key": "key",
-                        "trait_value": identifier,
-                    }
-                ]
-            )
+        _create_identities_with_key_trait(
+            identifiers=ld_segment["included"] + ld_segment["excluded"],
+            environment=environments_by_ld_environment_key[env],
+        )
 
         _include_users_to_segment(segment, ld_segment["included"], False)
         _include_users_to_segment(segment, ld_segment["excluded"], True)
@@ -1009,6 +1160,10 @@ def _create_segments_from_ld(
         # Create an empty rule if there are no rules. This is required to create an "SegmentRule" object.
         # Otherwise, UI fails to display the segment.
         SegmentRule.objects.get_or_create(segment=segment, type=SegmentRule.ALL_RULE)
+        _bump_segment_updated_at(segment)
+
+        imported_segment_count += 1
+        _report_progress(import_request, imported_segment_count=imported_segment_count)
 
     return segments_by_ld_key
 
@@ -1052,19 +1207,40 @@ def process_import_request(
         ld_client = LaunchDarklyClient(ld_token)
 
         try:
-            ld_environments = ld_client.get_environments(project_key=ld_project_key)
-            ld_flags = ld_client.get_flags(project_key=ld_project_key)
-            ld_flag_tags = ld_client.get_flag_tags()
-            # ld_segment_tags = ld_client.get_segment_tags()
-            # Keyed by (segment, environment)
-            ld_segments: list[tuple[ld_types.UserSegment, str]] = []
-            for env in ld_environments:
-                ld_segments_for_env = ld_client.get_segments(
-                    project_key=ld_project_key,
-                    environment_key=env["key"],
+            # Fetch everything we need from Launch Darkly concurrently.
+            with ThreadPoolExecutor(
+                max_workers=LAUNCH_DARKLY_API_MAX_CONCURRENT_REQUESTS
+            ) as executor:
+                ld_environments_future = executor.submit(
+                    ld_client.get_environments, project_key=ld_project_key
+                )
+                ld_flags_future = executor.submit(
+                    ld_client.get_flags, project_key=ld_project_key
                 )
-                for segment in ld_segments_for_env:
-                    ld_segments.append((segment, env["key"]))
+                ld_flag_tags_future = executor.submit(ld_client.get_flag_tags)
+                # ld_segment_tags = ld_client.get_segment_tags()
+
+                ld_environments = ld_environments_future.result()
+                ld_segments_futures = [
+                    (
+                        env["key"],
+                        executor.submit(
+                            ld_client.get_segments,
+                            project_key=ld_project_key,
+                            environment_key=env["key"],
+                        ),
+                    )
+                    for env in ld_environments
+                ]
+
+                ld_flags = ld_flags_future.result()
+                ld_flag_tags = ld_flag_tags_future.result()
+                # Keyed by (segment, environment)
+                ld_segments: list[tuple[ld_types.UserSegment, str]] = [
+                    (segment, env_key)
+                    for env_key, ld_segments_future in ld_segments_futures
+                    for segment in ld_segments_future.result()
+                ]
 
         except RequestException as exc:
             _log_error(
@@ -1107,3 +1283,8 @@ def process_import_request(
             segments_by_ld_key=segments_by_ld_key,
             project_id=import_request.project_id,
         )
+
+        _create_import_audit_logs(
+            import_request=import_request,
+            environments=environments_by_ld_environment_key.values(),
+        )
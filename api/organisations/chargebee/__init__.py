@@ -11,5 +11,6 @@ from .chargebee import (  # noqa
     get_plan_meta_data,
     get_portal_url,
     get_subscription_data_from_hosted_page,
+    get_subscription_metadata_for_ids,
     get_subscription_metadata_from_id,
 )
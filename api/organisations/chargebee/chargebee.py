@@ -1,3 +1,4 @@
+import json
 import logging
 import typing
 from contextlib import suppress
@@ -21,6 +22,7 @@ from .constants import (
     ADDITIONAL_API_SCALE_UP_ADDON_ID,
     ADDITIONAL_API_START_UP_ADDON_ID,
     ADDITIONAL_SEAT_ADDON_ID,
+    SUBSCRIPTION_LIST_BATCH_SIZE,
 )
 from .metadata import ChargebeeObjMetadata
 
@@ -158,6 +160,55 @@ def get_subscription_metadata_from_id(
         )
 
 
+def get_subscription_metadata_for_ids(
+    subscription_ids: typing.Iterable[str],
+) -> dict[str, ChargebeeObjMetadata]:
+    """
+    Get the metadata for each of the given subscriptions, keyed by subscription id.
+
+    The subscriptions are fetched in batches using the list endpoint, instead
+    of retrieving them one at a time. Any subscriptions that can't be fetched
+    from chargebee are omitted from the result.
+    """
+    subscription_ids = sorted(
+        {
+            subscription_id
+            for subscription_id in subscription_ids
+            if subscription_id and subscription_id.strip() != ""
+        }
+    )
+
+    subscription_metadata = {}
+    for start in range(0, len(subscription_ids), SUBSCRIPTION_LIST_BATCH_SIZE):
+        end = start + SUBSCRIPTION_LIST_BATCH_SIZE
+        batch = subscription_ids[start:end]
+        params = {"limit": SUBSCRIPTION_LIST_BATCH_SIZE, "id[in]": json.dumps(batch)}
+        while True:
+            try:
+                entries = chargebee.Subscription.list(params)
+            except ChargebeeAPIError:
+                # Carry on with the remaining batches.
+                logger.error(
+                    "Failed to list chargebee subscriptions %s", batch, exc_info=True
+                )
+                break
+
+            for entry in entries:
+                chargebee_subscription = _convert_chargebee_subscription_to_dictionary(
+                    entry.subscription
+                )
+                metadata = extract_subscription_metadata(
+                    chargebee_subscription, entry.customer.email
+                )
+                subscription_metadata[entry.subscription.id] = metadata
+
+            if not entries.next_offset:
+                break
+            params = {**params, "offset": entries.next_offset}
+
+    return subscription_metadata
+
+
 def cancel_subscription(subscription_id: str):
     try:
         chargebee.Subscription.cancel(subscription_id, {"end_of_term": True})
@@ -2,3 +2,6 @@ ADDITIONAL_SEAT_ADDON_ID = "additional-team-members-scale-up-v2-monthly"
 
 ADDITIONAL_API_START_UP_ADDON_ID = "additional-api-start-up-monthly"
 ADDITIONAL_API_SCALE_UP_ADDON_ID = "additional-api-scale-up-monthly"
+
+# The maximum page size of the chargebee list endpoints.
+SUBSCRIPTION_LIST_BATCH_SIZE = 100
@@ -17,6 +17,7 @@ from django_lifecycle import (
 from simple_history.models import HistoricalRecords
 
 from app.utils import is_enterprise, is_saas
+from environments.cache import update_environment_cache_version
 from integrations.lead_tracking.hubspot.tasks import (
     track_hubspot_lead,
     update_hubspot_active_subscription,
@@ -160,6 +161,7 @@ class Organisation(LifecycleModelMixin, SoftDeleteExportableModel):
                 )
             )
         )
+        update_environment_cache_version()
 
     @hook(AFTER_SAVE, when="stop_serving_flags", has_changed=True)
     def rebuild_environments(self):
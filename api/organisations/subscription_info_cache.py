@@ -3,7 +3,7 @@ import typing
 from app_analytics.influxdb_wrapper import get_top_organisations
 from django.conf import settings
 
-from .chargebee import get_subscription_metadata_from_id
+from .chargebee import get_subscription_metadata_for_ids
 from .models import Organisation, OrganisationSubscriptionInformationCache
 from .subscriptions.constants import CHARGEBEE, SubscriptionCacheEntity
 
@@ -11,6 +11,18 @@ OrganisationSubscriptionInformationCacheDict = typing.Dict[
     int, OrganisationSubscriptionInformationCache
 ]
 
+UPDATE_FIELDS = (
+    "api_calls_24h",
+    "api_calls_7d",
+    "api_calls_30d",
+    "allowed_seats",
+    "allowed_30d_api_calls",
+    "chargebee_email",
+    "chargebee_updated_at",
+    "influx_updated_at",
+)
+BATCH_SIZE = 500
+
 
 def update_caches(update_cache_entities: typing.Tuple[SubscriptionCacheEntity, ...]):
     """
@@ -29,6 +41,13 @@ def update_caches(update_cache_entities: typing.Tuple[SubscriptionCacheEntity, .
         for org in organisations
     }
 
+    # Keep track of the current values so that only the caches which have
+    # actually changed are written back to the database.
+    initial_values = {
+        org_id: _get_update_field_values(subscription_info_cache)
+        for org_id, subscription_info_cache in organisation_info_cache_dict.items()
+    }
+
     if SubscriptionCacheEntity.INFLUX in update_cache_entities:
         _update_caches_with_influx_data(organisation_info_cache_dict)
 
@@ -38,28 +57,28 @@ def update_caches(update_cache_entities: typing.Tuple[SubscriptionCacheEntity, .
     to_update = []
     to_create = []
 
-    for subscription_info_cache in organisation_info_cache_dict.values():
-        if subscription_info_cache.id:
-            to_update.append(subscription_info_cache)
-        else:
+    for org_id, subscription_info_cache in organisation_info_cache_dict.items():
+        if not subscription_info_cache.id:
             to_create.append(subscription_info_cache)
+        elif (
+            _get_update_field_values(subscription_info_cache) != initial_values[org_id]
+        ):
+            to_update.append(subscription_info_cache)
 
-    OrganisationSubscriptionInformationCache.objects.bulk_create(to_create)
+    OrganisationSubscriptionInformationCache.objects.bulk_create(
+        to_create, batch_size=BATCH_SIZE
+    )
     OrganisationSubscriptionInformationCache.objects.bulk_update(
-        to_update,
-        fields=[
-            "api_calls_24h",
-            "api_calls_7d",
-            "api_calls_30d",
-            "allowed_seats",
-            "allowed_30d_api_calls",
-            "chargebee_email",
-            "chargebee_updated_at",
-            "influx_updated_at",
-        ],
+        to_update, fields=UPDATE_FIELDS, batch_size=BATCH_SIZE
     )
 
 
+def _get_update_field_values(
+    subscription_info_cache: OrganisationSubscriptionInformationCache,
+) -> tuple:
+    return tuple(getattr(subscription_info_cache, field) for field in UPDATE_FIELDS)
+
+
 def _update_caches_with_influx_data(
     organisation_info_cache_dict: OrganisationSubscriptionInformationCacheDict,
 ) -> None:
@@ -92,6 +111,7 @@ def _update_caches_with_chargebee_data(
     if not settings.CHARGEBEE_API_KEY:
         return
 
+    chargebee_subscriptions = {}
     for organisation in organisations:
         subscription = getattr(organisation, "subscription", None)
         if (
@@ -100,12 +120,19 @@ def _update_caches_with_chargebee_data(
             or subscription.payment_method != CHARGEBEE
         ):
             continue
+        chargebee_subscriptions[organisation.id] = subscription
+
+    subscription_metadata = get_subscription_metadata_for_ids(
+        subscription.subscription_id
+        for subscription in chargebee_subscriptions.values()
+    )
 
-        metadata = get_subscription_metadata_from_id(subscription.subscription_id)
+    for organisation_id, subscription in chargebee_subscriptions.items():
+        metadata = subscription_metadata.get(subscription.subscription_id)
         if not metadata:
             continue
 
-        subscription_info_cache = organisation_info_cache_dict[organisation.id]
+        subscription_info_cache = organisation_info_cache_dict[organisation_id]
         subscription_info_cache.allowed_seats = metadata.seats
         subscription_info_cache.allowed_30d_api_calls = metadata.api_calls
         subscription_info_cache.chargebee_email = metadata.chargebee_email
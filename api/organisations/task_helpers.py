@@ -1,7 +1,9 @@
 import logging
-from datetime import timedelta
+import typing
+from collections import defaultdict
+from datetime import datetime, timedelta
 
-from app_analytics.influxdb_wrapper import get_current_api_usage
+from app_analytics.influxdb_wrapper import get_current_api_usages
 from dateutil.relativedelta import relativedelta
 from django.conf import settings
 from django.core.mail import send_mail
@@ -87,21 +89,21 @@ def _send_api_usage_notification(
     )
 
 
-def handle_api_usage_notification_for_organisation(organisation: Organisation) -> None:
-    now = timezone.now()
-
+def _get_api_usage_period(
+    organisation: Organisation, now: datetime
+) -> typing.Optional[tuple[datetime, int, int]]:
+    """
+    Get the start of the organisation's current usage period, its length in
+    days and the number of API calls allowed in the period, or None if the
+    period cannot be determined.
+    """
     if organisation.subscription.is_free_plan:
         allowed_api_calls = organisation.subscription.max_api_calls
         # Default to a rolling month for free accounts
         days = 30
         period_starts_at = now - timedelta(days)
     elif not organisation.has_subscription_information_cache():
-        # Since the calling code is a list of many organisations
-        # log the error and return without raising an exception.
-        logger.error(
-            f"Paid organisation {organisation.id} is missing subscription information cache"
-        )
-        return
+        return None
     else:
         subscription_cache = organisation.subscription_information_cache
         billing_starts_at = subscription_cache.current_billing_term_starts_at
@@ -113,7 +115,45 @@ def handle_api_usage_notification_for_organisation(organisation: Organisation) -
         days = relativedelta(now, period_starts_at).days
         allowed_api_calls = subscription_cache.allowed_30d_api_calls
 
-    api_usage = get_current_api_usage(organisation.id, f"-{days}d")
+    return period_starts_at, days, allowed_api_calls
+
+
+def get_api_usage_for_organisations(
+    organisations: typing.Iterable[Organisation],
+) -> dict[int, int]:
+    """
+    Get the API usage in the current usage period of each of the given
+    organisations, keyed by organisation id. Organisations are grouped by the
+    length of their usage period so that they can be queried together.
+    """
+    now = timezone.now()
+
+    organisation_ids_by_days = defaultdict(list)
+    for organisation in organisations:
+        if period := _get_api_usage_period(organisation, now):
+            _, days, _ = period
+            organisation_ids_by_days[days].append(organisation.id)
+
+    api_usage = {}
+    for days, organisation_ids in organisation_ids_by_days.items():
+        api_usage.update(get_current_api_usages(organisation_ids, f"-{days}d"))
+    return api_usage
+
+
+def handle_api_usage_notification_for_organisation(
+    organisation: Organisation, api_usage: int
+) -> None:
+    now = timezone.now()
+
+    if not (period := _get_api_usage_period(organisation, now)):
+        # Since the calling code is a list of many organisations
+        # log the error and return without raising an exception.
+        logger.error(
+            f"Paid organisation {organisation.id} is missing subscription information cache"
+        )
+        return
+
+    period_starts_at, _, allowed_api_calls = period
 
     # For some reason the allowed API calls is set to 0 so default to the max free plan.
     allowed_api_calls = allowed_api_calls or MAX_API_CALLS_IN_FREE_PLAN
@@ -2,7 +2,7 @@ import logging
 import math
 from datetime import timedelta
 
-from app_analytics.influxdb_wrapper import get_current_api_usage
+from app_analytics.influxdb_wrapper import get_current_api_usages
 from django.conf import settings
 from django.db.models import F, Max
 from django.utils import timezone
@@ -43,6 +43,7 @@ from .subscriptions.constants import (
     SubscriptionCacheEntity,
 )
 from .task_helpers import (
+    get_api_usage_for_organisations,
     handle_api_usage_notification_for_organisation,
     send_api_flags_blocked_notification,
 )
@@ -108,6 +109,7 @@ def finish_subscription_cancellation() -> None:
 def handle_api_usage_notifications() -> None:
     flagsmith_client = get_client("local", local_eval=True)
 
+    organisations = []
     for organisation in Organisation.objects.all().select_related(
         "subscription", "subscription_information_cache"
     ):
@@ -118,11 +120,34 @@ def handle_api_usage_notifications() -> None:
                 "subscription.plan": organisation.subscription.plan,
             },
         ).is_feature_enabled("api_usage_alerting")
-        if not feature_enabled:
-            continue
+        if feature_enabled:
+            organisations.append(organisation)
+
+    if not organisations:
+        return
+
+    # Query the API usage of all the relevant organisations up front,
+    # rather than making a separate query for each organisation.
+    try:
+        api_usage = get_api_usage_for_organisations(organisations)
+    except Exception:
+        logger.error(
+            "Error getting api usage for organisations, "
+            "falling back to querying each organisation separately",
+            exc_info=True,
+        )
+        api_usage = None
 
+    for organisation in organisations:
         try:
-            handle_api_usage_notification_for_organisation(organisation)
+            organisation_api_usage = (
+                api_usage
+                if api_usage is not None
+                else get_api_usage_for_organisations([organisation])
+            )
+            handle_api_usage_notification_for_organisation(
+                organisation, organisation_api_usage.get(organisation.id, 0)
+            )
         except Exception:
             logger.error(
                 f"Error processing api usage for organisation {organisation.id}",
@@ -158,6 +183,7 @@ def charge_for_api_call_count_overages():
 
     flagsmith_client = get_client("local", local_eval=True)
 
+    organisations = []
     for organisation in (
         Organisation.objects.filter(
             id__in=organisation_ids,
@@ -187,11 +213,19 @@ def charge_for_api_call_count_overages():
                 "subscription.plan": organisation.subscription.plan,
             },
         )
-        if not flags.is_feature_enabled("api_usage_overage_charges"):
-            continue
+        if flags.is_feature_enabled("api_usage_overage_charges"):
+            organisations.append(organisation)
+
+    if not organisations:
+        return
+
+    api_usages = get_current_api_usages(
+        [organisation.id for organisation in organisations], "30d"
+    )
 
+    for organisation in organisations:
         subscription_cache = organisation.subscription_information_cache
-        api_usage = get_current_api_usage(organisation.id, "30d")
+        api_usage = api_usages[organisation.id]
 
         # Grace period for organisations < 200% of usage.
         if api_usage / subscription_cache.allowed_30d_api_calls < 2.0:
@@ -272,9 +306,9 @@ def restrict_use_due_to_api_limit_grace_period_over() -> None:
         )
     )
 
-    api_limit_access_blocks = []
     flagsmith_client = get_client("local", local_eval=True)
 
+    organisation_restrictions = []
     for organisation in organisations:
         flags = flagsmith_client.get_identity_flags(
             organisation.flagsmith_identifier,
@@ -293,8 +327,19 @@ def restrict_use_due_to_api_limit_grace_period_over() -> None:
         if not organisation.has_subscription_information_cache():
             continue
 
+        organisation_restrictions.append((organisation, stop_serving, block_access))
+
+    if not organisation_restrictions:
+        return
+
+    api_usages = get_current_api_usages(
+        [organisation.id for organisation, _, _ in organisation_restrictions], "30d"
+    )
+
+    api_limit_access_blocks = []
+    for organisation, stop_serving, block_access in organisation_restrictions:
         subscription_cache = organisation.subscription_information_cache
-        api_usage = get_current_api_usage(organisation.id, "30d")
+        api_usage = api_usages[organisation.id]
         if api_usage / subscription_cache.allowed_30d_api_calls < 1.0:
             logger.info(
                 f"API use for organisation {organisation.id} has fallen to below limit, so not restricting use."
@@ -4,6 +4,7 @@ from __future__ import unicode_literals
 import re
 
 from core.models import SoftDeleteExportableModel
+from core.request_profiling import record_cache_lookup
 from django.conf import settings
 from django.core.cache import caches
 from django.db import models
@@ -17,6 +18,7 @@ from django_lifecycle import (
     hook,
 )
 
+from environments.cache import update_environment_cache_version
 from environments.dynamodb import DynamoProjectMetadata
 from organisations.models import Organisation
 from permissions.models import (
@@ -143,6 +145,7 @@ class Project(LifecycleModelMixin, SoftDeleteExportableModel):
 
     def get_segments_from_cache(self):
         segments = project_segments_cache.get(self.id)
+        record_cache_lookup(settings.PROJECT_SEGMENTS_CACHE_LOCATION, bool(segments))
 
         if not segments:
             # This is optimised to account for rules nested one levels deep (since we
@@ -175,6 +178,7 @@ class Project(LifecycleModelMixin, SoftDeleteExportableModel):
         environment_cache.delete_many(
             list(self.environments.values_list("api_key", flat=True))
         )
+        update_environment_cache_version()
 
     @hook(
         AFTER_SAVE,
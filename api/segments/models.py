@@ -12,6 +12,7 @@ from django.conf import settings
 from django.contrib.contenttypes.fields import GenericRelation
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.utils import timezone
 from django_lifecycle import (
     AFTER_CREATE,
     BEFORE_CREATE,
@@ -162,6 +163,11 @@ class Segment(
             cloned_rule = rule.deep_clone(cloned_segment)
             cloned_rules.append(cloned_rule)
 
+        # The clone was saved before its rules were, so bump its updated_at
+        # once they are all in place (see util.mappers.engine.SegmentRulesCache).
+        Segment.all_objects.filter(id=cloned_segment.id).update(
+            updated_at=timezone.now()
+        )
         cloned_segment.refresh_from_db()
 
         assert (
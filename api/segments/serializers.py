@@ -96,6 +96,8 @@ class SegmentSerializer(serializers.ModelSerializer, SerializerWithMetadata):
 
             # remove rules from validated data to prevent error trying to create segment with nested rules
             del validated_data["rules"]
+            # The segment is saved after its rules so that its updated_at, which
+            # versions the cached engine rules, is bumped once for the whole update.
             response = super().update(instance, validated_data)
         except Exception:
             # Since there was a problem during the update we now delete the cloned segment,
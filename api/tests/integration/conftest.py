@@ -439,6 +439,7 @@ def identity_document(
             _mv_feature_state_document,
         ],
         "identifier": "user_1_test",
+        "identifier_lowercase": "user_1_test",
         "created_date": "2021-09-21T10:12:42.230257+00:00",
         "environment_api_key": environment_api_key,
         "identity_uuid": "59efa2a7-6a45-46d6-b953-a7073a90eacf",
@@ -453,6 +454,7 @@ def identity_document_without_fs(environment_api_key, identity_traits):
         "identity_traits": identity_traits,
         "identity_features": [],
         "identifier": "user_1_test",
+        "identifier_lowercase": "user_1_test",
         "created_date": "2021-09-21T10:12:42.230257+00:00",
         "environment_api_key": environment_api_key,
         "identity_uuid": "59efa2a7-6a45-46d6-b953-a7073a90eacf",
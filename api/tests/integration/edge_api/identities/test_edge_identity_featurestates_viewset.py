@@ -917,21 +917,23 @@ def test_get_all_feature_states_for_an_identity(
     default_feature_value,
     segment_override_type,
     segment_override_value,
+    mocker,
 ):
-    # Mock the get_segment_ids method so that it returns no segments for the first
-    # request (to get the environment default), then so that it returns one segment
-    # for the segment and identity override requests.
+    # Mock the get_identity_segments function so that it returns no segments for the
+    # first request (to get the environment default), then so that it returns the
+    # segment for the segment and identity override requests.
     segment_ids_responses = [[], [segment], [segment]]
 
-    def get_segment_ids_side_effect(*args, **kwargs):
-        nonlocal segment_ids_responses
-        return segment_ids_responses.pop(0)
+    def get_identity_segments_side_effect(environment_model, identity_model):
+        segment_ids = segment_ids_responses.pop(0)
+        return [s for s in environment_model.project.segments if s.id in segment_ids]
 
     edge_identity_dynamo_wrapper_mock.get_item_from_uuid_or_404.return_value = (
         identity_document_without_fs
     )
-    edge_identity_dynamo_wrapper_mock.get_segment_ids.side_effect = (
-        get_segment_ids_side_effect
+    mocker.patch(
+        "edge_api.identities.models.get_identity_segments",
+        side_effect=get_identity_segments_side_effect,
     )
 
     # First, let's verify that, without any overrides, the endpoint gives us the
@@ -5,6 +5,10 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.exceptions import NotFound
 
+from edge_api.identities import edge_identity_service
+from edge_api.identities.edge_identity_service import (
+    EDGE_IDENTITIES_LIST_PROJECTION_EXPRESSION,
+)
 from edge_api.identities.views import EdgeIdentityViewSet
 
 
@@ -197,7 +201,10 @@ def test_identity_list_pagination(
 
     # And verify that get_all_items was called with correct arguments
     edge_identity_dynamo_wrapper_mock.get_all_items.assert_called_with(
-        environment_api_key, 1, identity_item_key
+        environment_api_key,
+        1,
+        identity_item_key,
+        projection_expression=EDGE_IDENTITIES_LIST_PROJECTION_EXPRESSION,
     )
     # And `last_evaluated_key` is now None
     assert response.status_code == 200
@@ -233,7 +240,10 @@ def test_get_identities_list(
     # Then
     assert response.status_code == status.HTTP_200_OK
     edge_identity_dynamo_wrapper_mock.get_all_items.assert_called_with(
-        environment_api_key, 100, None
+        environment_api_key,
+        100,
+        None,
+        projection_expression=EDGE_IDENTITIES_LIST_PROJECTION_EXPRESSION,
     )
 
 
@@ -271,6 +281,7 @@ def test_search_identities_without_exact_match(
         EdgeIdentityViewSet.dynamo_identifier_search_functions["BEGINS_WITH"],
         100,
         None,
+        projection_expression=EDGE_IDENTITIES_LIST_PROJECTION_EXPRESSION,
     )
 
 
@@ -310,6 +321,100 @@ def test_search_for_identities_with_exact_match(
         EdgeIdentityViewSet.dynamo_identifier_search_functions["EQUAL"],
         100,
         None,
+        projection_expression=EDGE_IDENTITIES_LIST_PROJECTION_EXPRESSION,
+    )
+
+
+def test_search_identities_case_insensitive(
+    admin_client,
+    dynamo_enabled_environment,
+    environment_api_key,
+    identity_document,
+    edge_identity_dynamo_wrapper_mock,
+    settings,
+):
+    # Given
+    settings.IDENTITIES_TABLE_LOWERCASE_IDENTIFIER_INDEX_NAME_DYNAMO = (
+        "environment_api_key-identifier_lowercase-index"
+    )
+    base_url = reverse(
+        "api-v1:environments:environment-edge-identities-list",
+        args=[environment_api_key],
+    )
+    url = "%s?q=%s" % (base_url, "USER_1")
+    search_mock = (
+        edge_identity_dynamo_wrapper_mock.search_items_with_identifier_prefix_case_insensitive
+    )
+    search_mock.return_value = {"Items": [identity_document], "Count": 1}
+
+    # When
+    response = admin_client.get(url)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["results"][0]["identifier"] == "user_1_test"
+
+    search_mock.assert_called_with(
+        environment_api_key,
+        "USER_1",
+        100,
+        None,
+        projection_expression=EDGE_IDENTITIES_LIST_PROJECTION_EXPRESSION,
+    )
+    edge_identity_dynamo_wrapper_mock.search_items_with_identifier.assert_not_called()
+
+
+def test_identity_list_pagination__cache_enabled__prefetches_next_page(
+    admin_client,
+    dynamo_enabled_environment,
+    environment_api_key,
+    identity_document,
+    edge_identity_dynamo_wrapper_mock,
+    settings,
+    mocker,
+):
+    # Given
+    settings.EDGE_IDENTITIES_LIST_CACHE_SECONDS = 60
+    settings.EDGE_IDENTITIES_LIST_PREFETCH_NEXT_PAGE = True
+    edge_identity_service.edge_identities_list_cache.clear()
+    mocker.patch.object(
+        edge_identity_service, "_prefetch_executor"
+    ).submit.side_effect = lambda func, *args: func(*args)
+
+    identity_item_key = {
+        k: v
+        for k, v in identity_document.items()
+        if k in ["composite_key", "environment_api_key", "identifier"]
+    }
+    edge_identity_dynamo_wrapper_mock.get_all_items.side_effect = [
+        {"Items": [identity_document], "LastEvaluatedKey": identity_item_key},
+        {"Items": [identity_document]},
+    ]
+
+    url = "%s?page_size=1" % reverse(
+        "api-v1:environments:environment-edge-identities-list",
+        args=[environment_api_key],
+    )
+    first_page_response = admin_client.get(url)
+    last_evaluated_key = first_page_response.json()["last_evaluated_key"]
+
+    # When
+    second_page_response = admin_client.get(
+        f"{url}&last_evaluated_key={last_evaluated_key}"
+    )
+
+    # Then
+    assert second_page_response.status_code == status.HTTP_200_OK
+    assert second_page_response.json()["last_evaluated_key"] is None
+    assert len(second_page_response.json()["results"]) == 1
+
+    # The second page was fetched when the first page was requested.
+    assert edge_identity_dynamo_wrapper_mock.get_all_items.call_count == 2
+    edge_identity_dynamo_wrapper_mock.get_all_items.assert_called_with(
+        environment_api_key,
+        1,
+        identity_item_key,
+        projection_expression=EDGE_IDENTITIES_LIST_PROJECTION_EXPRESSION,
     )
 
 
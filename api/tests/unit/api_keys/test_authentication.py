@@ -3,6 +3,7 @@ from django.utils import timezone
 from rest_framework.exceptions import AuthenticationFailed
 
 from api_keys.authentication import MasterAPIKeyAuthentication
+from api_keys.models import MasterAPIKey
 
 
 def test_authenticate_returns_api_key_user_for_valid_key(master_api_key, rf):
@@ -64,3 +65,54 @@ def test_authenticate_raises_error_for_revoked_key(rf, master_api_key):
         MasterAPIKeyAuthentication().authenticate(request)
 
     # Then - exception was raised
+
+
+def test_authenticate_does_not_verify_key_again_once_cached(rf, master_api_key, mocker):
+    # Given
+    master_api_key, key = master_api_key
+    request = rf.get("/some-endpoint", HTTP_AUTHORIZATION="Api-Key " + key)
+    MasterAPIKeyAuthentication().authenticate(request)
+
+    get_from_key_spy = mocker.spy(MasterAPIKey.objects, "get_from_key")
+
+    # When
+    user, _ = MasterAPIKeyAuthentication().authenticate(request)
+
+    # Then
+    assert user.key == master_api_key
+    get_from_key_spy.assert_not_called()
+
+
+def test_authenticate_raises_error_for_cached_key_which_has_been_revoked(
+    rf, master_api_key
+):
+    # Given
+    master_api_key, key = master_api_key
+    request = rf.get("/some-endpoint", HTTP_AUTHORIZATION="Api-Key " + key)
+    MasterAPIKeyAuthentication().authenticate(request)
+
+    master_api_key.revoked = True
+    master_api_key.save()
+
+    # When
+    with pytest.raises(AuthenticationFailed):
+        MasterAPIKeyAuthentication().authenticate(request)
+
+    # Then - exception was raised
+
+
+def test_authenticate_raises_error_for_cached_key_which_has_been_deleted(
+    rf, master_api_key
+):
+    # Given
+    master_api_key, key = master_api_key
+    request = rf.get("/some-endpoint", HTTP_AUTHORIZATION="Api-Key " + key)
+    MasterAPIKeyAuthentication().authenticate(request)
+
+    master_api_key.delete()
+
+    # When
+    with pytest.raises(AuthenticationFailed):
+        MasterAPIKeyAuthentication().authenticate(request)
+
+    # Then - exception was raised
@@ -1,7 +1,12 @@
+import pytest
+from django.test import RequestFactory
 from django.urls import reverse
+from pytest_django.fixtures import SettingsWrapper
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from app.views import request_metrics
+
 
 def test_get_version_info(api_client: APIClient) -> None:
     # Given
@@ -18,3 +23,31 @@ def test_get_version_info(api_client: APIClient) -> None:
         "is_enterprise": False,
         "is_saas": False,
     }
+
+
+@pytest.mark.parametrize(
+    "metrics_token, authorization, expected_status",
+    (
+        ("secret", "Bearer secret", status.HTTP_200_OK),
+        ("secret", "Bearer wrong", status.HTTP_403_FORBIDDEN),
+        ("secret", None, status.HTTP_403_FORBIDDEN),
+        (None, "Bearer None", status.HTTP_403_FORBIDDEN),
+    ),
+)
+def test_request_metrics__requires_metrics_token(
+    rf: RequestFactory,
+    settings: SettingsWrapper,
+    metrics_token: str | None,
+    authorization: str | None,
+    expected_status: int,
+) -> None:
+    # Given
+    settings.REQUEST_PROFILING_METRICS_TOKEN = metrics_token
+    headers = {"HTTP_AUTHORIZATION": authorization} if authorization else {}
+    request = rf.get("/metrics", **headers)
+
+    # When
+    response = request_metrics(request)
+
+    # Then
+    assert response.status_code == expected_status
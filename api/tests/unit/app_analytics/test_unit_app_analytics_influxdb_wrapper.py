@@ -1,4 +1,4 @@
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 from typing import Generator, Type
 from unittest import mock
 from unittest.mock import MagicMock
@@ -9,6 +9,7 @@ from _pytest.monkeypatch import MonkeyPatch
 from app_analytics.influxdb_wrapper import (
     InfluxDBWrapper,
     build_filter_string,
+    get_current_api_usages,
     get_event_list_for_organisation,
     get_events_for_organisation,
     get_feature_evaluation_data,
@@ -16,11 +17,14 @@ from app_analytics.influxdb_wrapper import (
     get_multiple_event_list_for_organisation,
     get_top_organisations,
     get_usage_data,
+    usage_data_cache,
 )
 from django.conf import settings
 from django.utils import timezone
+from freezegun.api import FrozenDateTimeFactory
 from influxdb_client.client.exceptions import InfluxDBError
 from influxdb_client.rest import ApiException
+from pytest_django.fixtures import SettingsWrapper
 from pytest_mock import MockerFixture
 from urllib3.exceptions import HTTPError
 
@@ -183,7 +187,6 @@ def test_influx_db_query_when_get_events_list_then_query_api_called(monkeypatch)
 def test_influx_db_query_when_get_multiple_events_for_organisation_then_query_api_called(
     monkeypatch, project_id, environment_id, expected_filters
 ):
-
     expected_query = (
         (
             f'from(bucket:"{read_bucket}") '
@@ -442,6 +445,43 @@ def test_get_top_organisations_value_error(
     assert dataset == {456: 43}
 
 
+def test_get_current_api_usages(
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    record_mock1 = mock.MagicMock()
+    record_mock1.values = {"organisation_id": "123"}
+    record_mock1.get_value.return_value = 23
+
+    record_mock2 = mock.MagicMock()
+    record_mock2.values = {"organisation_id": "456"}
+    record_mock2.get_value.return_value = 43
+
+    result = mock.MagicMock()
+    result.records = [record_mock1, record_mock2]
+
+    influx_mock = mocker.patch(
+        "app_analytics.influxdb_wrapper.InfluxDBWrapper.influx_query_manager"
+    )
+
+    influx_mock.return_value = [result]
+
+    # When
+    api_usages = get_current_api_usages([123, 456, 789], "30d")
+
+    # Then
+    # Organisations without any usage recorded are included.
+    assert api_usages == {123: 23, 456: 43, 789: 0}
+
+    influx_mock.assert_called_once()
+    influx_query_call = influx_mock.call_args
+    assert influx_query_call.kwargs["date_start"] == "30d"
+    assert (
+        'contains(value: r["organisation_id"], set: ["123", "456", "789"])'
+        in influx_query_call.kwargs["filters"]
+    )
+
+
 def test_early_return_for_empty_range_for_influx_query_manager() -> None:
     # When
     results = InfluxDBWrapper.influx_query_manager(
@@ -451,3 +491,67 @@ def test_early_return_for_empty_range_for_influx_query_manager() -> None:
 
     # Then
     assert results == []
+
+
+@pytest.mark.freeze_time("2023-01-19T09:00:00+00:00")
+def test_get_multiple_event_list_for_organisation_only_requeries_latest_window(
+    mocker: MockerFixture,
+    settings: SettingsWrapper,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    # Given
+    settings.CACHE_USAGE_DATA_SECONDS = 60
+    usage_data_cache.clear()
+
+    def _table(*values: tuple[str, int]) -> MagicMock:
+        table = mock.MagicMock()
+        table.records = []
+        for time, value in values:
+            record = mock.MagicMock()
+            record.values = {
+                "_time": datetime.fromisoformat(time),
+                "_value": value,
+                "resource": "flags",
+            }
+            table.records.append(record)
+        return table
+
+    influx_mock = mocker.patch(
+        "app_analytics.influxdb_wrapper.InfluxDBWrapper.influx_query_manager",
+        side_effect=[
+            [
+                _table(
+                    ("2023-01-18T00:00:00+00:00", 1),
+                    ("2023-01-19T00:00:00+00:00", 2),
+                    ("2023-01-19T09:00:00+00:00", 3),
+                )
+            ],
+            [_table(("2023-01-19T10:00:00+00:00", 5))],
+        ],
+    )
+
+    # When
+    first_event_list = get_multiple_event_list_for_organisation(org_id)
+    cached_event_list = get_multiple_event_list_for_organisation(org_id)
+    freezer.move_to("2023-01-19T10:00:00+00:00")
+    refreshed_event_list = get_multiple_event_list_for_organisation(org_id)
+
+    # Then
+    assert (
+        first_event_list
+        == cached_event_list
+        == [
+            {"name": "2023-01-18", "Flags": 1},
+            {"name": "2023-01-19", "Flags": 2},
+            {"name": "2023-01-19", "Flags": 3},
+        ]
+    )
+    assert refreshed_event_list == [
+        {"name": "2023-01-18", "Flags": 1},
+        {"name": "2023-01-19", "Flags": 2},
+        {"name": "2023-01-19", "Flags": 5},
+    ]
+
+    assert influx_mock.call_count == 2
+    assert influx_mock.call_args_list[0].kwargs["date_start"] == "-30d"
+    assert influx_mock.call_args_list[1].kwargs["date_start"] == "2023-01-19T00:00:00Z"
@@ -3,6 +3,7 @@ from pytest_mock import MockerFixture
 from audit.models import AuditLog
 from audit.related_object_type import RelatedObjectType
 from audit.serializers import AuditLogListSerializer
+from environments.models import Environment
 from integrations.datadog.models import DataDogConfiguration
 from organisations.models import Organisation, OrganisationWebhook
 from projects.models import Project
@@ -228,3 +229,14 @@ def test_creating_audit_logs_for_change_request_does_not_trigger_process_environ
     # Then
     process_environment_update.delay.assert_not_called()
     assert audit_log.created_date != environment.updated_at
+
+
+def test_audit_log_organisation_is_set_from_environment(
+    environment: Environment,
+) -> None:
+    # When
+    audit_log = AuditLog.objects.create(environment=environment)
+
+    # Then
+    assert audit_log.project == environment.project
+    assert audit_log.organisation_id == environment.project.organisation_id
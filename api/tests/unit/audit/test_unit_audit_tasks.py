@@ -1,4 +1,10 @@
+from datetime import timedelta
+
+import pytest
 from django.utils import timezone
+from pytest_django import DjangoAssertNumQueries
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockerFixture
 
 from audit.constants import (
     FEATURE_STATE_UPDATED_BY_CHANGE_REQUEST_MESSAGE,
@@ -8,13 +14,17 @@ from audit.models import AuditLog
 from audit.related_object_type import RelatedObjectType
 from audit.tasks import (
     create_audit_log_from_historical_record,
+    create_audit_logs_for_bulk_created_objects,
+    create_audit_logs_from_historical_records,
     create_feature_state_updated_by_change_request_audit_log,
     create_feature_state_went_live_audit_log,
     create_segment_priorities_changed_audit_log,
+    delete_expired_audit_logs,
 )
 from environments.models import Environment
 from features.models import Feature, FeatureSegment, FeatureState
 from features.versioning.tasks import enable_v2_versioning
+from projects.models import Project
 from segments.models import Segment
 from users.models import FFAdminUser
 
@@ -217,6 +227,116 @@ def test_create_audit_log_from_historical_record_creates_audit_log_with_correct_
     )
 
 
+def test_create_audit_logs_from_historical_records_creates_audit_logs_in_bulk(
+    admin_user: FFAdminUser,
+    project: Project,
+    environment: Environment,
+    mocker,
+) -> None:
+    # Given
+    features = [
+        Feature.objects.create(name=f"feature_{i}", project=project) for i in range(2)
+    ]
+    AuditLog.objects.all().delete()
+
+    mocked_process_environment_update = mocker.patch(
+        "environments.tasks.process_environment_update"
+    )
+    mocked_organisation_webhook = mocker.patch("audit.signals.OrganisationWebhook")
+
+    historical_records = [
+        {
+            "history_instance_id": feature.history.first().history_id,
+            "history_user_id": admin_user.id,
+            "history_record_class_path": feature.history_record_class_path,
+        }
+        for feature in features
+    ]
+
+    # When
+    create_audit_logs_from_historical_records(historical_records)
+
+    # Then
+    audit_logs = AuditLog.objects.filter(
+        related_object_type=RelatedObjectType.FEATURE.name
+    )
+    assert {audit_log.related_object_id for audit_log in audit_logs} == {
+        feature.id for feature in features
+    }
+    assert all(
+        audit_log.project == project
+        and audit_log.organisation_id == project.organisation_id
+        and audit_log.author == admin_user
+        for audit_log in audit_logs
+    )
+
+    # the environment is only updated once for the whole batch
+    mocked_process_environment_update.delay.assert_called_once()
+    environment.refresh_from_db()
+    assert environment.updated_at == max(a.created_date for a in audit_logs)
+
+    # but the post_save receivers are called for each audit log
+    assert mocked_organisation_webhook.objects.filter.call_count == 2
+
+
+def test_create_audit_logs_from_historical_records_ignores_missing_historical_records(
+    admin_user: FFAdminUser,
+    feature: Feature,
+) -> None:
+    # Given
+    AuditLog.objects.all().delete()
+
+    # When
+    create_audit_logs_from_historical_records(
+        [
+            {
+                "history_instance_id": feature.history.first().history_id + 1000,
+                "history_user_id": admin_user.id,
+                "history_record_class_path": feature.history_record_class_path,
+            }
+        ]
+    )
+
+    # Then
+    assert not AuditLog.objects.exists()
+
+
+@pytest.mark.parametrize("environment_count", (1, 3))
+def test_create_audit_logs_for_bulk_created_objects_query_count_does_not_grow_with_environments(
+    admin_user: FFAdminUser,
+    project: Project,
+    mocker: MockerFixture,
+    django_assert_num_queries: DjangoAssertNumQueries,
+    environment_count: int,
+) -> None:
+    # Given
+    for i in range(environment_count):
+        Environment.objects.create(name=f"environment_{i}", project=project)
+    feature = Feature.objects.create(name="feature", project=project)
+
+    # the feature states, as held in memory when they were bulk created
+    feature_states = list(
+        FeatureState.objects.filter(feature=feature).select_related(
+            "environment__project", "feature__project"
+        )
+    )
+    FeatureState.history.filter(feature=feature).update(history_user=admin_user)
+
+    mocked_bulk_create_audit_logs = mocker.patch("audit.tasks._bulk_create_audit_logs")
+
+    # When
+    with django_assert_num_queries(1):
+        create_audit_logs_for_bulk_created_objects(feature_states, FeatureState)
+
+    # Then
+    [audit_logs], _ = mocked_bulk_create_audit_logs.call_args
+    assert len(audit_logs) == environment_count
+    assert {audit_log.environment for audit_log in audit_logs} == {
+        feature_state.environment for feature_state in feature_states
+    }
+    assert all(audit_log.author == admin_user for audit_log in audit_logs)
+
+
 def test_create_segment_priorities_changed_audit_log(
     admin_user: FFAdminUser,
     feature_segment: FeatureSegment,
@@ -392,3 +512,48 @@ def test_create_feature_state_wen_live_audit_log_does_nothing_if_feature_state_d
         ).count()
         == 0
     )
+
+
+def test_delete_expired_audit_logs(
+    project: Project,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.AUDIT_LOG_RETENTION_DAYS = 30
+    settings.AUDIT_LOG_RETENTION_DELETE_BATCH_SIZE = 1
+
+    expired_audit_logs = [
+        AuditLog.objects.create(
+            project=project, created_date=timezone.now() - timedelta(days=31)
+        )
+        for _ in range(2)
+    ]
+    audit_log = AuditLog.objects.create(
+        project=project, created_date=timezone.now() - timedelta(days=29)
+    )
+
+    # When
+    delete_expired_audit_logs()
+
+    # Then
+    assert not AuditLog.objects.filter(
+        id__in=[expired_audit_log.id for expired_audit_log in expired_audit_logs]
+    ).exists()
+    assert AuditLog.objects.filter(id=audit_log.id).exists()
+
+
+def test_delete_expired_audit_logs_does_nothing_if_retention_not_set(
+    project: Project,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.AUDIT_LOG_RETENTION_DAYS = 0
+    audit_log = AuditLog.objects.create(
+        project=project, created_date=timezone.now() - timedelta(days=365 * 10)
+    )
+
+    # When
+    delete_expired_audit_logs()
+
+    # Then
+    assert AuditLog.objects.filter(id=audit_log.id).exists()
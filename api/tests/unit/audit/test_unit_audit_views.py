@@ -1,7 +1,9 @@
 import typing
+from datetime import timedelta
 
 from django.db.models import Model
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient
 
@@ -186,3 +188,28 @@ def test_retrieve_environment_feature_version_published_audit_log_record_include
         response_json["log"]
         == ENVIRONMENT_FEATURE_VERSION_PUBLISHED_MESSAGE % feature.name
     )
+
+
+def test_audit_log_can_be_listed_with_cursor_pagination(
+    admin_client: APIClient,
+    project: Project,
+) -> None:
+    # Given
+    for i in range(3):
+        AuditLog.objects.create(
+            project=project,
+            log=f"log {i}",
+            created_date=timezone.now() - timedelta(minutes=i),
+        )
+
+    url = reverse("api-v1:audit-list")
+
+    # When
+    first_page = admin_client.get(url, {"cursor": "", "page_size": 2}).json()
+    second_page = admin_client.get(first_page["next"]).json()
+
+    # Then
+    assert "count" not in first_page
+    assert [result["log"] for result in first_page["results"]] == ["log 0", "log 1"]
+    assert [result["log"] for result in second_page["results"]] == ["log 2"]
+    assert second_page["next"] is None
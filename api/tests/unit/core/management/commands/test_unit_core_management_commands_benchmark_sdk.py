@@ -0,0 +1,66 @@
+import json
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from organisations.models import Organisation
+
+SMALL_DATASET_ARGS = [
+    "--features=10",
+    "--multivariate-features-percentage=50",
+    "--segments=3",
+    "--overrides-per-segment=2",
+    "--identities=2",
+    "--traits-per-identity=8",
+    "--overrides-per-identity=2",
+    "--iterations=1",
+    "--clone-iterations=1",
+]
+
+
+def test_benchmark_sdk_writes_results_and_rolls_back_dataset(
+    tmp_path: Path,
+    db: None,
+) -> None:
+    # Given
+    output = tmp_path / "results.json"
+
+    # When
+    call_command("benchmark_sdk", *SMALL_DATASET_ARGS, f"--output={output}")
+
+    # Then
+    report = json.loads(output.read_text())
+    assert report["seed"] == 42
+    assert report["dataset"]["features"] == 10
+    assert {
+        "Identity.get_all_feature_states[v1]",
+        "GET /api/v1/identities/[v2]",
+        "Environment.clone[v2]",
+    }.issubset(report["results"])
+    assert report["results"]["get_environment_flags_list[v1]"]["iterations"] == 1
+
+    assert not Organisation.objects.filter(name="Benchmark 42").exists()
+
+
+def test_benchmark_sdk_raises_command_error_if_regressions_are_found(
+    tmp_path: Path,
+    db: None,
+) -> None:
+    # Given
+    output = tmp_path / "results.json"
+    baseline = tmp_path / "baseline.json"
+
+    call_command("benchmark_sdk", *SMALL_DATASET_ARGS, f"--output={output}")
+    report = json.loads(output.read_text())
+    for result in report["results"].values():
+        result["median_ms"] = 0.000001
+    baseline.write_text(json.dumps(report))
+
+    # When
+    with pytest.raises(CommandError) as e:
+        call_command("benchmark_sdk", *SMALL_DATASET_ARGS, f"--compare={baseline}")
+
+    # Then
+    assert "Regressions found in" in str(e.value)
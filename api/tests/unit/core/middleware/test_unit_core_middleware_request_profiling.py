@@ -0,0 +1,162 @@
+import typing
+
+import pytest
+from core.middleware.request_profiling import RequestProfilingMiddleware
+from core.request_profiling import (
+    SECTION_SERIALIZATION,
+    QueryTimer,
+    profile_section,
+    record_cache_lookup,
+    render_metrics,
+    reset_metrics,
+)
+from django.db import connection
+from django.http import HttpResponse
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockerFixture
+
+from environments.identities.views import SDKIdentities
+from organisations.models import Organisation
+
+
+@pytest.fixture(autouse=True)
+def clear_request_metrics() -> typing.Generator[None, None, None]:
+    reset_metrics()
+    yield
+    reset_metrics()
+
+
+def test_request_profiling_middleware_records_metrics_for_profiled_view(
+    mocker: MockerFixture,
+    settings: SettingsWrapper,
+    db: None,
+) -> None:
+    # Given
+    settings.REQUEST_PROFILING_VIEWS = ["SDKIdentities"]
+    request = mocker.MagicMock()
+    view_func = SDKIdentities.as_view()
+
+    def get_response(request):
+        middleware.process_view(request, view_func, (), {})
+        Organisation.objects.count()
+        record_cache_lookup("environment-objects", hit=True)
+        record_cache_lookup("environment-segments", hit=False)
+        with profile_section(SECTION_SERIALIZATION):
+            pass
+        return HttpResponse()
+
+    middleware = RequestProfilingMiddleware(get_response)
+
+    # When
+    middleware(request)
+
+    # Then
+    metrics = render_metrics()
+    assert 'flagsmith_request_duration_seconds_count{endpoint="SDKIdentities"} 1' in (
+        metrics
+    )
+    assert 'flagsmith_request_db_queries_sum{endpoint="SDKIdentities"} 1' in metrics
+    assert (
+        'flagsmith_request_section_duration_seconds_count{endpoint="SDKIdentities",'
+        'section="serialization"} 1'
+    ) in metrics
+    assert (
+        'flagsmith_request_cache_lookups_total{endpoint="SDKIdentities",'
+        'cache="environment-objects",result="hit"} 1'
+    ) in metrics
+    assert (
+        'flagsmith_request_cache_lookups_total{endpoint="SDKIdentities",'
+        'cache="environment-segments",result="miss"} 1'
+    ) in metrics
+
+
+def test_request_profiling_middleware_ignores_views_which_are_not_profiled(
+    mocker: MockerFixture,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.REQUEST_PROFILING_VIEWS = ["SDKFeatureStates"]
+    request = mocker.MagicMock()
+    view_func = SDKIdentities.as_view()
+
+    def get_response(request):
+        middleware.process_view(request, view_func, (), {})
+        record_cache_lookup("environment-objects", hit=True)
+        return HttpResponse()
+
+    middleware = RequestProfilingMiddleware(get_response)
+
+    # When
+    middleware(request)
+
+    # Then
+    assert "endpoint=" not in render_metrics()
+
+
+@pytest.mark.parametrize(
+    "profiled_views, expected_query_timer_count",
+    ((["SDKIdentities"], 1), (["SDKFeatureStates"], 0)),
+)
+def test_request_profiling_middleware_only_times_queries_of_profiled_views(
+    mocker: MockerFixture,
+    settings: SettingsWrapper,
+    profiled_views: list[str],
+    expected_query_timer_count: int,
+) -> None:
+    # Given
+    settings.REQUEST_PROFILING_VIEWS = profiled_views
+    request = mocker.MagicMock()
+    view_func = SDKIdentities.as_view()
+    query_timer_counts = []
+
+    def get_response(request):
+        middleware.process_view(request, view_func, (), {})
+        query_timer_counts.append(
+            sum(
+                isinstance(wrapper, QueryTimer)
+                for wrapper in connection.execute_wrappers
+            )
+        )
+        return HttpResponse()
+
+    middleware = RequestProfilingMiddleware(get_response)
+
+    # When
+    middleware(request)
+
+    # Then
+    assert query_timer_counts == [expected_query_timer_count]
+    assert not any(
+        isinstance(wrapper, QueryTimer) for wrapper in connection.execute_wrappers
+    )
+
+
+def test_request_profiling_middleware_logs_slow_requests(
+    mocker: MockerFixture,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.REQUEST_PROFILING_VIEWS = ["SDKIdentities"]
+    settings.REQUEST_PROFILING_SLOW_REQUEST_THRESHOLD_MS = 1
+    settings.REQUEST_PROFILING_SLOW_REQUEST_SAMPLE_RATE = 1.0
+    mocker.patch("core.middleware.request_profiling.perf_counter", side_effect=[0, 0.5])
+    mock_logger = mocker.patch("core.middleware.request_profiling.logger")
+    request = mocker.MagicMock()
+    view_func = SDKIdentities.as_view()
+
+    def get_response(request):
+        middleware.process_view(request, view_func, (), {})
+        return HttpResponse()
+
+    middleware = RequestProfilingMiddleware(get_response)
+
+    # When
+    middleware(request)
+
+    # Then
+    mock_logger.warning.assert_called_once_with(
+        "Slow request to %s took %.2fms: %s",
+        "SDKIdentities",
+        500.0,
+        mocker.ANY,
+    )
@@ -0,0 +1,117 @@
+from django.db import transaction
+from pytest_django.fixtures import SettingsWrapper
+from task_processor.task_run_method import TaskRunMethod
+
+from features.models import Feature
+from projects.models import Project
+
+
+def test_create_audit_log_from_historical_record_queues_single_task_per_transaction(
+    project: Project,
+    settings: SettingsWrapper,
+    django_capture_on_commit_callbacks,
+    mocker,
+) -> None:
+    # Given
+    settings.TASK_RUN_METHOD = TaskRunMethod.TASK_PROCESSOR
+    mocked_tasks = mocker.patch("core.signals.tasks")
+
+    # When
+    with django_capture_on_commit_callbacks(execute=True):
+        with transaction.atomic():
+            features = [
+                Feature.objects.create(name=f"feature_{i}", project=project)
+                for i in range(3)
+            ]
+
+    # Then
+    mocked_tasks.create_audit_log_from_historical_record.delay.assert_not_called()
+    mocked_tasks.create_audit_logs_from_historical_records.delay.assert_called_once()
+
+    call_args = mocked_tasks.create_audit_logs_from_historical_records.delay.call_args
+    historical_records = call_args.kwargs["kwargs"]["historical_records"]
+    assert {
+        record["history_instance_id"]
+        for record in historical_records
+        if record["history_record_class_path"] == Feature.history_record_class_path
+    } == {feature.history.first().history_id for feature in features}
+
+
+def test_create_audit_log_from_historical_record_discards_rolled_back_records(
+    project: Project,
+    settings: SettingsWrapper,
+    django_capture_on_commit_callbacks,
+    mocker,
+) -> None:
+    # Given
+    settings.TASK_RUN_METHOD = TaskRunMethod.TASK_PROCESSOR
+    mocked_tasks = mocker.patch("core.signals.tasks")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        try:
+            with transaction.atomic():
+                Feature.objects.create(name="rolled_back", project=project)
+                raise RuntimeError()
+        except RuntimeError:
+            pass
+
+    # When
+    with django_capture_on_commit_callbacks(execute=True):
+        with transaction.atomic():
+            feature = Feature.objects.create(name="committed", project=project)
+
+    # Then
+    mocked_tasks.create_audit_logs_from_historical_records.delay.assert_called_once()
+    call_args = mocked_tasks.create_audit_logs_from_historical_records.delay.call_args
+    historical_records = call_args.kwargs["kwargs"]["historical_records"]
+    assert {record["history_instance_id"] for record in historical_records} == {
+        feature.history.first().history_id
+    }
+
+
+def test_create_audit_log_from_historical_record_keeps_records_created_after_savepoint_rollback(
+    project: Project,
+    settings: SettingsWrapper,
+    django_capture_on_commit_callbacks,
+    mocker,
+) -> None:
+    # Given
+    settings.TASK_RUN_METHOD = TaskRunMethod.TASK_PROCESSOR
+    mocked_tasks = mocker.patch("core.signals.tasks")
+
+    # When
+    with django_capture_on_commit_callbacks(execute=True):
+        with transaction.atomic():
+            try:
+                with transaction.atomic():
+                    Feature.objects.create(name="rolled_back", project=project)
+                    raise RuntimeError()
+            except RuntimeError:
+                pass
+
+            feature = Feature.objects.create(name="committed", project=project)
+
+    # Then
+    mocked_tasks.create_audit_logs_from_historical_records.delay.assert_called_once()
+    call_args = mocked_tasks.create_audit_logs_from_historical_records.delay.call_args
+    historical_records = call_args.kwargs["kwargs"]["historical_records"]
+    assert {record["history_instance_id"] for record in historical_records} == {
+        feature.history.first().history_id
+    }
+
+
+def test_create_audit_log_from_historical_record_queues_task_per_record_without_task_processor(
+    project: Project,
+    settings: SettingsWrapper,
+    mocker,
+) -> None:
+    # Given
+    settings.TASK_RUN_METHOD = TaskRunMethod.SYNCHRONOUSLY
+    mocked_tasks = mocker.patch("core.signals.tasks")
+
+    # When
+    Feature.objects.create(name="feature", project=project)
+
+    # Then
+    mocked_tasks.create_audit_log_from_historical_record.delay.assert_called_once()
+    mocked_tasks.create_audit_logs_from_historical_records.delay.assert_not_called()
@@ -10,7 +10,7 @@ from pytest_django import DjangoAssertNumQueries
 from pytest_mock import MockerFixture
 
 from edge_api.identities.models import EdgeIdentity
-from environments.models import Environment
+from environments.models import Environment, environment_engine_model_cache
 from features.models import Feature, FeatureSegment, FeatureState
 from features.versioning.tasks import enable_v2_versioning
 from features.workflows.core.models import ChangeRequest
@@ -23,13 +23,10 @@ def test_get_all_feature_states_for_edge_identity_uses_segment_priorities(
     # Given
     another_segment = Segment.objects.create(name="another_segment", project=project)
 
-    edge_identity_dynamo_wrapper_mock = mocker.patch(
-        "edge_api.identities.models.EdgeIdentity.dynamo_wrapper",
+    mocked_get_identity_segments = mocker.patch(
+        "edge_api.identities.models.get_identity_segments",
+        side_effect=lambda environment_model, _: environment_model.project.segments,
     )
-    edge_identity_dynamo_wrapper_mock.get_segment_ids.return_value = [
-        segment.id,
-        another_segment.id,
-    ]
 
     feature_segment_p1 = FeatureSegment.objects.create(
         segment=segment, feature=feature, environment=environment, priority=1
@@ -51,25 +48,64 @@ def test_get_all_feature_states_for_edge_identity_uses_segment_priorities(
     edge_identity = EdgeIdentity(identity_model)
 
     # When
-    feature_states, _ = edge_identity.get_all_feature_states()
+    feature_states, _, segment_overrides = edge_identity.get_all_feature_states()
 
     # Then
     assert len(feature_states) == 1
-    assert feature_states[0] == segment_override_p1
+    assert feature_states[0].django_id == segment_override_p1.id
+    assert segment_overrides[feature.name].id == segment.id
 
-    edge_identity_dynamo_wrapper_mock.get_segment_ids.assert_called_once_with(
-        identity_model=identity_model
+    mocked_get_identity_segments.assert_called_once()
+    assert mocked_get_identity_segments.call_args.args[1] == identity_model
+
+
+def test_get_all_feature_states_for_edge_identity_uses_identity_overrides(
+    environment: Environment,
+    segment: Segment,
+    feature: Feature,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    mocker.patch(
+        "edge_api.identities.models.get_identity_segments",
+        side_effect=lambda environment_model, _: environment_model.project.segments,
     )
 
+    feature_segment = FeatureSegment.objects.create(
+        segment=segment, feature=feature, environment=environment
+    )
+    FeatureState.objects.create(
+        feature=feature, environment=environment, feature_segment=feature_segment
+    )
+
+    identity_override = FeatureStateModel(
+        feature=FeatureModel(id=feature.id, name=feature.name, type="STANDARD"),
+        enabled=True,
+    )
+    identity_model = mocker.MagicMock(
+        environment_api_key=environment.api_key,
+        identity_features=[identity_override],
+    )
+    edge_identity = EdgeIdentity(identity_model)
+
+    # When
+    (
+        feature_states,
+        identity_feature_names,
+        segment_overrides,
+    ) = edge_identity.get_all_feature_states()
+
+    # Then
+    assert feature_states == [identity_override]
+    assert identity_feature_names == {feature.name}
+    assert segment_overrides == {}
+
 
 def test_edge_identity_get_all_feature_states_ignores_not_live_feature_states(
     environment, project, segment, feature, feature_state, admin_user, mocker
 ):
     # Given
-    edge_identity_dynamo_wrapper_mock = mocker.patch(
-        "edge_api.identities.models.EdgeIdentity.dynamo_wrapper",
-    )
-    edge_identity_dynamo_wrapper_mock.get_segment_ids.return_value = []
+    mocker.patch("edge_api.identities.models.get_identity_segments", return_value=[])
 
     change_request = ChangeRequest.objects.create(
         title="Test CR", environment=environment, user=admin_user
@@ -89,10 +125,10 @@ def test_edge_identity_get_all_feature_states_ignores_not_live_feature_states(
 
     # When
     with freeze_time(timezone.now() + timedelta(hours=2)):
-        feature_states, _ = edge_identity.get_all_feature_states()
+        feature_states, _, _ = edge_identity.get_all_feature_states()
 
     # Then
-    assert feature_states == [feature_state]
+    assert [fs.django_id for fs in feature_states] == [feature_state.id]
 
 
 def test_edge_identity_from_identity_document():
@@ -477,6 +513,53 @@ def test_edge_identity_save_called_generate_audit_records_if_feature_override_up
     )
 
 
+def test_edge_identity_save_does_not_generate_audit_records_if_feature_override_reassigned_same_value(
+    mocker: MockerFixture,
+    edge_identity_model: EdgeIdentity,
+    edge_identity_dynamo_wrapper_mock: MagicMock,
+) -> None:
+    # Given
+    mocked_generate_audit_log_records = mocker.patch(
+        "edge_api.identities.models.generate_audit_log_records"
+    )
+
+    feature_state_model = FeatureStateModel(
+        feature=FeatureModel(id=1, name="test_feature", type="STANDARD"),
+        enabled=True,
+    )
+    feature_state_model.set_value("foo")
+    edge_identity_model.add_feature_override(feature_state_model)
+
+    user = mocker.MagicMock()
+
+    edge_identity_model.save(user=user)
+    mocked_generate_audit_log_records.reset_mock()
+
+    feature_override = edge_identity_model.get_feature_state_by_featurestate_uuid(
+        str(feature_state_model.featurestate_uuid)
+    )
+    feature_override.enabled = True
+    feature_override.set_value("foo")
+    feature_override.multivariate_feature_state_values = []
+
+    # When
+    edge_identity_model.save(user=user)
+
+    # Then
+    mocked_generate_audit_log_records.delay.assert_not_called()
+    assert edge_identity_model._initial_feature_overrides == {
+        feature_state_model.featurestate_uuid: feature_override
+    }
+
+
+@pytest.mark.parametrize(
+    "warm_cache, expected_num_queries",
+    (
+        # only the environment's updated_at is read when the engine model is cached
+        (True, 1),
+        (False, 10),
+    ),
+)
 def test_get_all_feature_states_post_v2_versioning_migration(
     environment: Environment,
     feature: Feature,
@@ -486,6 +569,8 @@ def test_get_all_feature_states_post_v2_versioning_migration(
     edge_identity_model: EdgeIdentity,
     mocker: MockerFixture,
     django_assert_num_queries: DjangoAssertNumQueries,
+    warm_cache: bool,
+    expected_num_queries: int,
 ) -> None:
     """
     Specific test to reproduce an issue seen after migrating our staging environment to
@@ -503,17 +588,22 @@ def test_get_all_feature_states_post_v2_versioning_migration(
 
     enable_v2_versioning(environment.id)
 
-    edge_identity_dynamo_wrapper_mock = mocker.patch(
-        "edge_api.identities.models.EdgeIdentity.dynamo_wrapper",
+    mocker.patch(
+        "edge_api.identities.models.get_identity_segments",
+        side_effect=lambda environment_model, _: environment_model.project.segments,
     )
-    edge_identity_dynamo_wrapper_mock.get_segment_ids.return_value = [segment.id]
+
+    environment_engine_model_cache.clear()
+    if warm_cache:
+        edge_identity_model.get_all_feature_states()
 
     # When
-    with django_assert_num_queries(4):
-        feature_states, identity_override_feature_names = (
+    with django_assert_num_queries(expected_num_queries):
+        feature_states, _, segment_overrides = (
             edge_identity_model.get_all_feature_states()
         )
 
     # Then
     assert len(feature_states) == 1
-    assert feature_states[0] == v2_segment_override
+    assert feature_states[0].django_id == v2_segment_override.id
+    assert segment_overrides[feature.name].id == segment.id
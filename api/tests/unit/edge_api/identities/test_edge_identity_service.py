@@ -0,0 +1,107 @@
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockerFixture
+
+from edge_api.identities import edge_identity_service
+from edge_api.identities.edge_identity_service import (
+    EDGE_IDENTITY_OVERRIDE_COUNT_MAX_QUERIES,
+    get_edge_identities_page,
+    get_edge_identity_override_counts,
+)
+
+
+def test_get_edge_identity_override_counts__few_features__counts_each_feature(
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    environment_id = 1
+    feature_ids = [1, 2, 3]
+    mock_dynamodb_wrapper = mocker.patch(
+        "edge_api.identities.edge_identity_service.ddb_environment_v2_wrapper"
+    )
+    mock_dynamodb_wrapper.count_identity_overrides_by_environment_id.side_effect = (
+        lambda environment_id, feature_id: feature_id * 10
+    )
+
+    # When
+    counts = get_edge_identity_override_counts(environment_id, feature_ids)
+
+    # Then
+    assert counts == {1: 10, 2: 20, 3: 30}
+    assert (
+        mock_dynamodb_wrapper.count_identity_overrides_by_environment_id.call_count
+        == len(feature_ids)
+    )
+    mock_dynamodb_wrapper.count_identity_overrides_by_feature_id.assert_not_called()
+
+
+def test_get_edge_identity_override_counts__many_features__makes_single_query(
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    environment_id = 1
+    feature_ids = list(range(1, EDGE_IDENTITY_OVERRIDE_COUNT_MAX_QUERIES + 2))
+    mock_dynamodb_wrapper = mocker.patch(
+        "edge_api.identities.edge_identity_service.ddb_environment_v2_wrapper"
+    )
+    mock_dynamodb_wrapper.count_identity_overrides_by_feature_id.return_value = {
+        1: 5,
+        2: 3,
+        # Overrides of features that weren't asked for are ignored.
+        9999: 1,
+    }
+
+    # When
+    counts = get_edge_identity_override_counts(environment_id, feature_ids)
+
+    # Then
+    assert counts == {feature_id: 0 for feature_id in feature_ids} | {1: 5, 2: 3}
+    mock_dynamodb_wrapper.count_identity_overrides_by_feature_id.assert_called_once_with(
+        environment_id=environment_id
+    )
+    mock_dynamodb_wrapper.count_identity_overrides_by_environment_id.assert_not_called()
+
+
+def test_get_edge_identities_page__process_local_cache__does_not_prefetch_next_page(
+    settings: SettingsWrapper,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    settings.EDGE_IDENTITIES_LIST_CACHE_SECONDS = 60
+    settings.EDGE_IDENTITIES_LIST_PREFETCH_NEXT_PAGE = False
+    edge_identity_service.edge_identities_list_cache.clear()
+    mock_prefetch_executor = mocker.patch.object(
+        edge_identity_service, "_prefetch_executor"
+    )
+    query = mocker.Mock(return_value={"Items": [], "LastEvaluatedKey": {"key": 1}})
+
+    # When
+    page = get_edge_identities_page("api-key", query, "query-key")
+
+    # Then
+    assert page == {"Items": [], "LastEvaluatedKey": {"key": 1}}
+    query.assert_called_once_with(None)
+    mock_prefetch_executor.submit.assert_not_called()
+
+
+def test_get_edge_identities_page__prefetch_already_queued__does_not_queue_again(
+    settings: SettingsWrapper,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    settings.EDGE_IDENTITIES_LIST_CACHE_SECONDS = 60
+    settings.EDGE_IDENTITIES_LIST_PREFETCH_NEXT_PAGE = True
+    edge_identity_service.edge_identities_list_cache.clear()
+    mocker.patch.object(edge_identity_service, "_pending_prefetch_cache_keys", set())
+    # the queued prefetches never run
+    mock_prefetch_executor = mocker.patch.object(
+        edge_identity_service, "_prefetch_executor"
+    )
+    query = mocker.Mock(return_value={"Items": [], "LastEvaluatedKey": {"key": 1}})
+
+    # When
+    get_edge_identities_page("api-key", query, "query-key")
+    get_edge_identities_page("api-key", query, "query-key")
+
+    # Then
+    query.assert_called_once_with(None)
+    mock_prefetch_executor.submit.assert_called_once()
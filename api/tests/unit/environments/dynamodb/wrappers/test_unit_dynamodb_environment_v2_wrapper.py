@@ -59,6 +59,77 @@ def test_environment_v2_wrapper__get_identity_overrides_by_environment_id__retur
     assert results[0] == override_document
 
 
+def test_environment_v2_wrapper__count_identity_overrides_by_environment_id__return_expected(
+    settings: SettingsWrapper,
+    environment: Environment,
+    flagsmith_environments_v2_table: Table,
+    feature: Feature,
+) -> None:
+    # Given
+    settings.ENVIRONMENTS_V2_TABLE_NAME_DYNAMO = flagsmith_environments_v2_table.name
+    wrapper = DynamoEnvironmentV2Wrapper()
+
+    for feature_id in (feature.id, feature.id, feature.id + 1):
+        flagsmith_environments_v2_table.put_item(
+            Item={
+                "environment_id": str(environment.id),
+                "document_key": get_environments_v2_identity_override_document_key(
+                    feature_id=feature_id, identity_uuid=str(uuid.uuid4())
+                ),
+                "environment_api_key": environment.api_key,
+                "identifier": "identity1",
+                "feature_state": {},
+            }
+        )
+    flagsmith_environments_v2_table.put_item(
+        Item=map_environment_to_environment_v2_document(environment)
+    )
+
+    # When
+    count = wrapper.count_identity_overrides_by_environment_id(
+        environment_id=environment.id,
+        feature_id=feature.id,
+    )
+
+    # Then
+    assert count == 2
+
+
+def test_environment_v2_wrapper__count_identity_overrides_by_feature_id__return_expected(
+    settings: SettingsWrapper,
+    environment: Environment,
+    flagsmith_environments_v2_table: Table,
+    feature: Feature,
+) -> None:
+    # Given
+    settings.ENVIRONMENTS_V2_TABLE_NAME_DYNAMO = flagsmith_environments_v2_table.name
+    wrapper = DynamoEnvironmentV2Wrapper()
+
+    for feature_id in (feature.id, feature.id, feature.id + 1):
+        flagsmith_environments_v2_table.put_item(
+            Item={
+                "environment_id": str(environment.id),
+                "document_key": get_environments_v2_identity_override_document_key(
+                    feature_id=feature_id, identity_uuid=str(uuid.uuid4())
+                ),
+                "environment_api_key": environment.api_key,
+                "identifier": "identity1",
+                "feature_state": {},
+            }
+        )
+    flagsmith_environments_v2_table.put_item(
+        Item=map_environment_to_environment_v2_document(environment)
+    )
+
+    # When
+    counts = wrapper.count_identity_overrides_by_feature_id(
+        environment_id=environment.id,
+    )
+
+    # Then
+    assert counts == {feature.id: 2, feature.id + 1: 1}
+
+
 def test_environment_v2_wrapper__get_identity_overrides_by_environment_id__last_evaluated_key__call_expected(
     flagsmith_environments_v2_table: Table,
     mocker: MockerFixture,
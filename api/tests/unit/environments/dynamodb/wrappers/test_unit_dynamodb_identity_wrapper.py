@@ -8,6 +8,7 @@ from django.core.exceptions import ObjectDoesNotExist
 from flag_engine.identities.models import IdentityModel
 from flag_engine.segments.constants import IN
 from mypy_boto3_dynamodb.service_resource import Table
+from pytest_django.fixtures import SettingsWrapper
 from pytest_mock import MockerFixture
 from rest_framework.exceptions import NotFound
 
@@ -17,6 +18,7 @@ from environments.identities.models import Identity
 from environments.identities.traits.models import Trait
 from segments.models import Condition, Segment, SegmentRule
 from util.mappers import (
+    map_engine_identity_to_identity_document,
     map_environment_to_environment_document,
     map_identity_to_identity_document,
 )
@@ -589,3 +591,61 @@ def test_delete_all_identities__deletes_all_identities_documents_from_dynamodb(
     # Then
     assert flagsmith_identities_table.scan()["Count"] == 1
     assert flagsmith_identities_table.scan()["Items"][0] == identity_three
+
+
+def test_get_all_items__projection_expression__returns_only_projected_attributes(
+    flagsmith_identities_table: Table,
+    dynamodb_identity_wrapper: DynamoIdentityWrapper,
+    identity: Identity,
+) -> None:
+    # Given
+    identity_document = map_identity_to_identity_document(identity)
+    flagsmith_identities_table.put_item(Item=identity_document)
+
+    # When
+    result = dynamodb_identity_wrapper.get_all_items(
+        identity.environment.api_key,
+        limit=10,
+        projection_expression="identifier, identity_uuid",
+    )
+
+    # Then
+    assert result["Items"] == [
+        {
+            "identifier": identity_document["identifier"],
+            "identity_uuid": identity_document["identity_uuid"],
+        }
+    ]
+
+
+def test_search_items_with_identifier_prefix_case_insensitive__returns_expected(
+    flagsmith_identities_table: Table,
+    dynamodb_identity_wrapper: DynamoIdentityWrapper,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.IDENTITIES_TABLE_LOWERCASE_IDENTIFIER_INDEX_NAME_DYNAMO = (
+        "environment_api_key-identifier_lowercase-index"
+    )
+    environment_api_key = "environment_one"
+    for identifier in ("User_One", "user_two", "other_user"):
+        flagsmith_identities_table.put_item(
+            Item=map_engine_identity_to_identity_document(
+                IdentityModel(
+                    identifier=identifier, environment_api_key=environment_api_key
+                )
+            )
+        )
+
+    # When
+    result = (
+        dynamodb_identity_wrapper.search_items_with_identifier_prefix_case_insensitive(
+            environment_api_key,
+            "USER_",
+            limit=10,
+            projection_expression="identifier",
+        )
+    )
+
+    # Then
+    assert result["Items"] == [{"identifier": "User_One"}, {"identifier": "user_two"}]
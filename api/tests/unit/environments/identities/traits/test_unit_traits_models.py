@@ -67,3 +67,29 @@ def test_trait_bulk_delete_deletes_objects(trait):
 
     # Then
     Trait.objects.filter(identity=trait.identity).count() == 0
+
+
+def test_trait_bulk_upsert_creates_and_updates_traits(identity, trait):
+    # Given
+    traits = [
+        Trait(
+            identity=identity,
+            trait_key=trait.trait_key,
+            **Trait.generate_trait_value_data(10),
+        ),
+        Trait(
+            identity=identity,
+            trait_key="new_key",
+            **Trait.generate_trait_value_data("new_value"),
+        ),
+    ]
+
+    # When
+    Trait.objects.bulk_upsert(traits)
+
+    # Then
+    assert {t.trait_key: t.trait_value for t in identity.identity_traits.all()} == {
+        trait.trait_key: 10,
+        "new_key": "new_value",
+    }
+    assert identity.identity_traits.get(trait_key=trait.trait_key).id == trait.id
@@ -48,7 +48,7 @@ def test_bulk_create_update_serializer_save_many(
     mocked_request = mocker.MagicMock(environment=identity.environment)
 
     # When
-    with django_assert_num_queries(5):
+    with django_assert_num_queries(4):
         serializer = SDKBulkCreateUpdateTraitSerializer(
             data=data,
             many=True,
@@ -63,3 +63,49 @@ def test_bulk_create_update_serializer_save_many(
         identity.identity_traits.get(trait_key=trait_key_to_update).trait_value
         == updated_trait_value
     )
+
+
+def test_bulk_create_update_serializer_save_many_for_multiple_identities(
+    identity, environment, django_assert_num_queries, mocker
+):
+    # Given
+    Trait.objects.create(
+        identity=identity, trait_key="foo", string_value="bar", value_type=STRING
+    )
+    new_identifier = "new-identity"
+
+    data = [
+        {
+            "trait_key": "foo",
+            "trait_value": 1,
+            "identity": {"identifier": identity.identifier},
+        },
+        {
+            "trait_key": "foo",
+            "trait_value": "baz",
+            "identity": {"identifier": new_identifier},
+        },
+    ]
+
+    mocked_request = mocker.MagicMock(environment=environment)
+
+    # When
+    with django_assert_num_queries(5):
+        serializer = SDKBulkCreateUpdateTraitSerializer(
+            data=data,
+            many=True,
+            context={"environment": environment, "request": mocked_request},
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+    # Then
+    assert identity.identity_traits.get(trait_key="foo").trait_value == 1
+    assert (
+        Trait.objects.get(
+            identity__identifier=new_identifier,
+            identity__environment=environment,
+            trait_key="foo",
+        ).trait_value
+        == "baz"
+    )
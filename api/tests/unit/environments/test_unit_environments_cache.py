@@ -0,0 +1,140 @@
+import pytest
+from core.request_origin import RequestOrigin
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory
+from django.utils import timezone
+from pytest_django.fixtures import SettingsWrapper
+
+from environments.cache import cache_sdk_response, local_environment_cache
+from environments.models import Environment
+from organisations.models import Organisation
+
+
+@pytest.fixture()
+def enable_local_environment_cache(settings: SettingsWrapper) -> None:
+    settings.ENVIRONMENT_LOCAL_CACHE_MAX_SIZE = 2
+    settings.ENVIRONMENT_LOCAL_CACHE_VERSION_CHECK_SECONDS = 0
+    local_environment_cache.clear()
+    yield
+    local_environment_cache.clear()
+
+
+@pytest.mark.usefixtures("enable_local_environment_cache")
+def test_get_from_cache_uses_local_environment_cache(
+    environment: Environment,
+    mocker,
+    django_assert_num_queries,
+) -> None:
+    # Given
+    Environment.get_from_cache(environment.api_key)
+    mocked_environment_cache = mocker.patch("environments.models.environment_cache")
+
+    # When
+    with django_assert_num_queries(0):
+        cached_environment = Environment.get_from_cache(environment.api_key)
+
+    # Then
+    assert cached_environment == environment
+    mocked_environment_cache.get.assert_not_called()
+
+
+@pytest.mark.usefixtures("enable_local_environment_cache")
+def test_get_from_cache_returns_updated_environment_from_local_environment_cache(
+    environment: Environment,
+) -> None:
+    # Given
+    Environment.get_from_cache(environment.api_key)
+
+    # When
+    environment.name = "updated"
+    environment.save()
+
+    # Then
+    assert Environment.get_from_cache(environment.api_key).name == "updated"
+
+
+@pytest.mark.usefixtures("enable_local_environment_cache")
+def test_get_from_cache_reflects_organisation_changes_in_local_environment_cache(
+    environment: Environment,
+    organisation: Organisation,
+) -> None:
+    # Given
+    Environment.get_from_cache(environment.api_key)
+
+    # When
+    organisation.stop_serving_flags = True
+    organisation.save()
+
+    # Then
+    cached_environment = Environment.get_from_cache(environment.api_key)
+    assert cached_environment.project.organisation.stop_serving_flags is True
+
+
+@pytest.mark.usefixtures("enable_local_environment_cache")
+def test_local_environment_cache_evicts_least_recently_used_environment(
+    environment: Environment,
+    mocker,
+) -> None:
+    # Given
+    # make sure that the local cache is up to date with the version stamp
+    local_environment_cache.get(environment.api_key)
+    version = local_environment_cache.version
+    other_environments = [mocker.MagicMock(), mocker.MagicMock()]
+
+    local_environment_cache.set(environment.api_key, environment, version)
+
+    # When
+    local_environment_cache.set("key-1", other_environments[0], version)
+    local_environment_cache.set("key-2", other_environments[1], version)
+
+    # Then
+    assert local_environment_cache.get(environment.api_key) is None
+    assert local_environment_cache.get("key-1") is not None
+    assert local_environment_cache.get("key-2") is not None
+
+
+def test_local_environment_cache_is_disabled_by_default(
+    environment: Environment,
+) -> None:
+    # Given
+    local_environment_cache.set(
+        environment.api_key, environment, local_environment_cache.version
+    )
+
+    # When
+    cached_environment = local_environment_cache.get(environment.api_key)
+
+    # Then
+    assert cached_environment is None
+
+
+def test_cache_sdk_response_caches_response_per_environment_version(
+    environment: Environment,
+    rf: RequestFactory,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    calls = []
+
+    @cache_sdk_response(timeout=60, cache=settings.GET_FLAGS_ENDPOINT_CACHE_NAME)
+    def view(request: HttpRequest) -> HttpResponse:
+        calls.append(request)
+        return HttpResponse(str(len(calls)))
+
+    def get_response() -> HttpResponse:
+        request = rf.get("/api/v1/flags/")
+        request.environment = environment
+        request.originated_from = RequestOrigin.CLIENT
+        return view(request)
+
+    first_response = get_response()
+
+    # When
+    second_response = get_response()
+    environment.updated_at = timezone.now()
+    third_response = get_response()
+
+    # Then
+    assert first_response.content == second_response.content == b"1"
+    assert third_response.content == b"2"
+    assert len(calls) == 2
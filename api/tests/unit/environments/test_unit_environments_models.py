@@ -335,6 +335,44 @@ def test_existence_of_multiple_environment_api_keys_does_not_break_get_from_cach
     )
 
 
+@pytest.mark.parametrize(
+    "environment_api_key_kwargs",
+    (
+        {"active": False},
+        {"expires_at": timezone.now() - timedelta(seconds=1)},
+    ),
+)
+def test_environment_get_from_cache_returns_none_for_invalid_environment_api_key(
+    environment: Environment,
+    environment_api_key_kwargs: dict,
+) -> None:
+    # Given
+    api_key = EnvironmentAPIKey.objects.create(
+        name="Some key", environment=environment, **environment_api_key_kwargs
+    )
+
+    # When
+    environment_from_cache = Environment.get_from_cache(api_key=api_key.key)
+
+    # Then
+    assert environment_from_cache is None
+
+
+def test_environment_get_from_cache_returns_none_once_cached_environment_api_key_is_deactivated(
+    environment: Environment,
+) -> None:
+    # Given
+    api_key = EnvironmentAPIKey.objects.create(name="Some key", environment=environment)
+    assert Environment.get_from_cache(api_key=api_key.key) == environment
+
+    # When
+    api_key.active = False
+    api_key.save()
+
+    # Then
+    assert Environment.get_from_cache(api_key=api_key.key) is None
+
+
 def test_get_from_cache_sets_the_cache_correctly_with_environment_api_key(
     environment, environment_api_key, mocker
 ):
@@ -702,6 +740,37 @@ def test_environment_get_environment_document_with_caching_when_document_not_in_
     )
 
 
+def test_environment_get_environment_engine_model_uses_cache_until_environment_updated(
+    environment: Environment,
+    feature: Feature,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    # Given
+    environment_model = Environment.get_environment_engine_model(environment.api_key)
+
+    # When
+    with django_assert_num_queries(1):
+        cached_environment_model = Environment.get_environment_engine_model(
+            environment.api_key
+        )
+
+    # Then
+    assert cached_environment_model == environment_model
+    assert [fs.feature.id for fs in environment_model.feature_states] == [feature.id]
+
+    # When
+    Environment.objects.filter(id=environment.id).update(
+        updated_at=timezone.now() + timedelta(seconds=1)
+    )
+    Feature.objects.create(name="another_feature", project=environment.project)
+    rebuilt_environment_model = Environment.get_environment_engine_model(
+        environment.api_key
+    )
+
+    # Then
+    assert len(rebuilt_environment_model.feature_states) == 2
+
+
 def test_creating_a_feature_with_defaults_does_not_set_defaults_if_disabled(project):
     # Given
     project.prevent_flag_defaults = True
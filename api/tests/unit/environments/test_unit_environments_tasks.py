@@ -1,3 +1,5 @@
+from django.utils import timezone
+from freezegun import freeze_time
 from pytest_mock import MockerFixture
 
 from audit.models import AuditLog
@@ -5,6 +7,7 @@ from environments.models import Environment
 from environments.tasks import (
     delete_environment_from_dynamo,
     process_environment_update,
+    process_scheduled_environment_update,
     rebuild_environment_document,
 )
 
@@ -113,3 +116,57 @@ def test_delete_environment__calls_internal_methods_correctly(
     mocked_identity_wrapper.delete_all_identities.assert_called_once_with(
         environment_api_key
     )
+
+
+def test_process_scheduled_environment_update(
+    environment: Environment,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    mock_write_environments_to_dynamodb = mocker.patch(
+        "environments.tasks.Environment.write_environments_to_dynamodb",
+    )
+    mock_send_environment_update_message_for_environment = mocker.patch(
+        "environments.tasks.send_environment_update_message_for_environment",
+        autospec=True,
+    )
+    now = timezone.now()
+
+    # When
+    with freeze_time(now):
+        process_scheduled_environment_update(environment_id=environment.id)
+
+    # Then
+    environment.refresh_from_db()
+    assert environment.updated_at == now
+
+    mock_write_environments_to_dynamodb.assert_called_once_with(
+        environment_id=environment.id
+    )
+    mock_send_environment_update_message_for_environment.assert_called_once_with(
+        environment
+    )
+
+
+def test_process_scheduled_environment_update__environment_deleted__does_nothing(
+    environment: Environment,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    environment_id = environment.id
+    environment.delete()
+
+    mock_write_environments_to_dynamodb = mocker.patch(
+        "environments.tasks.Environment.write_environments_to_dynamodb",
+    )
+    mock_send_environment_update_message_for_environment = mocker.patch(
+        "environments.tasks.send_environment_update_message_for_environment",
+        autospec=True,
+    )
+
+    # When
+    process_scheduled_environment_update(environment_id=environment_id)
+
+    # Then
+    mock_write_environments_to_dynamodb.assert_not_called()
+    mock_send_environment_update_message_for_environment.assert_not_called()
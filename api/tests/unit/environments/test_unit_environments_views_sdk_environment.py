@@ -1,7 +1,11 @@
 from typing import TYPE_CHECKING
 
-from core.constants import FLAGSMITH_UPDATED_AT_HEADER
+from core.constants import (
+    FLAGSMITH_DOCUMENT_FORMAT_HEADER,
+    FLAGSMITH_UPDATED_AT_HEADER,
+)
 from django.urls import reverse
+from django.utils import timezone
 from flag_engine.segments.constants import EQUAL
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -21,6 +25,7 @@ from segments.models import Condition, Segment, SegmentRule
 
 if TYPE_CHECKING:
     from pytest_django import DjangoAssertNumQueries
+    from pytest_django.fixtures import SettingsWrapper
 
     from organisations.models import Organisation
     from projects.models import Project
@@ -143,3 +148,106 @@ def test_get_environment_document_fails_with_invalid_key(
     # We get a 403 since only the server side API keys are able to access the
     # environment document
     assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_get_environment_document_in_compact_format(
+    organisation_one: "Organisation",
+    organisation_one_project_one: "Project",
+) -> None:
+    # Given
+    project = organisation_one_project_one
+    environment = Environment.objects.create(name="Test Environment", project=project)
+    api_key = EnvironmentAPIKey.objects.create(environment=environment)
+    feature = Feature.objects.create(name="test_feature", project=project)
+
+    client = APIClient()
+    client.credentials(HTTP_X_ENVIRONMENT_KEY=api_key.key)
+
+    url = reverse("api-v1:environment-document")
+
+    # When
+    response = client.get(url, HTTP_X_FLAGSMITH_DOCUMENT_FORMAT="compact")
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers[FLAGSMITH_DOCUMENT_FORMAT_HEADER] == "compact"
+
+    response_json = response.json()
+    assert response_json["document_format"] == "compact"
+    assert response_json["features"] == [
+        {"id": feature.id, "name": feature.name, "type": feature.type}
+    ]
+    assert response_json["feature_states"][0]["feature"] == 0
+
+
+def test_get_environment_document_delta_returns_changes_since_given_version(
+    organisation_one_project_one: "Project",
+    settings: "SettingsWrapper",
+) -> None:
+    # Given
+    settings.ENVIRONMENT_DOCUMENT_HISTORY_SECONDS = 60
+
+    project = organisation_one_project_one
+    environment = Environment.objects.create(name="Test Environment", project=project)
+    api_key = EnvironmentAPIKey.objects.create(environment=environment)
+    feature = Feature.objects.create(name="test_feature", project=project)
+    Feature.objects.create(name="unchanged_feature", project=project)
+
+    client = APIClient()
+    client.credentials(HTTP_X_ENVIRONMENT_KEY=api_key.key)
+
+    # the SDK has the current version of the document
+    response = client.get(reverse("api-v1:environment-document"))
+    since = response.json()["updated_at"]
+    since_timestamp = float(response.headers[FLAGSMITH_UPDATED_AT_HEADER])
+
+    # and a feature state is then changed
+    FeatureState.objects.filter(
+        feature=feature, environment=environment, identity=None
+    ).update(enabled=True)
+    Environment.objects.filter(id=environment.id).update(updated_at=timezone.now())
+
+    # When
+    response = client.get(
+        reverse("api-v1:environment-document-delta"), {"since": since_timestamp}
+    )
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    response_json = response.json()
+    assert response_json["type"] == "delta"
+    assert response_json["base_updated_at"] == since_timestamp
+    assert response_json["environment"]["updated_at"] != since
+    assert [
+        feature_state["feature"]["id"]
+        for feature_state in response_json["feature_states"]["updated"]
+    ] == [feature.id]
+    assert response_json["feature_states"]["updated"][0]["enabled"] is True
+    assert response_json["feature_states"]["removed"] == []
+    assert response_json["segments"] == {"updated": [], "removed": []}
+
+
+def test_get_environment_document_delta_returns_full_document_for_unknown_version(
+    organisation_one_project_one: "Project",
+    settings: "SettingsWrapper",
+) -> None:
+    # Given
+    settings.ENVIRONMENT_DOCUMENT_HISTORY_SECONDS = 60
+
+    project = organisation_one_project_one
+    environment = Environment.objects.create(name="Test Environment", project=project)
+    api_key = EnvironmentAPIKey.objects.create(environment=environment)
+
+    client = APIClient()
+    client.credentials(HTTP_X_ENVIRONMENT_KEY=api_key.key)
+
+    # When
+    response = client.get(
+        reverse("api-v1:environment-document-delta"), {"since": 1234.5}
+    )
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    response_json = response.json()
+    assert response_json["type"] == "full"
+    assert response_json["document"]["api_key"] == environment.api_key
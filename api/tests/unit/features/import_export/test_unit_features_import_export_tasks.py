@@ -5,7 +5,10 @@ import pytest
 from django.utils import timezone
 from freezegun.api import FrozenDateTimeFactory
 from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockerFixture
 
+from audit.models import AuditLog
+from audit.related_object_type import RelatedObjectType
 from environments.identities.models import Identity
 from environments.models import Environment
 from features.feature_types import MULTIVARIATE, STANDARD
@@ -373,6 +376,81 @@ def test_export_and_import_features_for_environment_with_overwrite_destructive(
     assert new_feature_state3.feature_state_value.value == "changed"
 
 
+def test_import_features_for_environment_creates_features_in_bulk(
+    db: None,
+    project: Project,
+    environment: Environment,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    mocked_process_environment_update = mocker.patch(
+        "environments.tasks.process_environment_update"
+    )
+    other_environment = Environment.objects.create(name="Other", project=project)
+    environments_updated_at = {
+        environment.id: environment.updated_at
+        for environment in project.environments.all()
+    }
+
+    def _feature_data(name: str, value: str, enabled: bool) -> dict:
+        return {
+            "name": name,
+            "default_enabled": False,
+            "is_server_key_only": False,
+            "initial_value": "initial",
+            "value": value,
+            "type": STRING,
+            "enabled": enabled,
+            "multivariate": [],
+        }
+
+    feature_import = FeatureImport.objects.create(
+        environment=environment,
+        strategy=OVERWRITE_DESTRUCTIVE,
+        data=json.dumps(
+            [
+                _feature_data("duplicated", "first", False),
+                _feature_data("other", "other", False),
+                _feature_data("duplicated", "last", True),
+            ]
+        ),
+    )
+
+    # When
+    import_features_for_environment(feature_import.id)
+
+    # Then
+    assert project.features.count() == 2
+    feature_state = FeatureState.objects.get(
+        feature__name="duplicated", environment=environment
+    )
+    assert feature_state.enabled is True
+    assert feature_state.get_feature_state_value() == "last"
+
+    other_feature_state = FeatureState.objects.get(
+        feature__name="duplicated", environment=other_environment
+    )
+    assert other_feature_state.enabled is False
+    assert other_feature_state.get_feature_state_value() == "initial"
+
+    audit_log = AuditLog.objects.get(
+        related_object_type=RelatedObjectType.IMPORT_REQUEST.name,
+        related_object_id=feature_import.id,
+    )
+    assert audit_log.project == project
+    assert audit_log.environment is None
+    mocked_process_environment_update.delay.assert_called_once_with(
+        args=(audit_log.id,)
+    )
+
+    for updated_environment in project.environments.all():
+        assert updated_environment.updated_at == audit_log.created_date
+        assert (
+            updated_environment.updated_at
+            > environments_updated_at[updated_environment.id]
+        )
+
+
 def test_create_flagsmith_on_flagsmith_feature_export(
     db: None,
     settings: SettingsWrapper,
@@ -66,25 +66,25 @@ def distinct_identity_featurestate(
             True,
             EdgeV2MigrationStatus.NOT_STARTED,
             "get_core_overrides_data",
-            {"skip_identity_overrides": True},
+            {"feature_ids": None, "skip_identity_overrides": True},
         ),
         (
             True,
             EdgeV2MigrationStatus.IN_PROGRESS,
             "get_core_overrides_data",
-            {"skip_identity_overrides": True},
+            {"feature_ids": None, "skip_identity_overrides": True},
         ),
         (
             True,
             EdgeV2MigrationStatus.COMPLETE,
             "get_edge_overrides_data",
-            {},
+            {"feature_ids": None},
         ),
         (
             False,
             ANY,
             "get_core_overrides_data",
-            {},
+            {"feature_ids": None},
         ),
     ],
 )
@@ -259,6 +259,67 @@ def test_feature_get_edge_overrides_data(
     )
 
 
+def test_feature_get_core_overrides_data__feature_ids__return_expected(
+    feature: Feature,
+    environment: "Environment",
+    identity_featurestate: FeatureState,
+    segment_featurestate: FeatureState,
+    distinct_segment_featurestate: FeatureState,
+    distinct_identity_featurestate: FeatureState,
+) -> None:
+    # When
+    overrides_data = get_core_overrides_data(
+        environment,
+        feature_ids=[feature.id, distinct_segment_featurestate.feature_id],
+    )
+
+    # Then
+    assert set(overrides_data) == {
+        feature.id,
+        distinct_segment_featurestate.feature_id,
+    }
+    assert overrides_data[feature.id].num_identity_overrides == 1
+    assert overrides_data[feature.id].num_segment_overrides == 1
+    assert (
+        overrides_data[distinct_segment_featurestate.feature_id].num_segment_overrides
+        == 1
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_feature_get_edge_overrides_data__feature_ids__return_expected(
+    feature: Feature,
+    environment: "Environment",
+    identity: Identity,
+    identity_featurestate: FeatureState,
+    distinct_identity_featurestate: FeatureState,
+    dynamodb_identity_wrapper: "DynamoIdentityWrapper",
+    dynamodb_wrapper_v2: "DynamoEnvironmentV2Wrapper",
+) -> None:
+    # Given
+    edge_identity = EdgeIdentity(map_identity_to_engine(identity, with_overrides=False))
+    edge_identity.add_feature_override(
+        map_feature_state_to_engine(identity_featurestate),
+    )
+    edge_identity.add_feature_override(
+        map_feature_state_to_engine(distinct_identity_featurestate),
+    )
+    edge_identity.save()
+
+    # When
+    overrides_data = get_edge_overrides_data(
+        environment,
+        feature_ids=[distinct_identity_featurestate.feature_id],
+    )
+
+    # Then
+    assert set(overrides_data) == {distinct_identity_featurestate.feature_id}
+    assert (
+        overrides_data[distinct_identity_featurestate.feature_id].num_identity_overrides
+        == 1
+    )
+
+
 @pytest.mark.django_db(transaction=True)
 def test_get_edge_overrides_data_skips_deleted_features(
     feature: Feature,
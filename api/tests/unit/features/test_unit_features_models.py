@@ -1018,3 +1018,88 @@ def test_webhooks_are_not_called_for_feature_state_with_environment_feature_vers
 
     # Then
     mock_trigger_feature_state_change_webhooks.assert_not_called()
+
+
+def test_create_feature_creates_initial_feature_states_for_all_environments(
+    mocker: MockerFixture,
+    project: Project,
+    environment_v2_versioning: Environment,
+) -> None:
+    # Given
+    v1_environment = Environment.objects.create(name="v1 environment", project=project)
+    mock_rebuild_project_environment_documents = mocker.patch(
+        "environments.tasks.rebuild_project_environment_documents"
+    )
+
+    # When
+    feature = Feature.objects.create(
+        name="test_feature", project=project, default_enabled=True, initial_value="foo"
+    )
+
+    # Then
+    v1_feature_state = FeatureState.objects.get(
+        feature=feature, environment=v1_environment
+    )
+    assert v1_feature_state.enabled is True
+    assert v1_feature_state.version == 1
+    assert v1_feature_state.live_from is not None
+    assert v1_feature_state.environment_feature_version is None
+    assert v1_feature_state.get_feature_state_value() == "foo"
+    assert v1_feature_state.history.count() == 1
+
+    environment_feature_version = EnvironmentFeatureVersion.objects.get(
+        feature=feature, environment=environment_v2_versioning
+    )
+    assert environment_feature_version.is_live is True
+
+    v2_feature_state = FeatureState.objects.get(
+        feature=feature, environment=environment_v2_versioning
+    )
+    assert v2_feature_state.enabled is True
+    assert v2_feature_state.environment_feature_version == environment_feature_version
+    assert v2_feature_state.get_feature_state_value() == "foo"
+    assert v2_feature_state.feature_state_value.history.count() == 1
+
+    mock_rebuild_project_environment_documents.delay.assert_called_once_with(
+        kwargs={"project_id": project.id}
+    )
+
+
+def test_create_environment_creates_initial_feature_states_for_all_features(
+    mocker: MockerFixture,
+    project: Project,
+    feature: Feature,
+    multivariate_feature: Feature,
+) -> None:
+    # Given
+    project.prevent_flag_defaults = True
+    project.save()
+
+    mock_rebuild_environment_document = mocker.patch(
+        "environments.tasks.rebuild_environment_document"
+    )
+
+    # When
+    new_environment = Environment.objects.create(
+        name="new environment", project=project
+    )
+
+    # Then
+    assert new_environment.feature_states.count() == 2
+
+    mv_feature_state = new_environment.feature_states.get(feature=multivariate_feature)
+    assert mv_feature_state.enabled is False
+    assert {
+        (
+            mv_feature_state_value.multivariate_feature_option_id,
+            mv_feature_state_value.percentage_allocation,
+        )
+        for mv_feature_state_value in mv_feature_state.multivariate_feature_state_values.all()
+    } == {
+        (mv_option.id, mv_option.default_percentage_allocation)
+        for mv_option in multivariate_feature.multivariate_options.all()
+    }
+
+    mock_rebuild_environment_document.delay.assert_called_once_with(
+        kwargs={"environment_id": new_environment.id}
+    )
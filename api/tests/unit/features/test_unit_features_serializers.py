@@ -1,12 +1,19 @@
 import pytest
 from core.constants import STRING
+from django.test import RequestFactory
+from pytest_lazyfixture import lazy_fixture
 
+from environments.identities.models import Identity
 from features.models import FeatureState
 from features.multivariate.models import (
     MultivariateFeatureOption,
     MultivariateFeatureStateValue,
 )
-from features.serializers import FeatureStateSerializerBasic
+from features.serializers import (
+    FeatureStateSerializerBasic,
+    SDKFeatureStateSerializer,
+)
+from util.renderers import SDKJSONRenderer
 
 
 @pytest.mark.parametrize(
@@ -47,3 +54,43 @@ def test_feature_state_serializer_basic_validates_mv_percentage_values(
 
     # Then
     assert is_valid == expected_is_valid
+
+
+@pytest.mark.parametrize(
+    "feature_state_fixture",
+    (
+        lazy_fixture("feature_state"),
+        lazy_fixture("identity_featurestate"),
+        lazy_fixture("segment_featurestate"),
+        lazy_fixture("feature_state_with_value"),
+    ),
+)
+@pytest.mark.parametrize("hide_sensitive_data", (True, False))
+def test_sdk_feature_state_serializer_renders_same_output_as_declared_fields(
+    feature_state_fixture: FeatureState,
+    hide_sensitive_data: bool,
+    identity: Identity,
+    rf: RequestFactory,
+) -> None:
+    # Given
+    environment = feature_state_fixture.environment
+    environment.hide_sensitive_data = hide_sensitive_data
+
+    request = rf.get("/")
+    request.environment = environment
+    serializer = SDKFeatureStateSerializer(
+        context={"request": request, "identity": identity}
+    )
+
+    # the output of the declared fields (i.e. without the optimised
+    # `SDKFeatureStateSerializer.to_representation`)
+    expected_data = super(SDKFeatureStateSerializer, serializer).to_representation(
+        feature_state_fixture
+    )
+
+    # When
+    data = serializer.to_representation(feature_state_fixture)
+
+    # Then
+    renderer = SDKJSONRenderer()
+    assert renderer.render(data) == renderer.render(expected_data)
@@ -18,6 +18,7 @@ from pytest_mock import MockerFixture
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from api_keys.models import MasterAPIKey
 from audit.constants import (
     FEATURE_DELETED_MESSAGE,
     IDENTITY_FEATURE_STATE_DELETED_MESSAGE,
@@ -737,6 +738,67 @@ def test_get_flags__server_key_only_feature__server_key_auth__return_expected(
     assert response.json()
 
 
+def test_get_flags__cache_flags__server_and_client_keys_cached_separately(
+    api_client: APIClient,
+    environment: Environment,
+    environment_api_key: EnvironmentAPIKey,
+    feature: Feature,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.CACHE_FLAGS_SECONDS = 60
+
+    feature.is_server_key_only = True
+    feature.save()
+
+    url = reverse("api-v1:flags")
+
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment_api_key.key)
+    server_key_response = api_client.get(url)
+
+    # When
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment.api_key)
+    client_key_response = api_client.get(url)
+
+    # Then
+    assert server_key_response.status_code == status.HTTP_200_OK
+    assert len(server_key_response.json()) == 1
+
+    assert client_key_response.status_code == status.HTTP_200_OK
+    assert not client_key_response.json()
+
+
+def test_get_flags__cache_flags__returns_updated_flags_when_environment_updated(
+    api_client: APIClient,
+    environment: Environment,
+    feature: Feature,
+    feature_state: FeatureState,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.CACHE_FLAGS_SECONDS = 60
+
+    url = reverse("api-v1:flags")
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment.api_key)
+
+    first_response = api_client.get(url)
+
+    # When
+    feature_state.enabled = not feature_state.enabled
+    feature_state.save()
+    AuditLog.objects.create(
+        environment=environment,
+        project=environment.project,
+        log="Feature state updated",
+    )
+
+    second_response = api_client.get(url)
+
+    # Then
+    assert first_response.json()[0]["enabled"] is not feature_state.enabled
+    assert second_response.json()[0]["enabled"] is feature_state.enabled
+
+
 def test_get_feature_states_by_uuid(
     admin_client_new: APIClient,
     environment: Environment,
@@ -1355,6 +1417,29 @@ def test_audit_log_created_when_feature_created(
     ).count() == len(project.environments.all())
 
 
+def test_audit_log_created_for_each_environment_when_feature_created_with_master_api_key(
+    admin_master_api_key_client: APIClient,
+    admin_master_api_key_object: MasterAPIKey,
+    project: Project,
+    environment: Environment,
+) -> None:
+    # Given
+    url = reverse("api-v1:projects:project-features-list", args=[project.id])
+    data = {"name": "Test feature flag", "type": "FLAG", "project": project.id}
+
+    # When
+    response = admin_master_api_key_client.post(url, data=data)
+
+    # Then
+    assert response.status_code == status.HTTP_201_CREATED
+    feature_state_audit_logs = AuditLog.objects.filter(
+        related_object_type=RelatedObjectType.FEATURE_STATE.name,
+        environment=environment,
+    )
+    assert feature_state_audit_logs.count() == 1
+    assert feature_state_audit_logs.get().master_api_key == admin_master_api_key_object
+
+
 def test_audit_log_created_when_feature_updated(
     admin_client_new: APIClient, project: Project, feature: Feature
 ) -> None:
@@ -8,7 +8,10 @@ from freezegun import freeze_time
 from pytest_mock import MockerFixture
 
 from environments.models import Environment
-from environments.tasks import rebuild_environment_document
+from environments.tasks import (
+    process_scheduled_environment_update,
+    rebuild_environment_document,
+)
 from features.models import Feature, FeatureSegment, FeatureState
 from features.versioning.exceptions import FeatureVersioningError
 from features.versioning.models import (
@@ -226,6 +229,40 @@ def test_publish(
     )
 
 
+def test_publish_scheduled_version_schedules_environment_update(
+    feature: "Feature",
+    environment_v2_versioning: Environment,
+    admin_user: "FFAdminUser",
+    mocker: "MockerFixture",
+) -> None:
+    # Given
+    version_2 = EnvironmentFeatureVersion.objects.create(
+        environment=environment_v2_versioning, feature=feature
+    )
+    live_from = timezone.now() + timedelta(hours=1)
+
+    mocked_rebuild_environment_document = mocker.patch(
+        "features.versioning.receivers.rebuild_environment_document",
+        autospec=rebuild_environment_document,
+    )
+    mocked_process_scheduled_environment_update = mocker.patch(
+        "features.versioning.receivers.process_scheduled_environment_update",
+        autospec=process_scheduled_environment_update,
+    )
+
+    # When
+    version_2.publish(published_by=admin_user, live_from=live_from)
+
+    # Then
+    assert version_2.is_live is False
+
+    mocked_process_scheduled_environment_update.delay.assert_called_once_with(
+        kwargs={"environment_id": environment_v2_versioning.id},
+        delay_until=live_from,
+    )
+    mocked_rebuild_environment_document.delay.assert_not_called()
+
+
 def test_update_version_webhooks_triggered_when_version_published(
     environment_v2_versioning: Environment,
     feature: "Feature",
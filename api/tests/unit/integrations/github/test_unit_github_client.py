@@ -0,0 +1,50 @@
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockerFixture
+
+from integrations.github.client import (
+    build_request_headers,
+    clear_installation_token,
+    github_cache,
+)
+
+
+def test_build_request_headers__reuses_installation_token(
+    mocker: MockerFixture,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.GITHUB_INSTALLATION_TOKEN_CACHE_SECONDS = 60
+    github_cache.clear()
+    mock_generate_token = mocker.patch(
+        "integrations.github.client.generate_token",
+        return_value="mocked_token",
+    )
+
+    # When
+    headers = [build_request_headers("1234567") for _ in range(3)]
+
+    # Then
+    assert all(header["Authorization"] == "Bearer mocked_token" for header in headers)
+    mock_generate_token.assert_called_once_with("1234567", settings.GITHUB_APP_ID)
+
+
+def test_build_request_headers__generates_new_token_once_cleared(
+    mocker: MockerFixture,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.GITHUB_INSTALLATION_TOKEN_CACHE_SECONDS = 60
+    github_cache.clear()
+    mock_generate_token = mocker.patch(
+        "integrations.github.client.generate_token",
+        side_effect=["mocked_token", "new_mocked_token"],
+    )
+    build_request_headers("1234567")
+
+    # When
+    clear_installation_token("1234567")
+    headers = build_request_headers("1234567")
+
+    # Then
+    assert headers["Authorization"] == "Bearer new_mocked_token"
+    assert mock_generate_token.call_count == 2
@@ -0,0 +1,99 @@
+import json
+
+import responses
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockerFixture
+
+from integrations.github.client import github_cache
+from integrations.github.constants import GITHUB_API_URL
+from integrations.github.dataclasses import CallGithubData, GithubData
+from integrations.github.tasks import send_post_request
+from webhooks.webhooks import WebhookEventType
+
+
+def _get_flag_updated_data(enabled: bool) -> CallGithubData:
+    return CallGithubData(
+        event_type=WebhookEventType.FLAG_UPDATED.value,
+        github_data=GithubData(
+            installation_id="1234567",
+            feature_id=1,
+            feature_name="feature_a",
+            type=WebhookEventType.FLAG_UPDATED.value,
+            feature_states=[
+                {
+                    "environment_name": "Development",
+                    "environment_api_key": "api-key",
+                    "enabled": enabled,
+                    "last_updated": "2024-01-01 00:00:00",
+                }
+            ],
+            project_id=1,
+        ),
+        feature_external_resources=[
+            {
+                "type": "GITHUB_ISSUE",
+                "url": "https://github.com/repoowner/repo-name/issues/11",
+            },
+            {
+                "type": "GITHUB_ISSUE",
+                "url": "https://github.com/repoowner/repo-name/issues/11",
+            },
+        ],
+    )
+
+
+@responses.activate
+def test_send_post_request__flag_updated__comments_once_per_resource(
+    mocker: MockerFixture,
+    db: None,
+) -> None:
+    # Given
+    mocker.patch(
+        "integrations.github.client.generate_token", return_value="mocked_token"
+    )
+    responses.add(
+        method="POST",
+        url=f"{GITHUB_API_URL}repos/repoowner/repo-name/issues/11/comments",
+        status=201,
+        json={"id": 1},
+    )
+
+    # When
+    send_post_request(_get_flag_updated_data(enabled=True))
+
+    # Then
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_send_post_request__flag_updated_within_coalesce_window__edits_comment(
+    mocker: MockerFixture,
+    settings: SettingsWrapper,
+    db: None,
+) -> None:
+    # Given
+    settings.GITHUB_COMMENT_COALESCE_SECONDS = 60
+    github_cache.clear()
+    mocker.patch(
+        "integrations.github.client.generate_token", return_value="mocked_token"
+    )
+    responses.add(
+        method="POST",
+        url=f"{GITHUB_API_URL}repos/repoowner/repo-name/issues/11/comments",
+        status=201,
+        json={"id": 101},
+    )
+    responses.add(
+        method="PATCH",
+        url=f"{GITHUB_API_URL}repos/repoowner/repo-name/issues/comments/101",
+        status=200,
+        json={"id": 101},
+    )
+    send_post_request(_get_flag_updated_data(enabled=True))
+
+    # When
+    send_post_request(_get_flag_updated_data(enabled=False))
+
+    # Then
+    assert [call.request.method for call in responses.calls] == ["POST", "PATCH"]
+    assert "Disabled" in json.loads(responses.calls[1].request.body)["body"]
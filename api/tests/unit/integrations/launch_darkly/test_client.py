@@ -1,7 +1,9 @@
 import json
 from os.path import abspath, dirname, join
 
+import pytest
 from pytest_mock import MockerFixture
+from requests.exceptions import HTTPError
 from requests_mock import Mocker as RequestsMockerFixture
 
 from integrations.launch_darkly.client import LaunchDarklyClient
@@ -223,3 +225,134 @@ def test_launch_darkly_client__get_flag_tags__return_expected(
 
     # Then
     assert result == expected_result
+
+
+def test_launch_darkly_client__rate_limited__retries_after_rate_limit_reset(
+    mocker: MockerFixture,
+    requests_mock: RequestsMockerFixture,
+) -> None:
+    # Given
+    token = "test-token"
+    project_key = "test-project-key"
+
+    mocker.patch("integrations.launch_darkly.client.time.time", return_value=100)
+    sleep_mock = mocker.patch("integrations.launch_darkly.client.time.sleep")
+
+    expected_result = {"key": project_key}
+
+    requests_mock.get(
+        "https://app.launchdarkly.com/api/v2/projects/test-project-key",
+        [
+            {"status_code": 429, "headers": {"X-Ratelimit-Reset": "102500"}},
+            {"status_code": 429, "headers": {"Retry-After": "3"}},
+            {"status_code": 200, "json": expected_result},
+        ],
+    )
+
+    client = LaunchDarklyClient(token=token)
+
+    # When
+    result = client.get_project(project_key=project_key)
+
+    # Then
+    assert result == expected_result
+    assert [call.args for call in sleep_mock.call_args_list] == [(2.5,), (3.0,)]
+
+
+def test_launch_darkly_client__rate_limited__backs_off_without_retry_seconds(
+    mocker: MockerFixture,
+    requests_mock: RequestsMockerFixture,
+) -> None:
+    # Given
+    token = "test-token"
+    project_key = "test-project-key"
+
+    sleep_mock = mocker.patch("integrations.launch_darkly.client.time.sleep")
+
+    expected_result = {"key": project_key}
+
+    requests_mock.get(
+        "https://app.launchdarkly.com/api/v2/projects/test-project-key",
+        [
+            {
+                "status_code": 429,
+                "headers": {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"},
+            },
+            {"status_code": 429},
+            {"status_code": 200, "json": expected_result},
+        ],
+    )
+
+    client = LaunchDarklyClient(token=token)
+
+    # When
+    result = client.get_project(project_key=project_key)
+
+    # Then
+    assert result == expected_result
+    assert [call.args for call in sleep_mock.call_args_list] == [(1,), (2,)]
+
+
+def test_launch_darkly_client__rate_limited__invalid_rate_limit_reset__falls_back(
+    mocker: MockerFixture,
+    requests_mock: RequestsMockerFixture,
+) -> None:
+    # Given
+    token = "test-token"
+    project_key = "test-project-key"
+
+    sleep_mock = mocker.patch("integrations.launch_darkly.client.time.sleep")
+
+    expected_result = {"key": project_key}
+
+    requests_mock.get(
+        "https://app.launchdarkly.com/api/v2/projects/test-project-key",
+        [
+            {
+                "status_code": 429,
+                "headers": {"X-Ratelimit-Reset": "invalid", "Retry-After": "3"},
+            },
+            {"status_code": 429, "headers": {"X-Ratelimit-Reset": "invalid"}},
+            {"status_code": 200, "json": expected_result},
+        ],
+    )
+
+    client = LaunchDarklyClient(token=token)
+
+    # When
+    result = client.get_project(project_key=project_key)
+
+    # Then
+    assert result == expected_result
+    assert [call.args for call in sleep_mock.call_args_list] == [(3.0,), (2,)]
+
+
+def test_launch_darkly_client__rate_limited__raises_after_max_retries(
+    mocker: MockerFixture,
+    requests_mock: RequestsMockerFixture,
+) -> None:
+    # Given
+    token = "test-token"
+    project_key = "test-project-key"
+
+    mocker.patch(
+        "integrations.launch_darkly.client.LAUNCH_DARKLY_API_RATE_LIMIT_MAX_RETRIES",
+        2,
+    )
+    sleep_mock = mocker.patch("integrations.launch_darkly.client.time.sleep")
+
+    requests_mock.get(
+        "https://app.launchdarkly.com/api/v2/projects/test-project-key",
+        status_code=429,
+        headers={"Retry-After": "3"},
+    )
+
+    client = LaunchDarklyClient(token=token)
+
+    # When
+    with pytest.raises(HTTPError):
+        client.get_project(project_key=project_key)
+
+    # Then
+    assert requests_mock.call_count == 3
+    assert [call.args for call in sleep_mock.call_args_list] == [(3.0,), (3.0,)]
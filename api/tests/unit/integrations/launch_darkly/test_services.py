@@ -3,15 +3,22 @@ from unittest.mock import MagicMock
 import pytest
 from django.conf import settings
 from django.core import signing
+from django.db.models import Max
 from flag_engine.segments import constants as segment_constants
+from pytest_mock import MockerFixture
 from requests.exceptions import HTTPError, RequestException, Timeout
 
+from audit.models import AuditLog
+from audit.related_object_type import RelatedObjectType
 from environments.identities.models import Identity
 from environments.identities.traits.models import Trait
 from environments.models import Environment
 from features.models import Feature, FeatureState
+from features.multivariate.models import MultivariateFeatureStateValue
 from integrations.launch_darkly.models import LaunchDarklyImportRequest
 from integrations.launch_darkly.services import (
+    _create_identities_with_key_trait,
+    _update_or_create_identity_overrides,
     create_import_request,
     process_import_request,
 )
@@ -110,6 +117,8 @@ def test_process_import_request__success__expected_status(
     assert import_request.completed_at
     assert import_request.ld_token == ""
     assert import_request.status["result"] == "success"
+    assert import_request.status["imported_segment_count"] == 6
+    assert import_request.status["imported_flag_count"] == 9
 
     # Environment names are correct.
     assert list(
@@ -448,6 +457,22 @@ def test_process_import_request__segments_imported(
         assert trait_value == identity.identifier
 
 
+def test_process_import_request__segments_imported__segment_updated_at_bumped_after_rules(
+    project: Project,
+    import_request: LaunchDarklyImportRequest,
+) -> None:
+    # When
+    process_import_request(import_request)
+
+    # Then
+    for segment in Segment.objects.filter(project=project):
+        latest_condition_updated_at = Condition.objects.filter(
+            rule__rule__segment=segment
+        ).aggregate(Max("updated_at"))["updated_at__max"]
+        if latest_condition_updated_at:
+            assert segment.updated_at >= latest_condition_updated_at
+
+
 def test_process_import_request__rules_imported(
     project: Project,
     import_request: LaunchDarklyImportRequest,
@@ -542,3 +567,162 @@ def test_process_import_request__rules_imported(
     ) == {
         ("p1", segment_constants.IN, "this,that"),
     }
+
+
+def test_process_import_request__creates_audit_log_for_each_environment(
+    mocker: MockerFixture,
+    project: Project,
+    import_request: LaunchDarklyImportRequest,
+) -> None:
+    # Given
+    mocked_process_environment_update = mocker.patch(
+        "environments.tasks.process_environment_update"
+    )
+
+    # When
+    process_import_request(import_request)
+
+    # Then
+    audit_logs = AuditLog.objects.filter(
+        related_object_id=import_request.id,
+        related_object_type=RelatedObjectType.IMPORT_REQUEST.name,
+    )
+    assert {
+        (audit_log.environment.name, audit_log.log) for audit_log in audit_logs
+    } == {
+        ("Test", "Flags / Segments imported from LaunchDarkly into environment: Test"),
+        (
+            "Production",
+            "Flags / Segments imported from LaunchDarkly into environment: Production",
+        ),
+    }
+    for audit_log in audit_logs:
+        assert audit_log.project == project
+        assert audit_log.is_system_event is True
+        mocked_process_environment_update.delay.assert_any_call(args=(audit_log.id,))
+
+        # The environment is updated with the imported identity overrides.
+        audit_log.environment.refresh_from_db()
+        assert audit_log.environment.updated_at == audit_log.created_date
+
+
+def test_create_identities_with_key_trait__creates_and_reuses_identities(
+    environment: Environment,
+    identity: Identity,
+) -> None:
+    # Given
+    Trait.objects.create(
+        identity=identity,
+        trait_key="key",
+        **Trait.generate_trait_value_data("outdated"),
+    )
+
+    # When
+    identities_by_identifier = _create_identities_with_key_trait(
+        identifiers=[identity.identifier, "new-identity-1", "new-identity-2"],
+        environment=environment,
+    )
+
+    # Then
+    assert set(identities_by_identifier) == {
+        identity.identifier,
+        "new-identity-1",
+        "new-identity-2",
+    }
+    assert identities_by_identifier[identity.identifier].id == identity.id
+    assert Identity.objects.filter(environment=environment).count() == 3
+
+    # Each identity has a "key" trait with its identifier.
+    assert {
+        trait.identity.identifier: trait.trait_value
+        for trait in Trait.objects.filter(
+            identity__environment=environment, trait_key="key"
+        )
+    } == {
+        identity.identifier: identity.identifier,
+        "new-identity-1": "new-identity-1",
+        "new-identity-2": "new-identity-2",
+    }
+
+
+def test_update_or_create_identity_overrides__creates_and_updates_overrides(
+    feature: Feature,
+    environment: Environment,
+    identity: Identity,
+) -> None:
+    # Given
+    existing_feature_state = FeatureState.objects.create(
+        feature=feature,
+        environment=environment,
+        identity=identity,
+        enabled=False,
+    )
+    new_identity = Identity.objects.create(
+        identifier="new-identity", environment=environment
+    )
+
+    # When
+    _update_or_create_identity_overrides(
+        feature=feature,
+        environment=environment,
+        identities=[identity, new_identity],
+        enabled=True,
+        mv_feature_option=None,
+    )
+
+    # Then
+    feature_states = FeatureState.objects.filter(
+        feature=feature, identity__isnull=False
+    )
+    assert feature_states.count() == 2
+    assert all(feature_state.enabled for feature_state in feature_states)
+    assert feature_states.get(identity=identity).id == existing_feature_state.id
+
+    new_feature_state = feature_states.get(identity=new_identity)
+    assert new_feature_state.feature_state_value is not None
+    assert new_feature_state.history.count() == 1
+
+
+def test_update_or_create_identity_overrides__serves_mv_option_to_all_identities(
+    multivariate_feature: Feature,
+    environment: Environment,
+    identity: Identity,
+) -> None:
+    # Given
+    mv_feature_option = multivariate_feature.multivariate_options.first()
+    existing_feature_state = FeatureState.objects.create(
+        feature=multivariate_feature,
+        environment=environment,
+        identity=identity,
+        enabled=True,
+    )
+    MultivariateFeatureStateValue.objects.update_or_create(
+        feature_state=existing_feature_state,
+        multivariate_feature_option=mv_feature_option,
+        defaults={"percentage_allocation": 30},
+    )
+    new_identity = Identity.objects.create(
+        identifier="new-identity", environment=environment
+    )
+
+    # When
+    _update_or_create_identity_overrides(
+        feature=multivariate_feature,
+        environment=environment,
+        identities=[identity, new_identity],
+        enabled=True,
+        mv_feature_option=mv_feature_option,
+    )
+
+    # Then
+    mv_feature_state_values = MultivariateFeatureStateValue.objects.filter(
+        feature_state__identity__isnull=False,
+        multivariate_feature_option=mv_feature_option,
+    )
+    assert {
+        (
+            mv_feature_state_value.feature_state.identity_id,
+            mv_feature_state_value.percentage_allocation,
+        )
+        for mv_feature_state_value in mv_feature_state_values
+    } == {(identity.id, 100), (new_identity.id, 100)}
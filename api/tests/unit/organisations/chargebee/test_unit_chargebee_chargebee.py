@@ -19,6 +19,7 @@ from organisations.chargebee import (
     get_plan_meta_data,
     get_portal_url,
     get_subscription_data_from_hosted_page,
+    get_subscription_metadata_for_ids,
     get_subscription_metadata_from_id,
 )
 from organisations.chargebee.chargebee import cancel_subscription
@@ -386,6 +387,91 @@ def test_get_subscription_metadata_from_id(
     assert subscription_metadata.chargebee_email == customer_email
 
 
+def test_get_subscription_metadata_for_ids(
+    mocker: MockerFixture,
+    mock_subscription_response: MockChargeBeeSubscriptionResponse,
+    chargebee_object_metadata: ChargebeeObjMetadata,
+) -> None:
+    # Given
+    mocked_chargebee = mocker.patch("organisations.chargebee.chargebee.chargebee")
+    entries = mocker.MagicMock(next_offset=None)
+    entries.__iter__.return_value = iter([mock_subscription_response])
+    mocked_chargebee.Subscription.list.return_value = entries
+
+    subscription_id = mock_subscription_response.subscription.id
+
+    # When
+    subscription_metadata = get_subscription_metadata_for_ids(
+        [subscription_id, "unknown-subscription-id", None, " "]
+    )
+
+    # Then
+    assert list(subscription_metadata) == [subscription_id]
+    assert subscription_metadata[subscription_id].seats == (
+        chargebee_object_metadata.seats
+    )
+    assert subscription_metadata[subscription_id].chargebee_email == (
+        mock_subscription_response.customer.email
+    )
+
+    mocked_chargebee.Subscription.list.assert_called_once_with(
+        {
+            "limit": 100,
+            "id[in]": f'["{subscription_id}", "unknown-subscription-id"]',
+        }
+    )
+
+
+def test_get_subscription_metadata_for_ids__paginates_and_skips_failed_batches(
+    mocker: MockerFixture,
+    mock_subscription_response: MockChargeBeeSubscriptionResponse,
+    chargebee_object_metadata: ChargebeeObjMetadata,
+) -> None:
+    # Given
+    mocker.patch("organisations.chargebee.chargebee.SUBSCRIPTION_LIST_BATCH_SIZE", 2)
+    mocked_logger = mocker.patch("organisations.chargebee.chargebee.logger")
+    mocked_chargebee = mocker.patch("organisations.chargebee.chargebee.chargebee")
+
+    other_subscription_response = MockChargeBeeSubscriptionResponse(
+        subscription_id="subscription-id-2",
+        plan_id=mock_subscription_response.subscription.plan_id,
+    )
+    first_page = mocker.MagicMock(next_offset="next-offset")
+    first_page.__iter__.return_value = iter([mock_subscription_response])
+    second_page = mocker.MagicMock(next_offset=None)
+    second_page.__iter__.return_value = iter([other_subscription_response])
+
+    mocked_chargebee.Subscription.list.side_effect = [
+        APIError(http_code=500, json_obj=mocker.MagicMock()),
+        first_page,
+        second_page,
+    ]
+
+    # When
+    subscription_metadata = get_subscription_metadata_for_ids(
+        ["failing-id-1", "failing-id-2", "subscription-id", "subscription-id-2"]
+    )
+
+    # Then
+    assert set(subscription_metadata) == {"subscription-id", "subscription-id-2"}
+    assert mocked_chargebee.Subscription.list.call_args_list == [
+        mocker.call({"limit": 2, "id[in]": '["failing-id-1", "failing-id-2"]'}),
+        mocker.call({"limit": 2, "id[in]": '["subscription-id", "subscription-id-2"]'}),
+        mocker.call(
+            {
+                "limit": 2,
+                "id[in]": '["subscription-id", "subscription-id-2"]',
+                "offset": "next-offset",
+            }
+        ),
+    ]
+    mocked_logger.error.assert_called_once_with(
+        "Failed to list chargebee subscriptions %s",
+        ["failing-id-1", "failing-id-2"],
+        exc_info=True,
+    )
+
+
 def test_cancel_subscription(mocker) -> None:
     # Given
     mocked_chargebee = mocker.patch("organisations.chargebee.chargebee.chargebee")
@@ -21,9 +21,11 @@ def test_update_caches(mocker, organisation, chargebee_subscription, settings):
 
     chargebee_metadata = ChargebeeObjMetadata(seats=15, api_calls=1000000)
     mocked_get_subscription_metadata = mocker.patch(
-        "organisations.subscription_info_cache.get_subscription_metadata_from_id"
+        "organisations.subscription_info_cache.get_subscription_metadata_for_ids"
     )
-    mocked_get_subscription_metadata.return_value = chargebee_metadata
+    mocked_get_subscription_metadata.side_effect = lambda subscription_ids: {
+        subscription_id: chargebee_metadata for subscription_id in subscription_ids
+    }
 
     # When
     subscription_cache_entities = (
@@ -54,9 +56,7 @@ def test_update_caches(mocker, organisation, chargebee_subscription, settings):
         == chargebee_metadata.api_calls
     )
 
-    mocked_get_subscription_metadata.assert_called_once_with(
-        chargebee_subscription.subscription_id
-    )
+    mocked_get_subscription_metadata.assert_called_once()
 
     assert mocked_get_top_organisations.call_count == 3
     assert [call[0] for call in mocked_get_top_organisations.call_args_list] == [
@@ -262,7 +262,7 @@ def test_handle_api_usage_notifications_when_feature_flag_is_off(
         current_billing_term_ends_at=now + timedelta(days=320),
     )
     mock_api_usage = mocker.patch(
-        "organisations.tasks.get_current_api_usage",
+        "organisations.tasks.get_current_api_usages",
     )
     get_client_mock = mocker.patch("organisations.tasks.get_client")
     client_mock = MagicMock()
@@ -313,9 +313,11 @@ def test_handle_api_usage_notifications_below_100(
         current_billing_term_ends_at=now + timedelta(days=320),
     )
     mock_api_usage = mocker.patch(
-        "organisations.task_helpers.get_current_api_usage",
+        "organisations.task_helpers.get_current_api_usages",
+    )
+    mock_api_usage.side_effect = lambda organisation_ids, _: dict.fromkeys(
+        organisation_ids, 91
     )
-    mock_api_usage.return_value = 91
     get_client_mock = mocker.patch("organisations.tasks.get_client")
     client_mock = MagicMock()
     get_client_mock.return_value = client_mock
@@ -329,7 +331,7 @@ def test_handle_api_usage_notifications_below_100(
     handle_api_usage_notifications()
 
     # Then
-    mock_api_usage.assert_called_once_with(organisation.id, "-14d")
+    mock_api_usage.assert_called_once_with([organisation.id], "-14d")
 
     assert len(mailoutbox) == 1
     email = mailoutbox[0]
@@ -397,11 +399,13 @@ def test_handle_api_usage_notifications_below_api_usage_alert_thresholds(
         current_billing_term_ends_at=now + timedelta(days=320),
     )
     mock_api_usage = mocker.patch(
-        "organisations.task_helpers.get_current_api_usage",
+        "organisations.task_helpers.get_current_api_usages",
     )
     usage = 21
     assert usage < min(API_USAGE_ALERT_THRESHOLDS)
-    mock_api_usage.return_value = usage
+    mock_api_usage.side_effect = lambda organisation_ids, _: dict.fromkeys(
+        organisation_ids, usage
+    )
     get_client_mock = mocker.patch("organisations.tasks.get_client")
     client_mock = MagicMock()
     get_client_mock.return_value = client_mock
@@ -415,7 +419,7 @@ def test_handle_api_usage_notifications_below_api_usage_alert_thresholds(
     handle_api_usage_notifications()
 
     # Then
-    mock_api_usage.assert_called_once_with(organisation.id, "-14d")
+    mock_api_usage.assert_called_once_with([organisation.id], "-14d")
 
     assert len(mailoutbox) == 0
 
@@ -448,9 +452,11 @@ def test_handle_api_usage_notifications_above_100(
         current_billing_term_ends_at=now + timedelta(days=320),
     )
     mock_api_usage = mocker.patch(
-        "organisations.task_helpers.get_current_api_usage",
+        "organisations.task_helpers.get_current_api_usages",
+    )
+    mock_api_usage.side_effect = lambda organisation_ids, _: dict.fromkeys(
+        organisation_ids, 105
     )
-    mock_api_usage.return_value = 105
 
     get_client_mock = mocker.patch("organisations.tasks.get_client")
     client_mock = MagicMock()
@@ -465,7 +471,7 @@ def test_handle_api_usage_notifications_above_100(
     handle_api_usage_notifications()
 
     # Then
-    mock_api_usage.assert_called_once_with(organisation.id, "-14d")
+    mock_api_usage.assert_called_once_with([organisation.id], "-14d")
 
     assert len(mailoutbox) == 1
     email = mailoutbox[0]
@@ -543,6 +549,10 @@ def test_handle_api_usage_notifications_with_error(
     get_client_mock.return_value = client_mock
     client_mock.get_identity_flags.return_value.is_feature_enabled.return_value = True
 
+    mocker.patch(
+        "organisations.tasks.get_api_usage_for_organisations",
+        return_value={organisation.id: 50},
+    )
     api_usage_patch = mocker.patch(
         "organisations.tasks.handle_api_usage_notification_for_organisation",
         side_effect=ValueError("An error occurred"),
@@ -552,7 +562,7 @@ def test_handle_api_usage_notifications_with_error(
     handle_api_usage_notifications()
 
     # Then
-    api_usage_patch.assert_called_once_with(organisation)
+    api_usage_patch.assert_called_once_with(organisation, 50)
     assert (
         OrganisationAPIUsageNotification.objects.filter(
             organisation=organisation,
@@ -568,6 +578,45 @@ def test_handle_api_usage_notifications_with_error(
     )
 
 
+def test_handle_api_usage_notifications_falls_back_to_each_organisation_on_error(
+    mocker: MockerFixture,
+    organisation: Organisation,
+    inspecting_handler: logging.Handler,
+) -> None:
+    # Given
+    from organisations.tasks import logger
+
+    logger.addHandler(inspecting_handler)
+
+    get_client_mock = mocker.patch("organisations.tasks.get_client")
+    client_mock = MagicMock()
+    get_client_mock.return_value = client_mock
+    client_mock.get_identity_flags.return_value.is_feature_enabled.return_value = True
+
+    get_api_usage_mock = mocker.patch(
+        "organisations.tasks.get_api_usage_for_organisations",
+        side_effect=[ValueError("An error occurred"), {organisation.id: 50}],
+    )
+    handle_api_usage_notification_mock = mocker.patch(
+        "organisations.tasks.handle_api_usage_notification_for_organisation",
+    )
+
+    # When
+    handle_api_usage_notifications()
+
+    # Then
+    assert get_api_usage_mock.call_args_list == [
+        call([organisation]),
+        call([organisation]),
+    ]
+    handle_api_usage_notification_mock.assert_called_once_with(organisation, 50)
+    assert len(inspecting_handler.messages) == 1
+    assert inspecting_handler.messages[0].split("\n")[0] == (
+        "Error getting api usage for organisations, "
+        "falling back to querying each organisation separately"
+    )
+
+
 @pytest.mark.freeze_time("2023-01-19T09:09:47.325132+00:00")
 def test_handle_api_usage_notifications_for_free_accounts(
     mocker: MockerFixture,
@@ -580,9 +629,11 @@ def test_handle_api_usage_notifications_for_free_accounts(
     assert organisation.subscription.max_api_calls == MAX_API_CALLS_IN_FREE_PLAN
 
     mock_api_usage = mocker.patch(
-        "organisations.task_helpers.get_current_api_usage",
+        "organisations.task_helpers.get_current_api_usages",
+    )
+    mock_api_usage.side_effect = lambda organisation_ids, _: dict.fromkeys(
+        organisation_ids, MAX_API_CALLS_IN_FREE_PLAN + 5_000
     )
-    mock_api_usage.return_value = MAX_API_CALLS_IN_FREE_PLAN + 5_000
 
     get_client_mock = mocker.patch("organisations.tasks.get_client")
     client_mock = MagicMock()
@@ -597,7 +648,7 @@ def test_handle_api_usage_notifications_for_free_accounts(
     handle_api_usage_notifications()
 
     # Then
-    mock_api_usage.assert_called_once_with(organisation.id, "-30d")
+    mock_api_usage.assert_called_once_with([organisation.id], "-30d")
 
     assert len(mailoutbox) == 1
     email = mailoutbox[0]
@@ -662,7 +713,7 @@ def test_handle_api_usage_notifications_missing_info_cache(
     assert organisation.has_subscription_information_cache() is False
 
     mock_api_usage = mocker.patch(
-        "organisations.task_helpers.get_current_api_usage",
+        "organisations.task_helpers.get_current_api_usages",
     )
 
     get_client_mock = mocker.patch("organisations.tasks.get_client")
@@ -726,9 +777,11 @@ def test_charge_for_api_call_count_overages_scale_up(
     client_mock.get_identity_flags.return_value.is_feature_enabled.return_value = True
 
     mock_api_usage = mocker.patch(
-        "organisations.tasks.get_current_api_usage",
+        "organisations.tasks.get_current_api_usages",
+    )
+    mock_api_usage.side_effect = lambda organisation_ids, _: dict.fromkeys(
+        organisation_ids, 212_005
     )
-    mock_api_usage.return_value = 212_005
     assert OrganisationAPIBilling.objects.count() == 0
 
     # When
@@ -793,9 +846,11 @@ def test_charge_for_api_call_count_overages_scale_up_when_flagsmith_client_sets_
     client_mock.get_identity_flags.return_value.is_feature_enabled.return_value = False
 
     mock_api_usage = mocker.patch(
-        "organisations.tasks.get_current_api_usage",
+        "organisations.tasks.get_current_api_usages",
+    )
+    mock_api_usage.side_effect = lambda organisation_ids, _: dict.fromkeys(
+        organisation_ids, 212_005
     )
-    mock_api_usage.return_value = 212_005
     assert OrganisationAPIBilling.objects.count() == 0
 
     # When
@@ -848,10 +903,12 @@ def test_charge_for_api_call_count_overages_grace_period(
         "organisations.chargebee.chargebee.chargebee.Subscription.update"
     )
     mock_api_usage = mocker.patch(
-        "organisations.tasks.get_current_api_usage",
+        "organisations.tasks.get_current_api_usages",
     )
     # Set the return value to something less than 200% of base rate
-    mock_api_usage.return_value = 115_000
+    mock_api_usage.side_effect = lambda organisation_ids, _: dict.fromkeys(
+        organisation_ids, 115_000
+    )
     assert OrganisationAPIBilling.objects.count() == 0
 
     # When
@@ -901,9 +958,11 @@ def test_charge_for_api_call_count_overages_with_not_covered_plan(
     )
 
     mock_api_usage = mocker.patch(
-        "organisations.tasks.get_current_api_usage",
+        "organisations.tasks.get_current_api_usages",
+    )
+    mock_api_usage.side_effect = lambda organisation_ids, _: dict.fromkeys(
+        organisation_ids, 12_005
     )
-    mock_api_usage.return_value = 12_005
     assert OrganisationAPIBilling.objects.count() == 0
 
     # When
@@ -950,9 +1009,11 @@ def test_charge_for_api_call_count_overages_under_api_limit(
     )
 
     mock_api_usage = mocker.patch(
-        "organisations.tasks.get_current_api_usage",
+        "organisations.tasks.get_current_api_usages",
+    )
+    mock_api_usage.side_effect = lambda organisation_ids, _: dict.fromkeys(
+        organisation_ids, 2_000
     )
-    mock_api_usage.return_value = 2_000
     assert OrganisationAPIBilling.objects.count() == 0
 
     # When
@@ -998,9 +1059,11 @@ def test_charge_for_api_call_count_overages_start_up(
     )
 
     mock_api_usage = mocker.patch(
-        "organisations.tasks.get_current_api_usage",
+        "organisations.tasks.get_current_api_usages",
+    )
+    mock_api_usage.side_effect = lambda organisation_ids, _: dict.fromkeys(
+        organisation_ids, 202_005
     )
-    mock_api_usage.return_value = 202_005
     assert OrganisationAPIBilling.objects.count() == 0
 
     # When
@@ -1079,9 +1142,11 @@ def test_charge_for_api_call_count_overages_start_up_with_api_billing(
     )
 
     mock_api_usage = mocker.patch(
-        "organisations.tasks.get_current_api_usage",
+        "organisations.tasks.get_current_api_usages",
+    )
+    mock_api_usage.side_effect = lambda organisation_ids, _: dict.fromkeys(
+        organisation_ids, 202_005
     )
-    mock_api_usage.return_value = 202_005
     assert OrganisationAPIBilling.objects.count() == 1
 
     # When
@@ -1136,10 +1201,12 @@ def test_charge_for_api_call_count_overages_with_yearly_account(
     )
 
     mock_api_usage = mocker.patch(
-        "organisations.tasks.get_current_api_usage",
+        "organisations.tasks.get_current_api_usages",
     )
 
-    mock_api_usage.return_value = 12_005
+    mock_api_usage.side_effect = lambda organisation_ids, _: dict.fromkeys(
+        organisation_ids, 12_005
+    )
     assert OrganisationAPIBilling.objects.count() == 0
 
     # When
@@ -1181,10 +1248,12 @@ def test_charge_for_api_call_count_overages_with_bad_plan(
     )
 
     mock_api_usage = mocker.patch(
-        "organisations.tasks.get_current_api_usage",
+        "organisations.tasks.get_current_api_usages",
     )
 
-    mock_api_usage.return_value = 12_005
+    mock_api_usage.side_effect = lambda organisation_ids, _: dict.fromkeys(
+        organisation_ids, 12_005
+    )
     assert OrganisationAPIBilling.objects.count() == 0
 
     # When
@@ -1236,9 +1305,11 @@ def test_restrict_use_due_to_api_limit_grace_period_over(
         org.subscription.save()
 
     mock_api_usage = mocker.patch(
-        "organisations.tasks.get_current_api_usage",
+        "organisations.tasks.get_current_api_usages",
+    )
+    mock_api_usage.side_effect = lambda organisation_ids, _: dict.fromkeys(
+        organisation_ids, 12_005
     )
-    mock_api_usage.return_value = 12_005
 
     # Add users to test email delivery
     for org in [organisation2, organisation3, organisation4, organisation5]:
@@ -1450,9 +1521,11 @@ def test_restrict_use_due_to_api_limit_grace_period_over_with_reduced_api_usage(
     organisation.subscription.save()
 
     mock_api_usage = mocker.patch(
-        "organisations.tasks.get_current_api_usage",
+        "organisations.tasks.get_current_api_usages",
+    )
+    mock_api_usage.side_effect = lambda organisation_ids, _: dict.fromkeys(
+        organisation_ids, 8000
     )
-    mock_api_usage.return_value = 8000
 
     OrganisationAPIUsageNotification.objects.create(
         notified_at=now,
@@ -27,6 +27,24 @@ def test_get_segment_returns_parent_segment_for_nested_rule(
     assert new_segment == segment
 
 
+def test_deep_clone_of_segment_updates_cloned_segment_updated_at(
+    segment: Segment,
+) -> None:
+    # Given
+    parent_rule = SegmentRule.objects.create(segment=segment, type=SegmentRule.ALL_RULE)
+    child_rule = SegmentRule.objects.create(rule=parent_rule, type=SegmentRule.ANY_RULE)
+    Condition.objects.create(
+        operator=EQUAL, property="foo", value="bar", rule=child_rule
+    )
+
+    # When
+    cloned_segment = segment.deep_clone()
+
+    # Then
+    cloned_condition = Condition.objects.get(rule__rule__segment=cloned_segment)
+    assert cloned_segment.updated_at >= cloned_condition.updated_at
+
+
 def test_condition_get_create_log_message_for_condition_created_with_segment(
     segment, segment_rule, mocker
 ):
@@ -501,6 +501,8 @@ def test_update_segment_add_new_condition(
     existing_condition = Condition.objects.create(
         rule=nested_rule, property="foo", operator=EQUAL, value="bar"
     )
+    segment.refresh_from_db()
+    updated_at = segment.updated_at
 
     new_condition_property = "foo2"
     new_condition_value = "bar"
@@ -553,6 +555,13 @@ def test_update_segment_add_new_condition(
     )
     assert nested_rule.conditions.order_by("-id").first().value == new_condition_value
 
+    # the segment's updated_at is bumped after its rules have changed
+    segment.refresh_from_db()
+    assert segment.updated_at > updated_at
+    assert (
+        segment.updated_at >= nested_rule.conditions.order_by("-id").first().updated_at
+    )
+
 
 def test_update_segment_versioned_segment(
     project: Project,
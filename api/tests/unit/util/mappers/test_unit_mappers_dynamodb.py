@@ -127,6 +127,7 @@ def test_map_identity_to_identity_document__call_expected(
         "django_id": Decimal(identity.pk),
         "environment_api_key": expected_environment_api_key,
         "identifier": "test_identity",
+        "identifier_lowercase": "test_identity",
         "identity_features": [],
         "identity_traits": [{"trait_key": "key1", "trait_value": "value1"}],
         "identity_uuid": mocker.ANY,
@@ -24,11 +24,14 @@ from flag_engine.identities.models import (
 )
 from flag_engine.organisations.models import OrganisationModel
 from flag_engine.projects.models import ProjectModel
+from flag_engine.segments.constants import IN
+from flag_engine.segments.evaluator import evaluate_identity_in_segment
 from flag_engine.segments.models import (
     SegmentConditionModel,
     SegmentModel,
     SegmentRuleModel,
 )
+from pytest_django.fixtures import SettingsWrapper
 from pytest_mock import MockerFixture
 
 from environments.models import Environment
@@ -40,7 +43,7 @@ from integrations.dynatrace.models import DynatraceConfiguration
 from integrations.mixpanel.models import MixpanelConfiguration
 from integrations.segment.models import SegmentConfiguration
 from integrations.webhook.models import WebhookConfiguration
-from segments.models import Segment, SegmentRule
+from segments.models import Condition, Segment, SegmentRule
 from users.models import FFAdminUser
 from util.mappers import engine
 
@@ -130,6 +133,179 @@ def test_map_segment_rule_to_engine__return_expected(
     )
 
 
+@pytest.mark.parametrize(
+    "trait_value, expected_result",
+    (("user-2", True), (2, True), ("user", False), ("user-1,user-2", False)),
+)
+def test_map_segment_condition_to_engine__in_condition__evaluates_as_expected(
+    trait_value: str | int,
+    expected_result: bool,
+) -> None:
+    # Given
+    condition = Condition(operator=IN, property="key", value="user-1,user-2,user-3,2")
+    identity_model = IdentityModel(
+        identifier="test",
+        environment_api_key="api-key",
+        identity_traits=[TraitModel(trait_key="key", trait_value=trait_value)],
+    )
+
+    # When
+    result = engine.map_segment_condition_to_engine(condition)
+
+    # Then
+    assert result.model_dump()["value"] == "user-1,user-2,user-3,2"
+    assert result.value.split(",") == {"user-1", "user-2", "user-3", "2"}
+    assert (
+        evaluate_identity_in_segment(
+            identity_model,
+            SegmentModel(
+                id=1,
+                name="segment",
+                rules=[SegmentRuleModel(type="ALL", conditions=[result])],
+            ),
+        )
+        is expected_result
+    )
+
+
+@pytest.mark.parametrize(
+    "condition_value",
+    ("user-1,user-2,2", "user-1, user-2", "user-1,,user-2,", ",", "user-1"),
+)
+@pytest.mark.parametrize(
+    "trait_value",
+    ("user-1", "user-2", " user-2", "user", "", 2, 2.0, True, "user-1,user-2"),
+)
+def test_map_segment_condition_to_engine__in_condition__matches_plain_string_value(
+    condition_value: str,
+    trait_value: str | int | float | bool,
+) -> None:
+    # Given
+    # The mapped value relies on the engine evaluating IN conditions with
+    # `value.split(",")`, so check that it evaluates exactly as the plain
+    # (unmapped) string value does in the installed engine.
+    condition = Condition(operator=IN, property="key", value=condition_value)
+    identity_model = IdentityModel(
+        identifier="test",
+        environment_api_key="api-key",
+        identity_traits=[TraitModel(trait_key="key", trait_value=trait_value)],
+    )
+
+    def _evaluate(condition_model: SegmentConditionModel) -> bool:
+        return evaluate_identity_in_segment(
+            identity_model,
+            SegmentModel(
+                id=1,
+                name="segment",
+                rules=[SegmentRuleModel(type="ALL", conditions=[condition_model])],
+            ),
+        )
+
+    # When
+    result = _evaluate(engine.map_segment_condition_to_engine(condition))
+
+    # Then
+    assert result is _evaluate(
+        SegmentConditionModel(operator=IN, property_="key", value=condition_value)
+    )
+
+
+def _get_segment_with_prefetched_rules(segment: Segment) -> Segment:
+    return Segment.objects.prefetch_related(
+        "rules", "rules__conditions", "rules__rules", "rules__rules__conditions"
+    ).get(id=segment.id)
+
+
+def test_map_segment_to_engine__prefetched_rules__reuses_segment_rule_models(
+    identity_matching_segment: Segment,
+) -> None:
+    # Given
+    engine.segment_rules_cache.clear()
+    first_result = engine.map_segment_to_engine(
+        _get_segment_with_prefetched_rules(identity_matching_segment)
+    )
+
+    # When
+    second_result = engine.map_segment_to_engine(
+        _get_segment_with_prefetched_rules(identity_matching_segment)
+    )
+
+    # Then
+    assert second_result == first_result
+    assert second_result.rules[0] is first_result.rules[0]
+
+
+def test_map_segment_to_engine__condition_added__returns_updated_rules(
+    identity_matching_segment: Segment,
+) -> None:
+    # Given
+    engine.segment_rules_cache.clear()
+    engine.map_segment_to_engine(
+        _get_segment_with_prefetched_rules(identity_matching_segment)
+    )
+    Condition.objects.create(
+        rule=identity_matching_segment.rules.get(),
+        property="foo",
+        operator="EQUAL",
+        value="bar",
+    )
+    # Segment level writes (e.g. through the API) save the segment after its rules.
+    identity_matching_segment.save()
+
+    # When
+    result = engine.map_segment_to_engine(
+        _get_segment_with_prefetched_rules(identity_matching_segment)
+    )
+
+    # Then
+    assert {condition.property_ for condition in result.rules[0].conditions} == {
+        "key1",
+        "foo",
+    }
+
+
+def test_map_segment_to_engine__rules_not_prefetched__does_not_cache(
+    identity_matching_segment: Segment,
+) -> None:
+    # Given
+    engine.segment_rules_cache.clear()
+
+    # When
+    engine.map_segment_to_engine(identity_matching_segment)
+
+    # Then
+    assert engine.segment_rules_cache.size == 0
+
+
+def test_segment_rules_cache__exceeds_max_bytes__evicts_least_recently_used(
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    segment_rule_models = (
+        SegmentRuleModel(
+            type="ALL",
+            conditions=[
+                SegmentConditionModel(operator="EQUAL", property_="key", value="x")
+            ],
+        ),
+    )
+    cache = engine.SegmentRulesCache()
+    cache.set((1, None), segment_rule_models)
+    settings.SEGMENT_RULES_CACHE_MAX_BYTES = cache.size * 2
+
+    cache.set((2, None), segment_rule_models)
+    cache.get((1, None))
+
+    # When
+    cache.set((3, None), segment_rule_models)
+
+    # Then
+    assert cache.get((1, None)) is segment_rule_models
+    assert cache.get((2, None)) is None
+    assert cache.get((3, None)) is segment_rule_models
+    assert cache.size == settings.SEGMENT_RULES_CACHE_MAX_BYTES
+
+
 def test_map_integration_to_engine__return_expected() -> None:
     # Given
     class TestIntegration(IntegrationsModel):
@@ -3,13 +3,17 @@ from typing import TYPE_CHECKING
 import pytest
 
 from environments.identities.models import Identity
-from util.mappers.sdk import map_environment_to_sdk_document
+from util.mappers.sdk import (
+    map_environment_to_sdk_document,
+    map_sdk_document_to_compact_sdk_document,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
     from pytest_mock import MockerFixture
 
     from environments.models import Environment
     from features.models import FeatureState
+    from segments.models import Segment
 
 
 @pytest.fixture()
@@ -106,3 +110,58 @@ def test_map_environment_to_sdk_document__return_expected(
         "updated_at": environment.updated_at,
         "use_identity_composite_key_for_hashing": True,
     }
+
+
+def test_map_sdk_document_to_compact_sdk_document__return_expected(
+    environment: "Environment",
+    feature_state: "FeatureState",
+    identity: Identity,
+    identity_featurestate: "FeatureState",
+    segment: "Segment",
+    segment_featurestate: "FeatureState",
+) -> None:
+    # Given
+    sdk_document = map_environment_to_sdk_document(environment)
+
+    # When
+    result = map_sdk_document_to_compact_sdk_document(sdk_document)
+
+    # Then
+    feature = feature_state.feature
+    assert result["document_format"] == "compact"
+    assert result["document_version"] == 1
+    assert result["api_key"] == environment.api_key
+    assert "segments" not in result["project"]
+
+    # the feature is only included once, and referenced by index
+    assert result["features"] == [
+        {"id": feature.id, "name": feature.name, "type": feature.type}
+    ]
+    assert result["feature_states"] == [
+        {"feature": 0, "enabled": False, "value": None, "id": feature_state.id}
+    ]
+    assert result["identity_overrides"] == [
+        {
+            "identifier": identity.identifier,
+            "feature_states": [
+                {
+                    "feature": 0,
+                    "enabled": False,
+                    "value": None,
+                    "id": identity_featurestate.id,
+                }
+            ],
+        }
+    ]
+
+    (compact_segment,) = result["segments"]
+    assert compact_segment["id"] == segment.id
+    assert compact_segment["feature_states"] == [
+        {
+            "feature": 0,
+            "enabled": segment_featurestate.enabled,
+            "value": None,
+            "id": segment_featurestate.id,
+            "priority": segment_featurestate.feature_segment.priority,
+        }
+    ]
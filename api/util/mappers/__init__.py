@@ -9,17 +9,22 @@ from util.mappers.dynamodb import (
     map_identity_to_identity_document,
 )
 from util.mappers.engine import (
+    map_environment_to_engine,
     map_feature_state_to_engine,
     map_feature_to_engine,
     map_identity_to_engine,
     map_mv_option_to_engine,
 )
-from util.mappers.sdk import map_environment_to_sdk_document
+from util.mappers.sdk import (
+    map_environment_to_sdk_document,
+    map_sdk_document_to_compact_sdk_document,
+)
 
 __all__ = (
     "map_engine_feature_state_to_identity_override",
     "map_engine_identity_to_identity_document",
     "map_environment_api_key_to_environment_api_key_document",
+    "map_environment_to_engine",
     "map_environment_to_environment_document",
     "map_environment_to_environment_v2_document",
     "map_environment_to_sdk_document",
@@ -30,4 +35,5 @@ __all__ = (
     "map_identity_to_engine",
     "map_identity_to_identity_document",
     "map_mv_option_to_engine",
+    "map_sdk_document_to_compact_sdk_document",
 )
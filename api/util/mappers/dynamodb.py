@@ -83,6 +83,8 @@ def map_engine_identity_to_identity_document(
         for field_name, value in engine_identity
     }
     response["composite_key"] = engine_identity.composite_key
+    # Used to search for identities case insensitively.
+    response["identifier_lowercase"] = engine_identity.identifier.lower()
     return response
 
 
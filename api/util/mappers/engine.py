@@ -1,8 +1,12 @@
+import sys
+import threading
+from collections import OrderedDict
 from collections.abc import Iterable
 from itertools import chain
 from typing import TYPE_CHECKING, Dict, List, Optional
 from uuid import UUID
 
+from django.conf import settings
 from flag_engine.environments.integrations.models import IntegrationModel
 from flag_engine.environments.models import (
     EnvironmentAPIKeyModel,
@@ -19,6 +23,7 @@ from flag_engine.features.models import (
 from flag_engine.identities.models import IdentityModel, TraitModel
 from flag_engine.organisations.models import OrganisationModel
 from flag_engine.projects.models import ProjectModel
+from flag_engine.segments import constants as segment_constants
 from flag_engine.segments.models import (
     SegmentConditionModel,
     SegmentModel,
@@ -40,7 +45,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from integrations.webhook.models import WebhookConfiguration
     from organisations.models import Organisation
     from projects.models import Project
-    from segments.models import Segment, SegmentRule
+    from segments.models import Condition, Segment, SegmentRule
 
 
 __all__ = (
@@ -61,6 +66,48 @@ def map_traits_to_engine(traits: Iterable["Trait"]) -> list[TraitModel]:
     ]
 
 
+class _InConditionValue(str):
+    """
+    The value of an IN segment condition, i.e. a comma separated list of values.
+
+    The engine evaluates IN conditions by splitting the condition value for every
+    trait it is evaluated against, and scanning the resulting list. For conditions
+    with thousands of values (e.g. lists of identifiers), this is slow, so splitting
+    on "," returns a set of the values instead, which is only computed once for
+    each (cached) engine model.
+
+    Since this is still a string, the condition value is serialised exactly as
+    before, e.g. in the environment document.
+
+    Note that this relies on the engine evaluating IN conditions with
+    `value.split(",")`, which is why the engine version is pinned.
+    """
+
+    def split(self, sep=None, maxsplit=-1):
+        if sep != "," or maxsplit != -1:
+            return super().split(sep, maxsplit)
+        try:
+            return self._values
+        except AttributeError:
+            self._values = frozenset(super().split(sep))
+            return self._values
+
+
+def map_segment_condition_to_engine(
+    condition: "Condition",
+) -> SegmentConditionModel:
+    segment_condition_model = SegmentConditionModel(
+        operator=condition.operator,
+        value=condition.value,
+        property_=condition.property,
+    )
+    if condition.operator == segment_constants.IN and condition.value:
+        # Assign the value after validation, since validation would coerce it to
+        # a plain string.
+        segment_condition_model.value = _InConditionValue(condition.value)
+    return segment_condition_model
+
+
 def map_segment_to_engine(
     segment: "Segment",
 ) -> SegmentModel:
@@ -71,9 +118,7 @@ def map_segment_to_engine(
     return SegmentModel(
         id=segment.pk,
         name=segment.name,
-        rules=[
-            map_segment_rule_to_engine(segment_rule) for segment_rule in segment_rules
-        ],
+        rules=map_segment_rules_to_engine(segment, segment_rules),
     )
 
 
@@ -90,16 +135,107 @@ def map_segment_rule_to_engine(
             for segment_sub_rule in segment_sub_rules
         ],
         conditions=[
-            SegmentConditionModel(
-                operator=condition.operator,
-                value=condition.value,
-                property_=condition.property,
-            )
-            for condition in conditions
+            map_segment_condition_to_engine(condition) for condition in conditions
         ],
     )
 
 
+def map_segment_rules_to_engine(
+    segment: "Segment",
+    segment_rules: Iterable["SegmentRule"],
+) -> list[SegmentRuleModel]:
+    """
+    Map the given (top level) rules of the segment, reusing the engine models
+    compiled for the same version of the segment if possible.
+
+    The cache is only used when the segment's rules have been prefetched, since
+    otherwise they could have changed since the segment was read.
+    """
+    if not (
+        settings.SEGMENT_RULES_CACHE_MAX_BYTES
+        and "rules" in getattr(segment, "_prefetched_objects_cache", {})
+    ):
+        return [
+            map_segment_rule_to_engine(segment_rule) for segment_rule in segment_rules
+        ]
+
+    # Every segment level write (API updates, cloning, imports) bumps the
+    # segment's updated_at after changing its rules or conditions.
+    key = (segment.pk, segment.updated_at)
+    if (segment_rule_models := segment_rules_cache.get(key)) is None:
+        segment_rule_models = tuple(
+            map_segment_rule_to_engine(segment_rule) for segment_rule in segment_rules
+        )
+        segment_rules_cache.set(key, segment_rule_models)
+    return list(segment_rule_models)
+
+
+class SegmentRulesCache:
+    """
+    A process-local LRU cache of the engine models for the rules of each
+    version of a segment, so that they are only built once rather than every
+    time that the segment is evaluated or added to an environment document.
+    The cached models are shared, so must not be modified.
+
+    The size of each entry is estimated from the conditions it contains, and
+    the least recently used entries are evicted once the total exceeds
+    SEGMENT_RULES_CACHE_MAX_BYTES.
+    """
+
+    # Rough size of an (empty) rule or condition model, including its fields.
+    _MODEL_SIZE = 500
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[tuple, tuple[tuple[SegmentRuleModel, ...], int]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.size = 0
+
+    def get(self, key: tuple) -> tuple[SegmentRuleModel, ...] | None:
+        with self._lock:
+            segment_rule_models, _ = self._entries.get(key, (None, 0))
+            if segment_rule_models is not None:
+                self._entries.move_to_end(key)
+            return segment_rule_models
+
+    def set(
+        self, key: tuple, segment_rule_models: tuple[SegmentRuleModel, ...]
+    ) -> None:
+        size = sum(map(self._get_size, segment_rule_models))
+        max_size = settings.SEGMENT_RULES_CACHE_MAX_BYTES
+        if size > max_size:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self.size -= self._entries.pop(key)[1]
+            self._entries[key] = (segment_rule_models, size)
+            self.size += size
+            while self.size > max_size:
+                self.size -= self._entries.popitem(last=False)[1][1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    @classmethod
+    def _get_size(cls, segment_rule_model: SegmentRuleModel) -> int:
+        size = cls._MODEL_SIZE + sum(map(cls._get_size, segment_rule_model.rules))
+        for condition in segment_rule_model.conditions:
+            size += cls._MODEL_SIZE + sys.getsizeof(condition.property_)
+            if condition.value is not None:
+                # The values of IN conditions are also (lazily) split into a set.
+                size += sys.getsizeof(condition.value) * (
+                    2 if isinstance(condition.value, _InConditionValue) else 1
+                )
+        return size
+
+
+segment_rules_cache = SegmentRulesCache()
+
+
 def map_integration_to_engine(
     integration: Optional["EnvironmentIntegrationModel"],
 ) -> Optional[IntegrationModel]:
@@ -254,10 +390,9 @@ def map_environment_to_engine(
         SegmentModel(
             id=segment.pk,
             name=segment.name,
-            rules=[
-                map_segment_rule_to_engine(segment_rule)
-                for segment_rule in project_segment_rules_by_segment_id.pop(segment.pk)
-            ],
+            rules=map_segment_rules_to_engine(
+                segment, project_segment_rules_by_segment_id.pop(segment.pk)
+            ),
             feature_states=[
                 map_feature_state_to_engine(
                     feature_state,
@@ -1,3 +1,4 @@
+import typing
 from typing import TYPE_CHECKING, TypeAlias
 
 from environments.constants import IDENTITY_INTEGRATIONS_RELATION_NAMES
@@ -18,6 +19,9 @@ SDK_DOCUMENT_EXCLUDE = [
     "dynatrace_config",
 ]
 
+COMPACT_SDK_DOCUMENT_FORMAT = "compact"
+COMPACT_SDK_DOCUMENT_VERSION = 1
+
 
 def map_environment_to_sdk_document(environment: "Environment") -> SDKDocument:
     """
@@ -49,3 +53,138 @@ def map_environment_to_sdk_document(environment: "Environment") -> SDKDocument:
     return engine_environment.model_dump(
         exclude=SDK_DOCUMENT_EXCLUDE,
     )
+
+
+def map_sdk_document_to_compact_sdk_document(document: SDKDocument) -> SDKDocument:
+    """
+    Map an SDK document (as returned by `map_environment_to_sdk_document`) to
+    its compact representation.
+
+    Rather than repeating them in every feature state, the features and
+    multivariate feature options are interned in top level tables, and feature
+    states refer to them by their index in those tables. Fields which are not
+    used for local evaluation (e.g. uuids, when a django id is available) are
+    omitted.
+    """
+    return _CompactSDKDocumentBuilder().build(document)
+
+
+class _CompactSDKDocumentBuilder:
+    def __init__(self) -> None:
+        self.features: dict[int, int] = {}
+        self.features_table: list[SDKDocument] = []
+        self.multivariate_options: dict[typing.Any, int] = {}
+        self.multivariate_options_table: list[SDKDocument] = []
+
+    def build(self, document: SDKDocument) -> SDKDocument:
+        project = {
+            key: value
+            for key, value in document["project"].items()
+            if key != "segments"
+        }
+        compact_document = {
+            key: value
+            for key, value in document.items()
+            if key not in ("project", "feature_states", "identity_overrides")
+        }
+
+        feature_states = [
+            self._map_feature_state(feature_state)
+            for feature_state in document["feature_states"]
+        ]
+        segments = [
+            {
+                "id": segment["id"],
+                "name": segment["name"],
+                "rules": [self._map_rule(rule) for rule in segment["rules"]],
+                "feature_states": [
+                    self._map_feature_state(feature_state)
+                    for feature_state in segment["feature_states"]
+                ],
+            }
+            for segment in document["project"]["segments"]
+        ]
+        identity_overrides = [
+            {
+                "identifier": identity["identifier"],
+                "feature_states": [
+                    self._map_feature_state(feature_state)
+                    for feature_state in identity["identity_features"]
+                ],
+            }
+            for identity in document["identity_overrides"]
+        ]
+
+        compact_document.update(
+            {
+                "document_format": COMPACT_SDK_DOCUMENT_FORMAT,
+                "document_version": COMPACT_SDK_DOCUMENT_VERSION,
+                "project": project,
+                "features": self.features_table,
+                "multivariate_feature_options": self.multivariate_options_table,
+                "feature_states": feature_states,
+                "segments": segments,
+                "identity_overrides": identity_overrides,
+            }
+        )
+        return compact_document
+
+    def _map_feature_state(self, feature_state: SDKDocument) -> SDKDocument:
+        compact_feature_state = {
+            "feature": self._get_feature_index(feature_state["feature"]),
+            "enabled": feature_state["enabled"],
+            "value": feature_state["feature_state_value"],
+        }
+        # The id (or uuid) is used when hashing identities for multivariate
+        # evaluation, so one of them must be kept.
+        if feature_state["django_id"] is not None:
+            compact_feature_state["id"] = feature_state["django_id"]
+        else:
+            compact_feature_state["uuid"] = feature_state["featurestate_uuid"]
+
+        if (feature_segment := feature_state["feature_segment"]) is not None:
+            compact_feature_state["priority"] = feature_segment["priority"]
+
+        if mv_values := feature_state["multivariate_feature_state_values"]:
+            # Each value is [option index, percentage allocation, id (or uuid)],
+            # the latter being required to order the values when evaluating.
+            compact_feature_state["multivariate"] = [
+                [
+                    self._get_multivariate_option_index(
+                        mv_value["multivariate_feature_option"]
+                    ),
+                    mv_value["percentage_allocation"],
+                    mv_value["id"] or mv_value["mv_fs_value_uuid"],
+                ]
+                for mv_value in mv_values
+            ]
+
+        return compact_feature_state
+
+    def _map_rule(self, rule: SDKDocument) -> SDKDocument:
+        compact_rule = {"type": rule["type"]}
+        if rule["conditions"]:
+            compact_rule["conditions"] = [
+                {key: value for key, value in condition.items() if value is not None}
+                for condition in rule["conditions"]
+            ]
+        if rule["rules"]:
+            compact_rule["rules"] = [
+                self._map_rule(sub_rule) for sub_rule in rule["rules"]
+            ]
+        return compact_rule
+
+    def _get_feature_index(self, feature: SDKDocument) -> int:
+        if (index := self.features.get(feature["id"])) is None:
+            index = self.features[feature["id"]] = len(self.features_table)
+            self.features_table.append(feature)
+        return index
+
+    def _get_multivariate_option_index(self, option: SDKDocument) -> int:
+        key = option["id"] if option["id"] is not None else ("value", option["value"])
+        if (index := self.multivariate_options.get(key)) is None:
+            index = self.multivariate_options[key] = len(
+                self.multivariate_options_table
+            )
+            self.multivariate_options_table.append(option)
+        return index
@@ -1,9 +1,12 @@
 from rest_framework.generics import GenericAPIView
+from rest_framework.renderers import BrowsableAPIRenderer
 
 from environments.authentication import EnvironmentKeyAuthentication
 from environments.permissions.permissions import EnvironmentKeyPermissions
+from util.renderers import SDKJSONRenderer
 
 
 class SDKAPIView(GenericAPIView):
     permission_classes = (EnvironmentKeyPermissions,)
     authentication_classes = (EnvironmentKeyAuthentication,)
+    renderer_classes = (SDKJSONRenderer, BrowsableAPIRenderer)